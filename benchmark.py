@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""Marketing Orchestrator — Benchmark
+
+Times report-generator.py and dashboard.py over a synthetic audit directory:
+N agent reports, a large crawl-data.md, a CMO review table and a synthesis
+report. Content comes from a seeded generator, so the same arguments produce
+the same files on every run and results can be compared between commits.
+
+Each stage is run --repeat times and reported as best/median wall time,
+throughput over its markdown input, and peak Python heap (tracemalloc, from
+one extra run so tracing does not skew the timings). Runs offline, stdlib
+only.
+
+Usage: python3 benchmark.py
+       python3 benchmark.py --agents 40 --agent-lines 2000 --crawl-pages 300
+       python3 benchmark.py --json after.json --baseline before.json
+       python3 benchmark.py --keep /tmp/bench   # leave the audit dir behind
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+# Agent names as the orchestrator writes them; extra agents get a suffix
+AGENT_NAMES = [
+    "seo-audit", "page-cro", "copywriting", "marketing-psychology",
+    "analytics-tracking", "schema-markup", "email-sequence", "pricing-strategy",
+    "signup-flow-cro", "onboarding-cro", "form-cro", "popup-cro",
+    "paid-ads", "social-content", "referral-program", "programmatic-seo",
+    "product-feed", "geo-audit", "competitor-alternatives", "launch-strategy",
+]
+
+WORDS = (
+    "conversion funnel checkout trust badge hero headline pricing tier "
+    "retention cohort email sequence landing page schema markup canonical "
+    "sitemap crawl budget organic traffic paid search attribution pixel "
+    "consent banner testimonial social proof urgency scarcity offer value "
+    "proposition onboarding activation churn referral loop benchmark"
+).split()
+
+CMO_DIMENSIONS = ["Depth", "Evidence", "Action", "Brand", "Consist", "Honesty", "Insight"]
+
+
+def load_module(name, filename):
+    """Import a script from this directory (the generator's name has a hyphen).
+
+    The module is registered in sys.modules so its functions can be pickled
+    for the generator's worker processes.
+    """
+    spec = importlib.util.spec_from_file_location(name, HERE / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ---------------------------------------------------------------------------
+# Synthetic audit directory
+# ---------------------------------------------------------------------------
+
+class AuditFactory:
+    """Writes a deterministic marketing-audit-<domain> directory."""
+
+    def __init__(self, seed):
+        self.r = random.Random(seed)
+
+    def words(self, n):
+        return " ".join(self.r.choices(WORDS, k=n))
+
+    def sentence(self):
+        """A line of prose with the inline markup agents actually produce."""
+        parts = [self.words(self.r.randint(6, 14))]
+        k = self.r.random()
+        if k < 0.3:
+            parts.append(f"**{self.words(2)}**")
+        elif k < 0.45:
+            parts.append(f"*{self.words(2)}*")
+        elif k < 0.6:
+            parts.append(f"`{self.r.choice(WORDS)}`")
+        elif k < 0.7:
+            parts.append(f"[{self.words(2)}](https://example.com/{self.r.choice(WORDS)})")
+        parts.append(self.r.choice(["[OBSERVED]", "[INFERRED]", "[COLLECTED]", "[SEARCHED]"]))
+        parts.append(self.words(self.r.randint(4, 10)) + ".")
+        return " ".join(parts)
+
+    def table(self, columns, rows):
+        lines = ["| " + " | ".join(columns) + " |", "|" + "|".join("---" for _ in columns) + "|"]
+        for _ in range(rows):
+            lines.append("| " + " | ".join(self.words(self.r.randint(1, 4)) for _ in columns) + " |")
+        return lines
+
+    def body(self, target_lines):
+        """Markdown blocks (prose, lists, tables, code) until target_lines."""
+        lines = []
+        while len(lines) < target_lines:
+            k = self.r.random()
+            if k < 0.08:
+                lines += [f"### {self.words(4).title()}", ""]
+            elif k < 0.4:
+                lines += [self.sentence() for _ in range(self.r.randint(1, 4))] + [""]
+            elif k < 0.6:
+                bullet = self.r.choice(["-", "*", "1."])
+                lines += [f"{bullet} {self.sentence()}" for _ in range(self.r.randint(2, 6))] + [""]
+            elif k < 0.8:
+                lines += self.table(["#", "Finding", "Impact", "Effort", "Confidence"], self.r.randint(3, 10)) + [""]
+            elif k < 0.9:
+                lines += ["```html", '<meta name="description" content="a < b & c">']
+                lines += [f'<div class="{self.r.choice(WORDS)}">{self.words(5)}</div>' for _ in range(self.r.randint(2, 8))]
+                lines += ["```", ""]
+            else:
+                lines += ["---", ""]
+        return lines
+
+    def agent_report(self, title, lines):
+        score = self.r.randint(15, 90)
+        out = [
+            f"# {title} Audit",
+            "",
+            f"## Score: {score}/100",
+            "",
+            "## Data Limitations",
+            self.sentence(),
+            "",
+            "## Current State",
+        ]
+        out += self.body(lines // 3)
+        out += ["## Critical Issues (Top 3)"]
+        for i in range(1, 4):
+            out += [f"### Issue {i}: {self.words(4).title()}", f"**Evidence:** {self.sentence()}", ""]
+        out += ["## Top 5 Recommendations (Priority Order)"]
+        out += self.body(lines - len(out))
+        return "\n".join(out) + "\n"
+
+    def crawl_data(self, domain, pages, lines_per_page):
+        out = [f"# Crawl Data: {domain}", "Crawled: 2026-01-01T00:00:00Z", f"Pages: {pages}", "", "---", ""]
+        for i in range(pages):
+            out.append(f"## PAGE: https://{domain}/{self.r.choice(WORDS)}-{i}")
+            out += [self.words(self.r.randint(4, 20)) for _ in range(lines_per_page)]
+            out += ["", "---", ""]
+        return "\n".join(out) + "\n"
+
+    def cmo_review(self, names):
+        out = [
+            "# CMO Quality Review",
+            "",
+            "## Report Scores",
+            "| Report | " + " | ".join(CMO_DIMENSIONS) + " | Total | Verdict |",
+            "|" + "---|" * (len(CMO_DIMENSIONS) + 3),
+        ]
+        for name in names:
+            scores = [self.r.randint(2, 5) for _ in CMO_DIMENSIONS]
+            total = sum(scores)
+            verdict = "PASS" if total >= 25 else "FAIL"
+            out.append(f"| {name} | " + " | ".join(map(str, scores)) + f" | {total}/35 | {verdict} |")
+        out += ["", "## Revenue Reality Check"] + [self.sentence() for _ in range(5)]
+        out += ["", "## Cross-Report Insights"] + [f"- {self.sentence()}" for _ in range(8)]
+        return "\n".join(out) + "\n"
+
+    def synthesis(self, business, names, lines):
+        section = max(lines // 8, 4)
+        out = [
+            f"# Marketing Audit: {business}",
+            "",
+            "## Audit Methodology & Limitations",
+            *self.body(section),
+            "## Executive Summary",
+            "",
+            f"### Overall Maturity Score: {self.r.randint(20, 80)}/100",
+            *self.body(section),
+            "### Score Breakdown by Area",
+            *self.table(["#", "Area", "Score", "Grade", "Key Finding", "Confidence"], len(names)),
+            "",
+            "## Top 10 Quick Wins (Highest ROI, Lowest Effort)",
+            *self.table(["#", "Action", "Type", "Effort", "Impact (confidence)", "How"], 10),
+            "",
+            "## Critical Issues (Must-Fix)",
+            *self.body(section),
+            "## 90-Day Roadmap",
+            *self.body(section),
+            "## Competitive Position",
+            *self.body(section),
+            "## Scoring Methodology",
+            *self.body(section),
+        ]
+        return "\n".join(out) + "\n"
+
+    def write(self, root, agents, agent_lines, crawl_pages, crawl_page_lines):
+        domain = "bench.example.com"
+        d = Path(root) / f"marketing-audit-{domain}"
+        (d / "agents").mkdir(parents=True)
+        (d / "review").mkdir()
+        (d / "handoffs").mkdir()
+
+        names = [AGENT_NAMES[i % len(AGENT_NAMES)] + (f"-{i // len(AGENT_NAMES) + 1}" if i >= len(AGENT_NAMES) else "")
+                 for i in range(agents)]
+        (d / "context.md").write_text(
+            "# Context\n"
+            "- Business: Bench Outfitters\n"
+            f"- URL: https://{domain}\n"
+            "- Type: E-commerce\n"
+            "- Industry: Outdoor apparel\n"
+            "- Competitors: rival.example, other.example\n"
+        )
+        (d / "brand-dna.md").write_text("# Brand DNA\n\n" + "\n".join(self.sentence() for _ in range(20)) + "\n")
+        (d / "crawl-data.md").write_text(self.crawl_data(domain, crawl_pages, crawl_page_lines))
+        (d / "collectors-data.md").write_text("# Collectors\n" + "\n".join(self.words(8) for _ in range(400)) + "\n")
+        for name in names:
+            title = name.replace("-", " ").title()
+            (d / "agents" / f"{name}.md").write_text(self.agent_report(title, agent_lines))
+        (d / "handoffs" / "batch1-summary.md").write_text("\n".join(self.body(40)) + "\n")
+        (d / "review" / "cmo-review.md").write_text(self.cmo_review(names))
+        (d / "FULL-REPORT.md").write_text(self.synthesis("Bench Outfitters", names, agent_lines))
+        return d
+
+
+# ---------------------------------------------------------------------------
+# Stages
+# ---------------------------------------------------------------------------
+
+def file_bytes(*paths):
+    return sum(p.stat().st_size for p in paths if p.exists())
+
+
+def build_stages(audit_dir, generator, dashboard, workers):
+    """(name, callable, input bytes) for every stage, in report order."""
+    agent_files = sorted((audit_dir / "agents").glob("*.md"))
+    report_inputs = [
+        audit_dir / "context.md", audit_dir / "brand-dna.md", audit_dir / "FULL-REPORT.md",
+        audit_dir / "review" / "cmo-review.md", *agent_files,
+    ]
+    report_bytes = file_bytes(*report_inputs)
+    dashboard_bytes = file_bytes(
+        audit_dir / "context.md", audit_dir / "crawl-data.md", audit_dir / "collectors-data.md",
+        audit_dir / "review" / "cmo-review.md", *agent_files,
+    )
+
+    loaded = generator.ReportBuilder(str(audit_dir), workers=workers, cache=False)
+    loaded.load()
+    markdown = "\n\n".join(f.read_text() for f in agent_files)
+
+    # A rebuild after remediation: every chapter cached but one
+    cached = generator.ReportBuilder(str(audit_dir), workers=workers)
+    cached.load()
+    cached.build_html()
+    remediated = cached.agents[0]
+    original = remediated["digest"]
+    passes = itertools.count(1)
+
+    def rebuild_one():
+        # A fresh digest misses the cache exactly as an edited file would
+        remediated["digest"] = f"{original}-{next(passes)}"
+        cached.build_html()
+
+    warm_cache = dashboard.ParseCache()
+    status = dashboard.collect_status(str(audit_dir), warm_cache)
+    start_time = time.time() - 754
+
+    def load():
+        generator.ReportBuilder(str(audit_dir), cache=False).load()
+
+    return [
+        ("report: load", load, report_bytes),
+        ("report: build_html", loaded.build_html, report_bytes),
+        ("report: write_html (streamed)", lambda: loaded.write_html(str(audit_dir / "FULL-REPORT.html")), report_bytes),
+        ("report: export json, cached trees", lambda: sum(map(len, cached.iter_export("json"))), report_bytes),
+        ("report: rebuild, 1 agent changed", rebuild_one, report_bytes),
+        ("report: md_to_html (agents)", lambda: generator.md_to_html(markdown), len(markdown.encode())),
+        ("dashboard: collect_status cold", lambda: dashboard.collect_status(str(audit_dir), dashboard.ParseCache()), dashboard_bytes),
+        ("dashboard: collect_status warm", lambda: dashboard.collect_status(str(audit_dir), warm_cache), None),
+        ("dashboard: render", lambda: dashboard.render(status, start_time), None),
+    ]
+
+
+def measure(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"best": min(times), "median": statistics.median(times), "peak": peak}
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ["git", "-C", str(HERE), "describe", "--always", "--dirty"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.strip() or None
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def format_table(results, baseline):
+    header = f"{'stage':<32} {'best ms':>9} {'median ms':>10} {'MB/s':>8} {'ops/s':>9} {'peak KiB':>9}"
+    if baseline:
+        header += f" {'vs base':>8}"
+    lines = [header, "-" * len(header)]
+    for name, r in results.items():
+        mbps = f"{r['bytes'] / r['best'] / 1e6:.1f}" if r["bytes"] else "-"
+        line = (f"{name:<32} {r['best'] * 1000:>9.2f} {r['median'] * 1000:>10.2f} {mbps:>8} "
+                f"{1 / r['best']:>9.1f} {r['peak'] / 1024:>9.0f}")
+        if baseline:
+            before = baseline.get(name)
+            # > 1.00x means this run is faster than the baseline
+            line += f" {before['best'] / r['best']:>7.2f}x" if before else f" {'new':>8}"
+        lines.append(line)
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the report generator and dashboard on a synthetic audit.",
+    )
+    parser.add_argument("--agents", type=int, default=20, help="agent reports to generate (default: 20)")
+    parser.add_argument("--agent-lines", type=int, default=800, help="lines per agent report (default: 800)")
+    parser.add_argument("--crawl-pages", type=int, default=100, help="pages in crawl-data.md (default: 100)")
+    parser.add_argument("--crawl-page-lines", type=int, default=200, help="lines per crawled page (default: 200)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per stage (default: 5)")
+    parser.add_argument("--seed", type=int, default=1, help="content seed (default: 1)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="report generator chapter workers (default: its own choice)")
+    parser.add_argument("--keep", metavar="DIR", help="generate the audit directory under DIR and keep it")
+    parser.add_argument("--output", metavar="FILE", help="also write the results table to FILE")
+    parser.add_argument("--json", metavar="FILE", help="write machine-readable results to FILE")
+    parser.add_argument("--baseline", metavar="FILE", help="compare against a previous --json file")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    generator = load_module("report_generator", "report-generator.py")
+    dashboard = load_module("dashboard", "dashboard.py")
+
+    root = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix="marketing-bench-"))
+    root.mkdir(parents=True, exist_ok=True)
+    try:
+        target = root / "marketing-audit-bench.example.com"
+        if target.exists():
+            shutil.rmtree(target)
+        audit_dir = AuditFactory(args.seed).write(
+            root, args.agents, args.agent_lines, args.crawl_pages, args.crawl_page_lines,
+        )
+        total = sum(p.stat().st_size for p in audit_dir.rglob("*") if p.is_file())
+
+        results = {}
+        for name, fn, nbytes in build_stages(audit_dir, generator, dashboard, args.workers):
+            results[name] = {**measure(fn, args.repeat), "bytes": nbytes}
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+
+    revision = git_revision()
+    run_args = {k: v for k, v in vars(args).items() if k not in ("keep", "output", "json", "baseline")}
+    lines = [
+        f"Marketing Orchestrator benchmark — {revision or 'unknown revision'}",
+        f"Python {platform.python_version()} on {platform.system()} {platform.machine()}",
+        f"Audit: {args.agents} agents x {args.agent_lines} lines, crawl {args.crawl_pages} pages x "
+        f"{args.crawl_page_lines} lines, {total / 1e6:.1f} MB total, seed {args.seed}, best of {args.repeat}"
+        + (f", {args.workers} workers" if args.workers else ""),
+        "",
+        *format_table(results, baseline and baseline["stages"]),
+    ]
+    if baseline:
+        lines.append(f"\nBaseline: {baseline.get('revision') or args.baseline}")
+        content_args = {k: v for k, v in run_args.items() if k not in ("repeat", "workers")}
+        if {k: v for k, v in baseline.get("args", {}).items() if k not in ("repeat", "workers")} != content_args:
+            lines.append("Warning: baseline was generated with different arguments; ratios are not comparable")
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "revision": revision,
+                "python": platform.python_version(),
+                "args": run_args,
+                "stages": results,
+            }, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Marketing Orchestrator — CMO review parsing
+
+Reads the per-report verdict table that the quality gate writes to
+review/cmo-review.md (SKILL.md, Phase 6):
+
+| Report | Depth | Evidence | Action | Brand | Consist | Honesty | Insight | Total | Verdict |
+
+Shared by dashboard.py and report-generator.py so both tools agree on which
+report passed and match report names to agent files the same way.
+"""
+
+import re
+
+VERDICTS = ("PASS", "FAIL")
+
+# Report name, seven dimension scores, total and verdict; narrower tables
+# (e.g. "Weak Reports (FAIL)") are not verdict rows
+MIN_CELLS = 8
+
+NAME_WORD_RE = re.compile(r"[a-z0-9]+")
+NUMBER_RE = re.compile(r"\d+")
+
+
+def normalize_name(name):
+    """Key a report name the way agent files are named.
+
+    "SEO Audit", "seo-audit.md" and "**seo_audit**" all become "seo-audit".
+    """
+    name = name.lower().strip(" \t*_`")
+    if name.endswith(".md"):
+        name = name[:-3]
+    return "-".join(NAME_WORD_RE.findall(name))
+
+
+def parse_verdicts(text):
+    """Map normalized report name -> {"name", "verdict", "total"}.
+
+    The verdict is "PASS" or "FAIL" and total is the numerator of the Total
+    column (0 if unreadable). If a report appears in more than one row, the
+    first row wins.
+    """
+    results = {}
+    for line in text.split("\n"):
+        if "PASS" not in line and "FAIL" not in line:
+            continue
+        parts = [p.strip() for p in line.split("|") if p.strip()]
+        if len(parts) < MIN_CELLS:
+            continue
+        verdict = next((v for v in VERDICTS if v in parts[-1]), None)
+        key = normalize_name(parts[0])
+        if verdict is None or not key or key in results:
+            continue
+        total = NUMBER_RE.search(parts[-2])
+        results[key] = {
+            "name": parts[0],
+            "verdict": verdict,
+            "total": int(total.group()) if total else 0,
+        }
+    return results
@@ -0,0 +1,237 @@
+#!/usr/bin/env bash
+# Marketing Orchestrator — Batch Collector Phase
+# Runs collectors.sh for a portfolio of domains with a bounded pool of
+# workers, so onboarding hundreds of client sites is one command instead
+# of a shell loop.
+#
+# Usage: bash collectors-batch.sh [options] <domains_file|->
+# Output: ${ROOT}/marketing-audit-${DOMAIN}/collectors-data.md per domain
+#         (identical to a single collectors.sh run), plus a run directory
+#         ${ROOT}/collectors-batch-<timestamp>/ with one log per domain
+#         and summary.tsv
+#
+# The domains file has one domain or URL per line; blank lines and lines
+# starting with # are skipped, duplicates are run once.
+#
+# Options (or environment variables):
+#   --jobs N         domains collected at the same time (COLLECTORS_JOBS, default 8)
+#   --per-host N     concurrent page downloads against one site
+#                    (COLLECTORS_PAGE_CONCURRENCY, default 2)
+#   --host-delay S   seconds between starting two domains that share a
+#                    registrable domain, e.g. shop.x.com and blog.x.com
+#                    (COLLECTORS_HOST_DELAY, default 2); such domains never
+#                    run at the same time
+#   --root DIR       where audit directories are created (default /tmp)
+#   --max-pages N    passed through to collectors.sh
+#   --no-cache       passed through to collectors.sh
+
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+JOBS="${COLLECTORS_JOBS:-8}"
+PER_HOST="${COLLECTORS_PAGE_CONCURRENCY:-2}"
+HOST_DELAY="${COLLECTORS_HOST_DELAY:-2}"
+ROOT="/tmp"
+PASS_ARGS=()
+
+POSITIONAL=()
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --jobs) JOBS="${2:?--jobs needs a number}"; shift 2 ;;
+    --jobs=*) JOBS="${1#*=}"; shift ;;
+    --per-host) PER_HOST="${2:?--per-host needs a number}"; shift 2 ;;
+    --per-host=*) PER_HOST="${1#*=}"; shift ;;
+    --host-delay) HOST_DELAY="${2:?--host-delay needs seconds}"; shift 2 ;;
+    --host-delay=*) HOST_DELAY="${1#*=}"; shift ;;
+    --root) ROOT="${2:?--root needs a directory}"; shift 2 ;;
+    --root=*) ROOT="${1#*=}"; shift ;;
+    --max-pages) PASS_ARGS+=(--max-pages "${2:?--max-pages needs a number}"); shift 2 ;;
+    --max-pages=*) PASS_ARGS+=("$1"); shift ;;
+    --no-cache) PASS_ARGS+=(--no-cache); shift ;;
+    --) shift; POSITIONAL+=("$@"); break ;;
+    -?*) echo "Unknown option: $1" >&2; exit 2 ;;
+    *) POSITIONAL+=("$1"); shift ;;
+  esac
+done
+set -- ${POSITIONAL[@]+"${POSITIONAL[@]}"}
+
+DOMAINS_FILE="${1:?Usage: collectors-batch.sh [--jobs N] [--per-host N] [--host-delay S] [--root DIR] <domains_file|->}"
+
+# ─── Domain List ─────────────────────────────────────────────────────────────
+
+# Second-level public suffixes: a host under one of these is grouped by its
+# last three labels (shop.client.co.uk -> client.co.uk), anything else by its
+# last two (blog.client.com -> client.com)
+MULTI_PART_SUFFIXES="co.uk org.uk me.uk ltd.uk plc.uk net.uk ac.uk gov.uk nhs.uk
+  com.au net.au org.au edu.au gov.au asn.au id.au
+  co.nz net.nz org.nz govt.nz ac.nz
+  co.za org.za web.za
+  co.jp ne.jp or.jp ac.jp go.jp
+  co.kr or.kr co.in net.in org.in firm.in gen.in ind.in co.id or.id web.id
+  com.br net.br org.br com.mx org.mx com.ar com.co com.pe com.ve com.uy com.ec
+  com.cn net.cn org.cn com.hk com.tw com.sg com.my com.ph com.vn com.pk com.bd
+  com.tr com.sa com.eg com.ng com.ua co.il org.il co.th ac.th co.ke"
+
+# Normalised the same way collectors.sh normalises its argument, so the
+# audit directory names match what a single run would create. Each domain's
+# politeness group is worked out here, once.
+DOMAINS=()
+declare -A GROUP_OF=()
+while IFS=$'\t' read -r domain group; do
+  DOMAINS+=("$domain")
+  GROUP_OF[$domain]=$group
+done < <(
+  if [[ "$DOMAINS_FILE" == "-" ]]; then cat; else cat "$DOMAINS_FILE"; fi |
+    tr -d '\r' | sed 's/#.*//;s/^[[:space:]]*//;s/[[:space:]]*$//' | grep -v '^$' |
+    sed 's|https\?://||;s|/.*||;s|www\.||' | awk '!seen[$0]++' |
+    awk -v suffixes="$MULTI_PART_SUFFIXES" '
+      BEGIN { n = split(suffixes, list, /[ \t\n]+/); for (i = 1; i <= n; i++) multi[list[i]] = 1 }
+      {
+        host = tolower($0)
+        sub(/:[0-9]*$/, "", host)
+        labels = split(host, part, ".")
+        keep = (labels >= 3 && (part[labels - 1] "." part[labels]) in multi) ? 3 : 2
+        group = part[labels]
+        for (i = labels - 1; i > labels - keep && i >= 1; i--) group = part[i] "." group
+        print $0 "\t" group
+      }'
+)
+
+if [[ ${#DOMAINS[@]} -eq 0 ]]; then
+  echo "[batch] No domains in ${DOMAINS_FILE}" >&2
+  exit 1
+fi
+
+RUN_DIR="${ROOT}/collectors-batch-$(date -u +%Y%m%dT%H%M%SZ)"
+mkdir -p "$RUN_DIR"
+
+# ─── Worker Pool ─────────────────────────────────────────────────────────────
+#
+# At most $JOBS domains run at once. A domain is only started when no other
+# domain of its politeness group is running and $HOST_DELAY seconds have
+# passed since the group's last start; otherwise the scheduler moves on to
+# the next waiting domain so one busy client never stalls the queue.
+
+declare -A GROUP_BUSY=()
+declare -A GROUP_LAST_START=()
+declare -A RUN_PID=()
+declare -A RUN_START=()
+PENDING=("${DOMAINS[@]}")
+OK=0
+FAILED=0
+
+printf 'domain\tstatus\tseconds\tlines\n' > "${RUN_DIR}/summary.tsv"
+
+start_domain() {
+  local domain="$1"
+  local audit_dir="${ROOT}/marketing-audit-${domain}"
+  mkdir -p "$audit_dir"
+  COLLECTORS_PAGE_CONCURRENCY="$PER_HOST" \
+    bash "${SCRIPT_DIR}/collectors.sh" ${PASS_ARGS[@]+"${PASS_ARGS[@]}"} "$domain" "$audit_dir" \
+    > "${RUN_DIR}/${domain}.log" 2>&1 &
+  RUN_PID[$domain]=$!
+  RUN_START[$domain]=$(date +%s)
+  local group="${GROUP_OF[$domain]}"
+  GROUP_BUSY[$group]=1
+  GROUP_LAST_START[$group]=${RUN_START[$domain]}
+}
+
+finish_domain() {
+  local domain="$1"
+  local status="ok"
+  wait "${RUN_PID[$domain]}" || status="failed"
+  local duration=$(( $(date +%s) - RUN_START[$domain] ))
+  local output="${ROOT}/marketing-audit-${domain}/collectors-data.md"
+  local lines=0
+  [[ -f "$output" ]] && lines=$(wc -l < "$output" | tr -d ' ')
+  if [[ "$status" == "ok" ]]; then OK=$((OK + 1)); else FAILED=$((FAILED + 1)); fi
+  printf '%s\t%s\t%s\t%s\n' "$domain" "$status" "$duration" "$lines" >> "${RUN_DIR}/summary.tsv"
+  echo "[batch] ${domain} ${status} (${duration}s) — $((OK + FAILED))/${#DOMAINS[@]}"
+  unset "RUN_PID[$domain]" "RUN_START[$domain]"
+  unset "GROUP_BUSY[${GROUP_OF[$domain]}]"
+}
+
+BATCH_START=$(date +%s)
+echo "[batch] Collecting ${#DOMAINS[@]} domains, ${JOBS} at a time (logs: ${RUN_DIR})"
+
+while [[ ${#PENDING[@]} -gt 0 || ${#RUN_PID[@]} -gt 0 ]]; do
+  for domain in "${!RUN_PID[@]}"; do
+    kill -0 "${RUN_PID[$domain]}" 2>/dev/null || finish_domain "$domain"
+  done
+
+  now=$(date +%s)
+  waiting=()
+  for domain in ${PENDING[@]+"${PENDING[@]}"}; do
+    group="${GROUP_OF[$domain]}"
+    if [[ ${#RUN_PID[@]} -lt $JOBS && -z "${GROUP_BUSY[$group]:-}" ]] &&
+       (( now - ${GROUP_LAST_START[$group]:-0} >= HOST_DELAY )); then
+      start_domain "$domain"
+    else
+      waiting+=("$domain")
+    fi
+  done
+  PENDING=(${waiting[@]+"${waiting[@]}"})
+
+  sleep 0.2
+done
+
+# ─── Summary ─────────────────────────────────────────────────────────────────
+
+BATCH_DURATION=$(( $(date +%s) - BATCH_START ))
+
+{
+  echo ""
+  echo "## Batch Summary"
+  echo "- Domains: ${#DOMAINS[@]} (${OK} ok, ${FAILED} failed)"
+  echo "- Wall time: ${BATCH_DURATION}s with ${JOBS} workers"
+  awk -F'\t' 'NR > 1 {
+      n++; total += $3
+      if ($3 > max) { max = $3; slowest = $1 }
+    }
+    END {
+      if (n) {
+        printf "- Domain time: %ds total, %.1fs mean, %ds max (%s)\n", total, total / n, max, slowest
+      }
+    }' "${RUN_DIR}/summary.tsv"
+  echo ""
+  echo "### Collector timings across domains"
+  cat "${RUN_DIR}"/*.log 2>/dev/null | awk '
+    match($0, /^\[collectors\] .* done \([0-9.]+s\)$/) {
+      name = $0
+      sub(/^\[collectors\] /, "", name)
+      sub(/ done \([0-9.]+s\)$/, "", name)
+      secs = $NF
+      gsub(/[()s]/, "", secs)
+      secs += 0
+      if (!(name in runs)) order[++n] = name
+      runs[name]++; total[name] += secs
+      if (secs > max[name]) max[name] = secs
+    }
+    END {
+      for (i = 1; i <= n; i++) {
+        name = order[i]
+        printf "- %s: %.2fs mean, %.2fs max over %d runs\n", name, total[name] / runs[name], max[name], runs[name]
+      }
+    }'
+  echo ""
+  echo "### Slowest hosts (network time, cache misses only)"
+  for domain in "${DOMAINS[@]}"; do
+    profile="${ROOT}/marketing-audit-${domain}/collectors-profile.tsv"
+    if [[ -f "$profile" ]]; then tail -n +2 "$profile"; fi
+  done | awk -F'\t' '
+    $2 == "http" && $4 != "hit" {
+      host = $3
+      sub(/^[A-Za-z]+:\/\//, "", host)
+      sub(/[\/?#].*/, "", host)
+      calls[host]++; total[host] += $10
+      if ($10 > max[host]) max[host] = $10
+    }
+    END {
+      for (h in calls)
+        printf "%.3f\t- %s: %.2fs total, %.2fs max over %d requests\n", total[h], h, total[h], max[h], calls[h]
+    }' | sort -rn | head -10 | cut -f2-
+  echo ""
+  echo "Per-domain results: ${RUN_DIR}/summary.tsv"
+}
+
+[[ $FAILED -eq 0 ]]
@@ -3,76 +3,514 @@
 # Runs between crawl and agent spawning. Extracts raw technical data
 # that WebFetch strips (HTML tags, headers, SSL, DNS, PageSpeed, etc.)
 #
-# Usage: bash collectors.sh <domain> <audit_dir>
-# Output: ${AUDIT_DIR}/collectors-data.md
+# Usage: bash collectors.sh [--max-pages N] [--no-cache] <domain> <audit_dir>
+# Output: ${AUDIT_DIR}/collectors-data.md (prose for agents)
+#         ${AUDIT_DIR}/collectors-data.json (same findings as structured data)
+#         ${AUDIT_DIR}/collectors-profile.tsv (timing of every collector and
+#         network call in this run)
+#
+# Options (or environment variables):
+#   --max-pages N   extra ## PAGE: URLs from crawl-data.md to scan
+#                   (COLLECTORS_MAX_PAGES, default 3)
+#   --no-cache      ignore cached responses and fetch everything again
+#                   (COLLECTORS_NO_CACHE=1); fresh results are still stored
+#   COLLECTORS_PAGE_CONCURRENCY   parallel page downloads (default 6)
+#   COLLECTORS_SITEMAP_MAX_FILES  sitemaps read when following indexes (200)
+#   COLLECTORS_SITEMAP_MAX_DEPTH  sitemap index levels followed (3)
+#   COLLECTORS_SITEMAP_CONCURRENCY  parallel sitemap downloads (4)
+#   COLLECTORS_SITEMAP_BUDGET     seconds the sitemap walk may take (40); it
+#                   stays inside the robots/sitemap collector's 60s budget
+#   COLLECTORS_CACHE_DIR          response cache location
+#                   (default ~/.cache/marketing-orchestrator/collectors)
+#   COLLECTORS_TTL_HTML           seconds to reuse pages, robots, sitemap (900)
+#   COLLECTORS_TTL_DNS            seconds to reuse dig answers (86400)
+#   COLLECTORS_TTL_SSL            seconds to reuse the TLS handshake (86400)
+#   COLLECTORS_TTL_PAGESPEED      seconds to reuse PageSpeed results (86400)
 #
 # Requirements: macOS standard tools (curl, dig, openssl, grep, sed, awk)
 # Optional: jq (for cleaner PageSpeed parsing — falls back to grep)
 
 set -euo pipefail
 
-DOMAIN="${1:?Usage: collectors.sh <domain> <audit_dir>}"
-AUDIT_DIR="${2:?Usage: collectors.sh <domain> <audit_dir>}"
+MAX_PAGES="${COLLECTORS_MAX_PAGES:-3}"
+PAGE_CONCURRENCY="${COLLECTORS_PAGE_CONCURRENCY:-6}"
+NO_CACHE="${COLLECTORS_NO_CACHE:-}"
+SITEMAP_MAX_FILES="${COLLECTORS_SITEMAP_MAX_FILES:-200}"
+SITEMAP_MAX_DEPTH="${COLLECTORS_SITEMAP_MAX_DEPTH:-3}"
+SITEMAP_CONCURRENCY="${COLLECTORS_SITEMAP_CONCURRENCY:-4}"
+SITEMAP_BUDGET="${COLLECTORS_SITEMAP_BUDGET:-40}"
+# Largest sitemap sections recorded as facts
+SITEMAP_SECTION_FACTS=50
+
+POSITIONAL=()
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --max-pages) MAX_PAGES="${2:?--max-pages needs a number}"; shift 2 ;;
+    --max-pages=*) MAX_PAGES="${1#*=}"; shift ;;
+    --no-cache) NO_CACHE=1; shift ;;
+    --) shift; POSITIONAL+=("$@"); break ;;
+    -*) echo "Unknown option: $1" >&2; exit 2 ;;
+    *) POSITIONAL+=("$1"); shift ;;
+  esac
+done
+set -- ${POSITIONAL[@]+"${POSITIONAL[@]}"}
+
+DOMAIN="${1:?Usage: collectors.sh [--max-pages N] [--no-cache] <domain> <audit_dir>}"
+AUDIT_DIR="${2:?Usage: collectors.sh [--max-pages N] [--no-cache] <domain> <audit_dir>}"
 TMP=$(mktemp -d)
 OUTPUT="${AUDIT_DIR}/collectors-data.md"
+JSON_OUTPUT="${AUDIT_DIR}/collectors-data.json"
+PROFILE_OUTPUT="${AUDIT_DIR}/collectors-profile.tsv"
 CRAWL_DATA="${AUDIT_DIR}/crawl-data.md"
+CRAWL_INDEX="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/crawl_index.py"
+USER_AGENT="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 
 # Strip protocol and trailing slash
 DOMAIN=$(echo "$DOMAIN" | sed 's|https\?://||;s|/.*||;s|www\.||')
 BASE_URL="https://${DOMAIN}"
 
-# Timing
-TOTAL_START=$(date +%s)
+# ─── Timing Profile ──────────────────────────────────────────────────────────
+#
+# Every collector, HTTP request and cached command appends one row to the
+# run's profile, which is copied to collectors-profile.tsv at the end. HTTP
+# phase columns are curl's cumulative -w times in seconds (DNS done, TCP
+# connected, TLS done, first byte, total); other rows only fill "total".
+
+# Milliseconds since the epoch: $EPOCHREALTIME on bash 5, otherwise date
+if [[ -n "${EPOCHREALTIME:-}" ]]; then
+  now_ms() {
+    local t="${EPOCHREALTIME/[.,]/}"
+    echo $(( t / 1000 ))
+  }
+else
+  now_ms() {
+    local t
+    t=$(date +%s%3N)
+    [[ "$t" == *N ]] && t="$(date +%s)000"
+    echo "$t"
+  }
+fi
+
+# seconds_since START_MS — elapsed time as seconds with millisecond precision
+seconds_since() {
+  local ms=$(( $(now_ms) - $1 ))
+  printf '%d.%03d' $(( ms / 1000 )) $(( ms % 1000 ))
+}
+
+PROFILE="${TMP}/profile.tsv"
+PROFILE_SCOPE="setup"
+CURL_TIMING='%{filename_effective}\t%{http_code}\t%{time_namelookup}\t%{time_connect}\t%{time_appconnect}\t%{time_starttransfer}\t%{time_total}\t%{size_download}\n'
+printf 'scope\tkind\ttarget\tcache\tstatus\tdns\tconnect\ttls\tttfb\ttotal\tbytes\n' > "$PROFILE"
+
+# profile_row KIND TARGET CACHE STATUS DNS CONNECT TLS TTFB TOTAL BYTES
+profile_row() {
+  local IFS=$'\t'
+  echo "${PROFILE_SCOPE}"$'\t'"$*" >> "$PROFILE"
+}
+
+TOTAL_START=$(now_ms)
+
+# ─── Response Cache ──────────────────────────────────────────────────────────
+#
+# Re-audits of the same client (remediation cycles, a second run an hour
+# later) would otherwise repeat every request. Responses are kept on disk
+# per domain, keyed by URL or command, each with its collector's TTL. A
+# stale page is revalidated with If-None-Match / If-Modified-Since and
+# reused when the server answers 304. Only successful answers are stored.
+
+TTL_HTML="${COLLECTORS_TTL_HTML:-900}"
+TTL_DNS="${COLLECTORS_TTL_DNS:-86400}"
+TTL_SSL="${COLLECTORS_TTL_SSL:-86400}"
+TTL_PAGESPEED="${COLLECTORS_TTL_PAGESPEED:-86400}"
+[[ "$NO_CACHE" == "0" ]] && NO_CACHE=""
+
+CACHE_DIR="${COLLECTORS_CACHE_DIR:-${XDG_CACHE_HOME:-$HOME/.cache}/marketing-orchestrator/collectors}/${DOMAIN}"
+mkdir -p "${CACHE_DIR}/http" "${CACHE_DIR}/cmd" 2>/dev/null || CACHE_DIR=""
+
+if command -v sha256sum >/dev/null 2>&1; then
+  HASH_CMD=(sha256sum)
+else
+  HASH_CMD=(shasum -a 256)
+fi
+
+cache_key() {
+  printf '%s' "$1" | "${HASH_CMD[@]}" | cut -d' ' -f1
+}
+
+# cache_fresh FILE TTL — true if FILE exists and is younger than TTL seconds
+cache_fresh() {
+  [[ -z "$NO_CACHE" && -f "$1" ]] || return 1
+  local mtime
+  mtime=$(stat -c %Y "$1" 2>/dev/null || stat -f %m "$1" 2>/dev/null) || return 1
+  (( $(date +%s) - mtime < $2 ))
+}
+
+# cache_store SRC DEST — copy into the cache without exposing a partial file
+cache_store() {
+  cp "$1" "${2}.$$" 2>/dev/null && mv -f "${2}.$$" "$2" 2>/dev/null || rm -f "${2}.$$"
+}
+
+# Validators from the final header block of a cached response, one -H
+# argument per line
+conditional_headers() {
+  awk '
+    { sub(/\r$/, "") }
+    /^HTTP\// { etag = ""; modified = "" }
+    tolower($0) ~ /^etag:/ { etag = $0; sub(/^[^:]*:[ \t]*/, "", etag) }
+    tolower($0) ~ /^last-modified:/ { modified = $0; sub(/^[^:]*:[ \t]*/, "", modified) }
+    END {
+      if (etag != "") print "If-None-Match: " etag
+      if (modified != "") print "If-Modified-Since: " modified
+    }
+  ' "$1" 2>/dev/null
+}
+
+# fetch_prepare URL TTL — sets FETCH_ENTRY and FETCH_HIT; on a miss fills
+# FETCH_ARGS with the validators for a revalidating request
+fetch_prepare() {
+  FETCH_ENTRY="" FETCH_HIT="" FETCH_ARGS=()
+  [[ -n "$CACHE_DIR" ]] || return 0
+  FETCH_ENTRY="${CACHE_DIR}/http/$(cache_key "$1")"
+  if cache_fresh "${FETCH_ENTRY}.body" "$2"; then
+    FETCH_HIT=1
+  elif [[ -z "$NO_CACHE" && -f "${FETCH_ENTRY}.body" && -f "${FETCH_ENTRY}.headers" ]]; then
+    local header
+    while IFS= read -r header; do
+      FETCH_ARGS+=(-H "$header")
+    done < <(conditional_headers "${FETCH_ENTRY}.headers")
+  fi
+}
+
+# fetch_finish ENTRY TMP_PREFIX BODY_OUT HEADERS_OUT URL TIMING — turn a
+# completed request (TMP_PREFIX.body / .headers, TIMING its CURL_TIMING
+# line) into the caller's output files, update the cache entry and profile
+fetch_finish() {
+  local entry="$1" tmp="$2" body="$3" headers="$4" url="$5" timing="$6"
+  local code cache="miss" _file _code dns connect tls ttfb total bytes
+  IFS=$'\t' read -r _file _code dns connect tls ttfb total bytes <<< "$timing"
+  [[ -z "$entry" || -n "$NO_CACHE" ]] && cache="off"
+  code=$(awk '/^HTTP\// { code = $2 } END { print code }' "${tmp}.headers" 2>/dev/null)
+  [[ "$code" == "304" ]] && cache="revalidated"
+  profile_row http "$url" "$cache" "${code:-000}" "${dns:-}" "${connect:-}" "${tls:-}" "${ttfb:-}" "${total:-}" "${bytes:-}"
+  if [[ "$code" == "304" && -n "$entry" && -f "${entry}.body" ]]; then
+    touch "${entry}.headers" "${entry}.body"
+    cp "${entry}.body" "$body"
+    [[ -n "$headers" ]] && cp "${entry}.headers" "$headers"
+  elif [[ -n "$code" ]]; then
+    if [[ -n "$entry" && ( "$code" == 2* || "$code" == "404" || "$code" == "410" ) ]]; then
+      cache_store "${tmp}.headers" "${entry}.headers"
+      cache_store "${tmp}.body" "${entry}.body"
+    fi
+    [[ -f "${tmp}.body" ]] && mv -f "${tmp}.body" "$body"
+    [[ -n "$headers" ]] && mv -f "${tmp}.headers" "$headers"
+  fi
+  rm -f "${tmp}.body" "${tmp}.headers"
+}
+
+# fetch_url TTL URL BODY_OUT [HEADERS_OUT] [MAX_TIME] — curl -sL through the
+# cache. Output files are only created when a response was received.
+fetch_url() {
+  local ttl="$1" url="$2" body="$3" headers="${4:-}" max_time="${5:-10}"
+  fetch_prepare "$url" "$ttl"
+  if [[ -n "$FETCH_HIT" ]]; then
+    fetch_hit "$url" "$body" "$headers"
+    return 0
+  fi
+  local tmp="${body}.fetch" timing
+  timing=$(curl -sL --max-time "$max_time" -A "$USER_AGENT" ${FETCH_ARGS[@]+"${FETCH_ARGS[@]}"} \
+    -D "${tmp}.headers" -o "${tmp}.body" -w "$CURL_TIMING" "$url" 2>/dev/null) || true
+  fetch_finish "$FETCH_ENTRY" "$tmp" "$body" "$headers" "$url" "$timing"
+}
+
+# fetch_hit URL BODY_OUT [HEADERS_OUT] — serve FETCH_ENTRY from the cache
+fetch_hit() {
+  local start
+  start=$(now_ms)
+  cp "${FETCH_ENTRY}.body" "$2"
+  [[ -n "${3:-}" ]] && cp "${FETCH_ENTRY}.headers" "$3"
+  profile_row http "$1" hit "" "" "" "" "" "$(seconds_since "$start")" "$(wc -c < "$2" | tr -d ' ')"
+}
+
+# cached_cmd TTL KEY COMMAND... — stdout of COMMAND, reused for TTL seconds.
+# Only runs that exit 0 with some output are stored: dig +short exits 0 with
+# no output on SERVFAIL or a lame delegation, and caching that would report
+# "no MX / SPF / DMARC" for the whole TTL. Genuinely empty answers are simply
+# asked again next time.
+cached_cmd() {
+  local ttl="$1" key="$2"
+  shift 2
+  local entry="" start
+  start=$(now_ms)
+  if [[ -n "$CACHE_DIR" ]]; then
+    entry="${CACHE_DIR}/cmd/$(cache_key "$key")"
+    if cache_fresh "$entry" "$ttl"; then
+      cat "$entry"
+      profile_row cmd "$key" hit 0 "" "" "" "" "$(seconds_since "$start")" ""
+      return 0
+    fi
+  fi
+  local out status=0
+  out=$(mktemp "${TMP}/cmd.XXXXXX")
+  "$@" > "$out" || status=$?
+  [[ $status -eq 0 && -s "$out" && -n "$entry" ]] && cache_store "$out" "$entry"
+  profile_row cmd "$key" "$([[ -n "$entry" && -z "$NO_CACHE" ]] && echo miss || echo off)" "$status" \
+    "" "" "" "" "$(seconds_since "$start")" "$(wc -c < "$out" | tr -d ' ')"
+  cat "$out"
+  rm -f "$out"
+  return $status
+}
 
 # ─── Shared Setup ────────────────────────────────────────────────────────────
 
 echo "[collectors] Starting 10 collectors for ${DOMAIN}..."
 
-# Fetch homepage raw HTML (shared by tech-stack, structured-data, html-structure, social-links)
-curl -sL --max-time 15 -A "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36" \
-  "${BASE_URL}" -o "${TMP}/homepage.html" 2>/dev/null || true
+# Fetch homepage raw HTML and response headers in one request
+# (HTML shared by tech-stack, structured-data, html-structure, social-links;
+# headers by security-headers and cookies)
+fetch_url "$TTL_HTML" "${BASE_URL}" "${TMP}/homepage.html" "${TMP}/response-headers.txt" 15
 
-# Fetch response headers + cookies (shared by security-headers, cookies)
-curl -sL --max-time 10 -D "${TMP}/response-headers.txt" -o /dev/null \
-  -A "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36" \
-  -c "${TMP}/cookies-raw.txt" \
-  "${BASE_URL}" 2>/dev/null || true
+# Page URLs in crawl order, from the crawl_index.py sidecar (built or
+# refreshed as needed, so later readers can skip the scan); grep the crawl
+# itself if python3 is unavailable
+crawl_urls() {
+  if command -v python3 >/dev/null 2>&1 && python3 "$CRAWL_INDEX" --urls "$CRAWL_DATA" 2>/dev/null; then
+    return
+  fi
+  grep -oE '## PAGE: https?://[^ ]+' "$CRAWL_DATA" | sed 's/## PAGE: //'
+}
 
-# Fetch up to 3 additional pages from crawl-data.md for broader detection
-if [[ -f "$CRAWL_DATA" ]]; then
-  EXTRA_URLS=$(grep -oE '## PAGE: https?://[^ ]+' "$CRAWL_DATA" | sed 's/## PAGE: //' | head -3)
+# Fetch additional pages from crawl-data.md for broader detection. Cache
+# hits are copied; the rest are downloaded concurrently by one curl process
+# that reuses connections to the host. Older curl without --parallel falls
+# back to background jobs.
+PAGE_FILES=()
+if [[ -f "$CRAWL_DATA" && "$MAX_PAGES" -gt 0 ]]; then
+  EXTRA_URLS=$(crawl_urls | grep -E '^https?://' | awk '!seen[$0]++' | head -"$MAX_PAGES" || true)
   PAGE_IDX=1
-  for url in $EXTRA_URLS; do
-    curl -sL --max-time 10 -A "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36" \
-      "$url" -o "${TMP}/page${PAGE_IDX}.html" 2>/dev/null || true
-    PAGE_IDX=$((PAGE_IDX + 1))
-  done
+  if curl --help all 2>/dev/null | grep -q -- '--parallel-max'; then
+    PAGE_ARGS=()
+    PAGE_MISSES=()
+    for url in $EXTRA_URLS; do
+      page="${TMP}/page${PAGE_IDX}.html"
+      PAGE_FILES+=("$page")
+      PAGE_IDX=$((PAGE_IDX + 1))
+      fetch_prepare "$url" "$TTL_HTML"
+      if [[ -n "$FETCH_HIT" ]]; then
+        fetch_hit "$url" "$page"
+        continue
+      fi
+      [[ ${#PAGE_ARGS[@]} -gt 0 ]] && PAGE_ARGS+=(--next)
+      PAGE_ARGS+=(-sL --max-time 10 -A "$USER_AGENT" ${FETCH_ARGS[@]+"${FETCH_ARGS[@]}"}
+        -D "${page}.fetch.headers" -o "${page}.fetch.body" -w "$CURL_TIMING" "$url")
+      PAGE_MISSES+=("${FETCH_ENTRY}|${page}|${url}")
+    done
+    if [[ ${#PAGE_MISSES[@]} -gt 0 ]]; then
+      # Timing lines arrive in completion order; match them by output file
+      curl --parallel --parallel-max "$PAGE_CONCURRENCY" "${PAGE_ARGS[@]}" > "${TMP}/page-timings.tsv" 2>/dev/null || true
+      for miss in "${PAGE_MISSES[@]}"; do
+        IFS='|' read -r entry page url <<< "$miss"
+        fetch_finish "$entry" "${page}.fetch" "$page" "" "$url" \
+          "$(grep -F "${page}.fetch.body"$'\t' "${TMP}/page-timings.tsv" | head -1)"
+      done
+    fi
+  else
+    for url in $EXTRA_URLS; do
+      while [[ $(jobs -rp | wc -l) -ge $PAGE_CONCURRENCY ]]; do sleep 0.1; done
+      fetch_url "$TTL_HTML" "$url" "${TMP}/page${PAGE_IDX}.html" &
+      PAGE_FILES+=("${TMP}/page${PAGE_IDX}.html")
+      PAGE_IDX=$((PAGE_IDX + 1))
+    done
+    wait || true
+  fi
 fi
 
-# Combine all HTML for multi-page scanning
-cat "${TMP}"/homepage.html "${TMP}"/page*.html 2>/dev/null > "${TMP}/all-pages.html" || \
-  cp "${TMP}/homepage.html" "${TMP}/all-pages.html" 2>/dev/null || true
+# Combine all HTML for multi-page scanning (homepage first, then pages in crawl order)
+for page in "${TMP}/homepage.html" ${PAGE_FILES[@]+"${PAGE_FILES[@]}"}; do
+  [[ -f "$page" ]] && cat "$page"
+done > "${TMP}/all-pages.html" || true
 
 # ─── Collector Runner ────────────────────────────────────────────────────────
+#
+# Collectors are independent of each other, so each one runs in the
+# background with its own time budget and writes its section to its own
+# file. The files are stitched together afterwards in the fixed order the
+# collectors were started in, so collectors-data.md reads exactly as if
+# they had run one after another. Wall-clock time is roughly that of the
+# slowest collector.
+#
+# Besides its markdown, each collector records machine-readable findings
+# with fact() into its own facts file, one "key<TAB>json" line per value.
+# A key ending in [] appends to a list and "a.b" nests b inside object a.
+# The facts are assembled into collectors-data.json in the same order.
+
+COLLECTOR_FILES=()
+COLLECTOR_PIDS=()
+
+# json_str VALUE — VALUE as a JSON string literal
+json_str() {
+  local s="$1"
+  s=${s//\\/\\\\}
+  s=${s//\"/\\\"}
+  s=${s//$'\t'/\\t}
+  s=${s//$'\r'/}
+  s=${s//$'\n'/\\n}
+  printf '"%s"' "$s"
+}
 
-COLLECTOR_RESULTS=()
+# json_num VALUE — first line of VALUE as a JSON number, or null
+json_num() {
+  local n="${1%%$'\n'*}"
+  if [[ "$n" =~ ^-?[0-9]+(\.[0-9]+)?$ ]]; then
+    printf '%s' "$n"
+  else
+    printf 'null'
+  fi
+}
+
+# fact KEY JSON — record one finding for the running collector
+fact() {
+  if [[ -n "${FACTS:-}" ]]; then
+    printf '%s\t%s\n' "$1" "$2" >> "$FACTS"
+  fi
+}
 
 run_collector() {
   local name="$1"
   local func="$2"
-  local start end duration result
-  start=$(date +%s)
-
-  result=$($func 2>/dev/null) || result="**${name}: Collection failed** — site may block automated requests or resource unavailable."
-
-  end=$(date +%s)
-  duration=$((end - start))
-  echo "[collectors] ${name} done (${duration}s)"
-  COLLECTOR_RESULTS+=("$result")
+  local budget="${3:-60}"
+  local out="${TMP}/collector-${#COLLECTOR_FILES[@]}.md"
+  COLLECTOR_FILES+=("$out")
+
+  (
+    set +e
+    local start duration pid watchdog status
+    start=$(now_ms)
+
+    # Job control puts the collector in its own process group, so the
+    # watchdog can signal everything it started: command substitutions,
+    # cached_cmd and backgrounded downloads included. With job control on,
+    # stdin is no longer redirected for us.
+    set -m
+    FACTS="${out}.facts" PROFILE_SCOPE="${func#collect_}" "$func" < /dev/null > "${out}.partial" 2>/dev/null &
+    pid=$!
+    set +m
+    (
+      sleep "$budget"
+      touch "${out}.timeout"
+      kill -TERM -- "-$pid" 2>/dev/null
+    ) 2>/dev/null &
+    watchdog=$!
+
+    if wait "$pid" && [[ ! -e "${out}.timeout" ]]; then
+      mv "${out}.partial" "$out"
+      status="ok"
+    elif [[ -e "${out}.timeout" ]]; then
+      echo "**${name}: Collection failed** — timed out after ${budget}s." > "$out"
+      status="timeout"
+    else
+      echo "**${name}: Collection failed** — site may block automated requests or resource unavailable." > "$out"
+      status="failed"
+    fi
+    [[ "$status" != "ok" ]] && rm -f "${out}.facts"
+    pkill -P "$watchdog" 2>/dev/null
+    kill "$watchdog" 2>/dev/null
+    wait "$watchdog" 2>/dev/null
+
+    duration=$(seconds_since "$start")
+    PROFILE_SCOPE="${func#collect_}" profile_row collector "$name" "" "$status" "" "" "" "" "$duration" ""
+    printf '%s\t%s\t%s\t%s\n' "${func#collect_}" "$name" "$status" "$duration" > "${out}.status"
+    echo "[collectors] ${name} done (${duration}s)"
+  ) &
+  COLLECTOR_PIDS+=($!)
 }
 
 # ─── Collector 1: Technology Stack ───────────────────────────────────────────
 
+# One row per technology: category :: name :: pattern. Patterns are POSIX
+# EREs matched case-insensitively against each line of the combined HTML.
+# Categories print in the order they first appear. A "(none)" pattern is
+# printed only when nothing else in its category was detected.
+TECH_SIGNATURES='
+CMS & Frameworks              :: Shopify                             :: Shopify|cdn\.shopify\.com
+CMS & Frameworks              :: WordPress                           :: wp-content|wp-includes|wordpress
+CMS & Frameworks              :: WooCommerce                         :: woocommerce|wc-block
+CMS & Frameworks              :: Squarespace                         :: Squarespace|squarespace-cdn
+CMS & Frameworks              :: Wix                                 :: wix\.com|wixsite
+CMS & Frameworks              :: Webflow                             :: webflow\.com|webflow\.io
+CMS & Frameworks              :: Next.js                             :: __next|_next/static|next\.js
+CMS & Frameworks              :: Gatsby                              :: gatsby|/static/[a-f0-9]*/|gatsby-image
+CMS & Frameworks              :: Nuxt.js                             :: __nuxt|nuxt\.js
+CMS & Frameworks              :: Angular                             :: ng-version|angular
+CMS & Frameworks              :: React                               :: data-reactroot|react\.production
+CMS & Frameworks              :: Svelte                              :: svelte|__svelte
+CMS & Frameworks              :: Vue.js                              :: vue\.js|data-v-|vue\.runtime
+CMS & Frameworks              :: Drupal                              :: drupal|sites/all|sites/default
+CMS & Frameworks              :: Joomla                              :: joomla|/media/system
+CMS & Frameworks              :: Ghost                               :: ghost\.org|ghost-theme
+CMS & Frameworks              :: Magento                             :: magento|mage/cookies
+CMS & Frameworks              :: BigCommerce                         :: bigcommerce|cdn\.bigcommerce
+CMS & Frameworks              :: PrestaShop                          :: prestashop
+CMS & Frameworks              :: HubSpot CMS                         :: hubspot\.com|hs-scripts
+Analytics & Tracking          :: Google Analytics 4                  :: gtag|google-analytics|googletagmanager|G-[A-Z0-9]+
+Analytics & Tracking          :: Google Tag Manager                  :: GTM-[A-Z0-9]+|googletagmanager\.com/gtm
+Analytics & Tracking          :: Meta Pixel (Facebook)               :: fbq\(|connect\.facebook\.net/.*fbevents|facebook-pixel
+Analytics & Tracking          :: LinkedIn Insight Tag                :: snap\.licdn|linkedin\.com/px|_linkedin_partner_id
+Analytics & Tracking          :: TikTok Pixel                        :: analytics\.tiktok|ttq\.load
+Analytics & Tracking          :: Pinterest Tag                       :: pintrk|pinterest\.com/ct
+Analytics & Tracking          :: Twitter/X Pixel                     :: twq\(|twitter\.com/.*oct
+Analytics & Tracking          :: Hotjar                              :: hotjar\.com|_hjSettings
+Analytics & Tracking          :: Microsoft Clarity                   :: clarity\.ms|microsoft-clarity
+Analytics & Tracking          :: Mixpanel                            :: mixpanel\.com|mixpanel\.init
+Analytics & Tracking          :: Segment                             :: segment\.com|analytics\.js|cdn\.segment
+Analytics & Tracking          :: Amplitude                           :: amplitude\.com|amplitude\.init
+Analytics & Tracking          :: Plausible Analytics                 :: plausible\.io
+Analytics & Tracking          :: Fathom Analytics                    :: fathom\.com|usefathom
+Analytics & Tracking          :: Heap                                :: heap\.io|heapanalytics
+Analytics & Tracking          :: PostHog                             :: posthog\.com|posthog\.init
+Analytics & Tracking          :: Matomo/Piwik                        :: matomo|piwik
+Email & Marketing Platforms   :: Klaviyo                             :: klaviyo\.com|klaviyo\.js
+Email & Marketing Platforms   :: Mailchimp                           :: mailchimp\.com|mc\.js|chimpstatic
+Email & Marketing Platforms   :: ConvertKit                          :: convertkit\.com|ck\.page
+Email & Marketing Platforms   :: ActiveCampaign                      :: activecampaign\.com
+Email & Marketing Platforms   :: Drip                                :: drip\.com|getdrip
+Email & Marketing Platforms   :: SendGrid                            :: sendgrid\.com|sendgrid\.net
+Email & Marketing Platforms   :: HubSpot Forms                       :: hubspot\.com/.*forms|hsforms
+Email & Marketing Platforms   :: Intercom                            :: intercom\.com|intercomSettings
+Email & Marketing Platforms   :: Drift                               :: drift\.com|driftt
+Email & Marketing Platforms   :: Crisp                               :: crisp\.chat|crisp\.im
+Email & Marketing Platforms   :: Zendesk                             :: zendesk\.com|zopim
+Email & Marketing Platforms   :: Tawk.to                             :: tawk\.to
+Email & Marketing Platforms   :: LiveChat                            :: livechat|livechatinc
+Email & Marketing Platforms   :: Omnisend                            :: omnisend\.com
+Email & Marketing Platforms   :: Brevo (Sendinblue)                  :: brevo\.com|sendinblue
+Payment & E-commerce          :: Stripe                              :: stripe\.com|stripe\.js|Stripe\(
+Payment & E-commerce          :: PayPal                              :: paypal\.com|paypalobjects
+Payment & E-commerce          :: Klarna                              :: klarna\.com|klarna-payments
+Payment & E-commerce          :: Afterpay                            :: afterpay\.com|afterpay-js
+Payment & E-commerce          :: Affirm                              :: affirm\.com|affirm\.js
+Payment & E-commerce          :: ReCharge                            :: recharge\.com|rechargepayments
+Payment & E-commerce          :: Swell Rewards                       :: swell\.is|swellrewards
+Payment & E-commerce          :: Yotpo                               :: yotpo\.com
+Payment & E-commerce          :: Judge.me                            :: judge\.me|judgeme
+Payment & E-commerce          :: Stamped.io                          :: stamped\.io
+Payment & E-commerce          :: Loox Reviews                        :: loox\.io
+A/B Testing & Personalization :: Optimizely                          :: optimizely\.com
+A/B Testing & Personalization :: VWO                                 :: vwo\.com|visualwebsiteoptimizer
+A/B Testing & Personalization :: AB Tasty                            :: abtasty\.com
+A/B Testing & Personalization :: Convert                             :: convert\.com
+A/B Testing & Personalization :: Google Optimize                     :: google_optimize|optimize\.google
+A/B Testing & Personalization :: LaunchDarkly                        :: launchdarkly\.com
+Cookie Consent & Compliance   :: Cookiebot                           :: cookiebot
+Cookie Consent & Compliance   :: OneTrust                            :: onetrust
+Cookie Consent & Compliance   :: Osano                               :: osano
+Cookie Consent & Compliance   :: Iubenda                             :: iubenda
+Cookie Consent & Compliance   :: Complianz                           :: complianz
+Cookie Consent & Compliance   :: Termly                              :: termly
+Cookie Consent & Compliance   :: Quantcast Choice                    :: quantcast
+Cookie Consent & Compliance   :: CookieConsent                       :: cookieconsent
+Cookie Consent & Compliance   :: No cookie consent platform detected :: (none)
+'
+
 collect_tech_stack() {
   local html="${TMP}/all-pages.html"
   [[ ! -s "$html" ]] && echo "**Technology Stack: No HTML available**" && return
@@ -82,108 +520,67 @@ collect_tech_stack() {
   echo "Detected technologies from raw HTML analysis:"
   echo ""
 
-  # CMS / Frameworks
-  echo "### CMS & Frameworks"
-  grep -qiE 'Shopify|cdn\.shopify\.com' "$html" && echo "- Shopify [COLLECTED]"
-  grep -qiE 'wp-content|wp-includes|wordpress' "$html" && echo "- WordPress [COLLECTED]"
-  grep -qiE 'woocommerce|wc-block' "$html" && echo "- WooCommerce [COLLECTED]"
-  grep -qiE 'Squarespace|squarespace-cdn' "$html" && echo "- Squarespace [COLLECTED]"
-  grep -qiE 'wix\.com|wixsite' "$html" && echo "- Wix [COLLECTED]"
-  grep -qiE 'webflow\.com|webflow\.io' "$html" && echo "- Webflow [COLLECTED]"
-  grep -qiE '__next|_next/static|next\.js' "$html" && echo "- Next.js [COLLECTED]"
-  grep -qiE 'gatsby|\/static\/[a-f0-9]*\/|gatsby-image' "$html" && echo "- Gatsby [COLLECTED]"
-  grep -qiE '__nuxt|nuxt\.js' "$html" && echo "- Nuxt.js [COLLECTED]"
-  grep -qiE 'ng-version|angular' "$html" && echo "- Angular [COLLECTED]"
-  grep -qiE 'data-reactroot|react\.production' "$html" && echo "- React [COLLECTED]"
-  grep -qiE 'svelte|__svelte' "$html" && echo "- Svelte [COLLECTED]"
-  grep -qiE 'vue\.js|data-v-|vue\.runtime' "$html" && echo "- Vue.js [COLLECTED]"
-  grep -qiE 'drupal|sites\/all|sites\/default' "$html" && echo "- Drupal [COLLECTED]"
-  grep -qiE 'joomla|\/media\/system' "$html" && echo "- Joomla [COLLECTED]"
-  grep -qiE 'ghost\.org|ghost-theme' "$html" && echo "- Ghost [COLLECTED]"
-  grep -qiE 'magento|mage\/cookies' "$html" && echo "- Magento [COLLECTED]"
-  grep -qiE 'bigcommerce|cdn\.bigcommerce' "$html" && echo "- BigCommerce [COLLECTED]"
-  grep -qiE 'prestashop' "$html" && echo "- PrestaShop [COLLECTED]"
-  grep -qiE 'hubspot\.com|hs-scripts' "$html" && echo "- HubSpot CMS [COLLECTED]"
-  echo ""
-
-  # Analytics & Tracking
-  echo "### Analytics & Tracking"
-  grep -qiE 'gtag|google-analytics|googletagmanager|G-[A-Z0-9]+' "$html" && echo "- Google Analytics 4 [COLLECTED]"
-  grep -qiE 'GTM-[A-Z0-9]+|googletagmanager\.com\/gtm' "$html" && echo "- Google Tag Manager [COLLECTED]"
-  grep -qiE 'fbq\(|connect\.facebook\.net\/.*fbevents|facebook-pixel' "$html" && echo "- Meta Pixel (Facebook) [COLLECTED]"
-  grep -qiE 'snap\.licdn|linkedin\.com\/px|_linkedin_partner_id' "$html" && echo "- LinkedIn Insight Tag [COLLECTED]"
-  grep -qiE 'analytics\.tiktok|ttq\.load' "$html" && echo "- TikTok Pixel [COLLECTED]"
-  grep -qiE 'pintrk|pinterest\.com\/ct' "$html" && echo "- Pinterest Tag [COLLECTED]"
-  grep -qiE 'twq\(|twitter\.com\/.*oct' "$html" && echo "- Twitter/X Pixel [COLLECTED]"
-  grep -qiE 'hotjar\.com|_hjSettings' "$html" && echo "- Hotjar [COLLECTED]"
-  grep -qiE 'clarity\.ms|microsoft-clarity' "$html" && echo "- Microsoft Clarity [COLLECTED]"
-  grep -qiE 'mixpanel\.com|mixpanel\.init' "$html" && echo "- Mixpanel [COLLECTED]"
-  grep -qiE 'segment\.com|analytics\.js|cdn\.segment' "$html" && echo "- Segment [COLLECTED]"
-  grep -qiE 'amplitude\.com|amplitude\.init' "$html" && echo "- Amplitude [COLLECTED]"
-  grep -qiE 'plausible\.io' "$html" && echo "- Plausible Analytics [COLLECTED]"
-  grep -qiE 'fathom\.com|usefathom' "$html" && echo "- Fathom Analytics [COLLECTED]"
-  grep -qiE 'heap\.io|heapanalytics' "$html" && echo "- Heap [COLLECTED]"
-  grep -qiE 'posthog\.com|posthog\.init' "$html" && echo "- PostHog [COLLECTED]"
-  grep -qiE 'matomo|piwik' "$html" && echo "- Matomo/Piwik [COLLECTED]"
-  echo ""
-
-  # Email & Marketing
-  echo "### Email & Marketing Platforms"
-  grep -qiE 'klaviyo\.com|klaviyo\.js' "$html" && echo "- Klaviyo [COLLECTED]"
-  grep -qiE 'mailchimp\.com|mc\.js|chimpstatic' "$html" && echo "- Mailchimp [COLLECTED]"
-  grep -qiE 'convertkit\.com|ck\.page' "$html" && echo "- ConvertKit [COLLECTED]"
-  grep -qiE 'activecampaign\.com' "$html" && echo "- ActiveCampaign [COLLECTED]"
-  grep -qiE 'drip\.com|getdrip' "$html" && echo "- Drip [COLLECTED]"
-  grep -qiE 'sendgrid\.com|sendgrid\.net' "$html" && echo "- SendGrid [COLLECTED]"
-  grep -qiE 'hubspot\.com\/.*forms|hsforms' "$html" && echo "- HubSpot Forms [COLLECTED]"
-  grep -qiE 'intercom\.com|intercomSettings' "$html" && echo "- Intercom [COLLECTED]"
-  grep -qiE 'drift\.com|driftt' "$html" && echo "- Drift [COLLECTED]"
-  grep -qiE 'crisp\.chat|crisp\.im' "$html" && echo "- Crisp [COLLECTED]"
-  grep -qiE 'zendesk\.com|zopim' "$html" && echo "- Zendesk [COLLECTED]"
-  grep -qiE 'tawk\.to' "$html" && echo "- Tawk.to [COLLECTED]"
-  grep -qiE 'livechat|livechatinc' "$html" && echo "- LiveChat [COLLECTED]"
-  grep -qiE 'omnisend\.com' "$html" && echo "- Omnisend [COLLECTED]"
-  grep -qiE 'brevo\.com|sendinblue' "$html" && echo "- Brevo (Sendinblue) [COLLECTED]"
-  echo ""
-
-  # Payment & E-commerce
-  echo "### Payment & E-commerce"
-  grep -qiE 'stripe\.com|stripe\.js|Stripe\(' "$html" && echo "- Stripe [COLLECTED]"
-  grep -qiE 'paypal\.com|paypalobjects' "$html" && echo "- PayPal [COLLECTED]"
-  grep -qiE 'klarna\.com|klarna-payments' "$html" && echo "- Klarna [COLLECTED]"
-  grep -qiE 'afterpay\.com|afterpay-js' "$html" && echo "- Afterpay [COLLECTED]"
-  grep -qiE 'affirm\.com|affirm\.js' "$html" && echo "- Affirm [COLLECTED]"
-  grep -qiE 'recharge\.com|rechargepayments' "$html" && echo "- ReCharge [COLLECTED]"
-  grep -qiE 'swell\.is|swellrewards' "$html" && echo "- Swell Rewards [COLLECTED]"
-  grep -qiE 'yotpo\.com' "$html" && echo "- Yotpo [COLLECTED]"
-  grep -qiE 'judge\.me|judgeme' "$html" && echo "- Judge.me [COLLECTED]"
-  grep -qiE 'stamped\.io' "$html" && echo "- Stamped.io [COLLECTED]"
-  grep -qiE 'loox\.io' "$html" && echo "- Loox Reviews [COLLECTED]"
-  echo ""
-
-  # A/B Testing & Personalization
-  echo "### A/B Testing & Personalization"
-  grep -qiE 'optimizely\.com' "$html" && echo "- Optimizely [COLLECTED]"
-  grep -qiE 'vwo\.com|visualwebsiteoptimizer' "$html" && echo "- VWO [COLLECTED]"
-  grep -qiE 'abtasty\.com' "$html" && echo "- AB Tasty [COLLECTED]"
-  grep -qiE 'convert\.com' "$html" && echo "- Convert [COLLECTED]"
-  grep -qiE 'google_optimize|optimize\.google' "$html" && echo "- Google Optimize [COLLECTED]"
-  grep -qiE 'launchdarkly\.com' "$html" && echo "- LaunchDarkly [COLLECTED]"
-  echo ""
-
-  # Cookie Consent / GDPR
-  echo "### Cookie Consent & Compliance"
-  grep -qiE 'cookiebot|cookieconsent|onetrust|osano|iubenda|complianz|termly|quantcast' "$html" && {
-    grep -qiE 'cookiebot' "$html" && echo "- Cookiebot [COLLECTED]"
-    grep -qiE 'onetrust' "$html" && echo "- OneTrust [COLLECTED]"
-    grep -qiE 'osano' "$html" && echo "- Osano [COLLECTED]"
-    grep -qiE 'iubenda' "$html" && echo "- Iubenda [COLLECTED]"
-    grep -qiE 'complianz' "$html" && echo "- Complianz [COLLECTED]"
-    grep -qiE 'termly' "$html" && echo "- Termly [COLLECTED]"
-    grep -qiE 'quantcast' "$html" && echo "- Quantcast Choice [COLLECTED]"
-    grep -qiE 'cookieconsent' "$html" && echo "- CookieConsent [COLLECTED]"
-  } || echo "- No cookie consent platform detected [COLLECTED]"
-  echo ""
+  local signatures="${TMP}/tech-signatures.txt"
+  printf '%s\n' "$TECH_SIGNATURES" > "$signatures"
+
+  # Single pass over the HTML: grep matches one alternation of every
+  # pattern (compiled to a DFA, so the cost stays flat as the table grows)
+  # and awk attributes only the matching lines to individual signatures.
+  # Signatures that were already found drop out of awk's own alternation.
+  local combined
+  combined=$(awk '
+    /^[[:space:]]*$/ { next }
+    { split($0, f, / *:: */); if (f[3] != "(none)") alt = alt (alt == "" ? "" : "|") "(" f[3] ")" }
+    END { print alt }
+  ' "$signatures")
+
+  { grep -iE -- "$combined" "$html" || true; } | awk -v sigfile="$signatures" -v factsfile="${FACTS:-/dev/null}" '
+    function json(s) {
+      gsub(/\\/, "\\\\", s); gsub(/"/, "\\\"", s)
+      return "\"" s "\""
+    }
+    function rebuild(   i, alt) {
+      alt = ""
+      for (i = 1; i <= n; i++)
+        if (live[i]) alt = alt (alt == "" ? "" : "|") "(" pat[i] ")"
+      combined = alt
+    }
+    BEGIN {
+      FS = "\n"
+      while ((getline row < sigfile) > 0) {
+        if (row ~ /^[[:space:]]*$/) continue
+        split(row, f, / *:: */)
+        n++
+        cat[n] = f[1]; name[n] = f[2]; pat[n] = tolower(f[3])
+        if (!(f[1] in seen)) { seen[f[1]] = 1; cats[++ncats] = f[1] }
+        if (pat[n] != "(none)") live[n] = 1
+      }
+      rebuild()
+    }
+    {
+      if (combined == "") exit
+      line = tolower($0)
+      if (line !~ combined) next
+      for (i = 1; i <= n; i++)
+        if (live[i] && line ~ pat[i]) { live[i] = 0; found[i] = 1; hit = 1 }
+      if (hit) { hit = 0; rebuild() }
+    }
+    END {
+      for (c = 1; c <= ncats; c++) {
+        print "### " cats[c]
+        any = 0
+        for (i = 1; i <= n; i++) {
+          if (cat[i] != cats[c]) continue
+          if (pat[i] == "(none)") { if (!any) print "- " name[i] " [COLLECTED]" }
+          else if (found[i]) {
+            print "- " name[i] " [COLLECTED]"; any = 1
+            printf "technologies[]\t{\"category\": %s, \"name\": %s}\n", json(cat[i]), json(name[i]) > factsfile
+          }
+        }
+        print ""
+      }
+    }
+  '
 }
 
 # ─── Collector 2: Structured Data (JSON-LD) ─────────────────────────────────
@@ -206,6 +603,8 @@ collect_structured_data() {
   ' "$html" 2>/dev/null)
 
   if [[ -z "$jsonld_blocks" ]]; then
+    fact block_count 0
+    fact types '[]'
     echo "**No JSON-LD structured data found.** [COLLECTED]"
     echo ""
     echo "This is a critical gap — WebFetch cannot detect structured data"
@@ -218,6 +617,7 @@ collect_structured_data() {
   local block_count
   block_count=$(echo "$jsonld_blocks" | grep -c "BLOCK_SEP" || echo "0")
   echo "Found **${block_count} JSON-LD block(s)** [COLLECTED]"
+  fact block_count "$(json_num "$block_count")"
   echo ""
 
   # Extract @type values
@@ -227,8 +627,10 @@ collect_structured_data() {
   if [[ -n "$types" ]]; then
     while IFS= read -r t; do
       echo "- \`${t}\` [COLLECTED]"
+      fact 'types[]' "$(json_str "$t")"
     done <<< "$types"
   else
+    fact types '[]'
     echo "- No @type detected [COLLECTED]"
   fi
   echo ""
@@ -271,6 +673,8 @@ collect_html_structure() {
   title=$(grep -oiE '<title[^>]*>[^<]*</title>' "$html" | head -1 | sed 's/<[^>]*>//g')
   if [[ -n "$title" ]]; then
     local title_len=${#title}
+    fact title "$(json_str "$title")"
+    fact title_length "$title_len"
     echo "- Title: \`${title}\` (${title_len} chars) [COLLECTED]"
     if [[ $title_len -gt 60 ]]; then
       echo "- Warning: Title exceeds 60 char recommendation [COLLECTED]"
@@ -286,6 +690,7 @@ collect_html_structure() {
     local name val
     name=$(echo "$meta" | grep -oE '(name|property)="[^"]*"' | head -1 | sed 's/.*="//;s/"//')
     val=$(echo "$meta" | grep -oE 'content="[^"]*"' | head -1 | sed 's/content="//;s/"//')
+    [[ -n "$name" ]] && fact "meta.${name}" "$(json_str "$val")"
     [[ -n "$name" ]] && echo "- \`${name}\`: ${val:0:120} [COLLECTED]"
   done
   echo ""
@@ -295,6 +700,7 @@ collect_html_structure() {
   for level in 1 2 3 4 5 6; do
     local count
     count=$(grep -oiE "<h${level}[^>]*>" "$html" | wc -l | tr -d ' ')
+    fact "headings.h${level}" "$(json_num "$count")"
     if [[ "$count" -gt 0 ]]; then
       echo "- **H${level}:** ${count} found [COLLECTED]"
       if [[ $level -le 3 ]]; then
@@ -313,6 +719,8 @@ collect_html_structure() {
   local total_imgs missing_alt
   total_imgs=$(grep -oiE '<img[^>]*>' "$html" | wc -l | tr -d ' ')
   missing_alt=$(grep -oiE '<img[^>]*>' "$html" | grep -viE 'alt="[^"]+' | wc -l | tr -d ' ')
+  fact images "$(json_num "$total_imgs")"
+  fact images_missing_alt "$(json_num "$missing_alt")"
   echo "- Total images: ${total_imgs} [COLLECTED]"
   echo "- Missing/empty alt text: ${missing_alt} [COLLECTED]"
   if [[ "$missing_alt" -gt 0 ]]; then
@@ -329,6 +737,7 @@ collect_html_structure() {
   echo "### Forms"
   local form_count
   form_count=$(grep -oiE '<form[^>]*>' "$html" | wc -l | tr -d ' ')
+  fact forms "$(json_num "$form_count")"
   echo "- Total forms: ${form_count} [COLLECTED]"
   if [[ "$form_count" -gt 0 ]]; then
     grep -oiE '<form[^>]*>' "$html" | head -5 | while IFS= read -r form; do
@@ -351,6 +760,7 @@ collect_html_structure() {
     # Password fields (for signup detection)
     local pw_count
     pw_count=$(grep -oiE 'type="password"' "$html" | wc -l | tr -d ' ')
+    fact password_fields "$(json_num "$pw_count")"
     [[ "$pw_count" -gt 0 ]] && echo "- Password fields detected: ${pw_count} (signup/login flow present) [COLLECTED]"
   fi
   echo ""
@@ -359,6 +769,7 @@ collect_html_structure() {
   echo "### Content Metrics"
   local word_count
   word_count=$(sed 's/<[^>]*>//g' "$html" | tr -s '[:space:]' '\n' | wc -l | tr -d ' ')
+  fact word_count "$(json_num "$word_count")"
   echo "- Approximate word count (homepage): ${word_count} [COLLECTED]"
   echo ""
 }
@@ -397,10 +808,12 @@ collect_social_links() {
     url=$(grep -oiE "href=\"https?://(www\.)?${pattern}" "$html" | head -1 | sed 's/href="//;s/"$//')
     if [[ -n "$url" ]]; then
       echo "- **${platform}:** ${url} [COLLECTED]"
+      fact "profiles.${platform}" "$(json_str "$url")"
       found=$((found + 1))
     fi
   done
 
+  [[ $found -eq 0 ]] && fact profiles '{}'
   [[ $found -eq 0 ]] && echo "- No social profile links detected [COLLECTED]"
   echo ""
 
@@ -413,8 +826,10 @@ collect_social_links() {
       local href
       href=$(echo "$r" | grep -oE 'href="[^"]*"' | sed 's/href="//;s/"//')
       echo "- RSS/Atom: ${href} [COLLECTED]"
+      fact 'feeds[]' "$(json_str "$href")"
     done
   else
+    fact feeds '[]'
     echo "- No RSS/Atom feed detected [COLLECTED]"
   fi
   echo ""
@@ -430,6 +845,7 @@ collect_social_links() {
     echo "- Share buttons found in HTML [COLLECTED]"
     sharing=1
   }
+  [[ $sharing -eq 0 ]] && fact sharing_buttons false || fact sharing_buttons true
   [[ $sharing -eq 0 ]] && echo "- No social sharing buttons detected [COLLECTED]"
   echo ""
 }
@@ -461,14 +877,17 @@ collect_security_headers() {
     val=$(grep -i "^${header}:" "$headers" | head -1 | sed "s/^${header}:\s*//i" | tr -d '\r')
     if [[ -n "$val" ]]; then
       echo "- **${header}:** \`${val:0:120}\` [COLLECTED]"
+      fact "headers.${header}" "$(json_str "$val")"
       present=$((present + 1))
     else
       echo "- **${header}:** MISSING — ${desc} [COLLECTED]"
+      fact "headers.${header}" null
       missing=$((missing + 1))
     fi
   done
   echo ""
   echo "**Score: ${present}/6 security headers present** [COLLECTED]"
+  fact present "$present"
   echo ""
 
   # Server information disclosure
@@ -478,6 +897,8 @@ collect_security_headers() {
   local powered
   powered=$(grep -i "^x-powered-by:" "$headers" | head -1 | sed 's/^x-powered-by:\s*//i' | tr -d '\r')
 
+  fact server "$([[ -n "$server" ]] && json_str "$server" || echo null)"
+  fact powered_by "$([[ -n "$powered" ]] && json_str "$powered" || echo null)"
   [[ -n "$server" ]] && echo "- Server: \`${server}\` [COLLECTED]" || echo "- Server header: hidden [COLLECTED]"
   [[ -n "$powered" ]] && echo "- X-Powered-By: \`${powered}\` (should be removed) [COLLECTED]" || echo "- X-Powered-By: hidden [COLLECTED]"
   echo ""
@@ -491,12 +912,14 @@ collect_ssl() {
 
   # SSL certificate info
   local ssl_output
-  ssl_output=$(echo | openssl s_client -servername "$DOMAIN" -connect "${DOMAIN}:443" 2>/dev/null)
+  ssl_output=$(cached_cmd "$TTL_SSL" "openssl ${DOMAIN}:443" openssl s_client -servername "$DOMAIN" -connect "${DOMAIN}:443" </dev/null 2>/dev/null)
 
+  fact https "$([[ -n "$ssl_output" ]] && echo true || echo false)"
   if [[ -n "$ssl_output" ]]; then
     # Issuer
     local issuer
     issuer=$(echo "$ssl_output" | openssl x509 -noout -issuer 2>/dev/null | sed 's/issuer=//')
+    [[ -n "$issuer" ]] && fact issuer "$(json_str "$issuer")"
     [[ -n "$issuer" ]] && echo "- **Issuer:** ${issuer} [COLLECTED]"
 
     # Expiry
@@ -504,6 +927,7 @@ collect_ssl() {
     expiry=$(echo "$ssl_output" | openssl x509 -noout -enddate 2>/dev/null | sed 's/notAfter=//')
     if [[ -n "$expiry" ]]; then
       echo "- **Expires:** ${expiry} [COLLECTED]"
+      fact expires "$(json_str "$expiry")"
       # Check if expiring within 30 days
       local expiry_epoch now_epoch
       expiry_epoch=$(date -j -f "%b %d %T %Y %Z" "$expiry" +%s 2>/dev/null || date -d "$expiry" +%s 2>/dev/null || echo "0")
@@ -511,6 +935,8 @@ collect_ssl() {
       if [[ "$expiry_epoch" -gt 0 ]]; then
         local days_left=$(( (expiry_epoch - now_epoch) / 86400 ))
         echo "- **Days until expiry:** ${days_left} [COLLECTED]"
+        fact expires_at "$(json_str "$(date -u -d "@${expiry_epoch}" +%Y-%m-%dT%H:%M:%SZ 2>/dev/null || date -u -r "$expiry_epoch" +%Y-%m-%dT%H:%M:%SZ)")"
+        fact days_left "$days_left"
         [[ $days_left -lt 30 ]] && echo "- **WARNING: Certificate expiring within 30 days!** [COLLECTED]"
       fi
     fi
@@ -518,11 +944,13 @@ collect_ssl() {
     # Protocol
     local protocol
     protocol=$(echo "$ssl_output" | grep -oE 'Protocol\s*:\s*\S+' | head -1 | sed 's/Protocol\s*:\s*//')
+    [[ -n "$protocol" ]] && fact protocol "$(json_str "$protocol")"
     [[ -n "$protocol" ]] && echo "- **Protocol:** ${protocol} [COLLECTED]"
 
     # Subject
     local subject
     subject=$(echo "$ssl_output" | openssl x509 -noout -subject 2>/dev/null | sed 's/subject=//')
+    [[ -n "$subject" ]] && fact subject "$(json_str "$subject")"
     [[ -n "$subject" ]] && echo "- **Subject:** ${subject} [COLLECTED]"
   else
     echo "- **SSL connection failed** — site may not support HTTPS [COLLECTED]"
@@ -532,16 +960,20 @@ collect_ssl() {
   # HTTP → HTTPS redirect check
   echo "### HTTP to HTTPS Redirect"
   local http_status
-  http_status=$(curl -sI --max-time 5 "http://${DOMAIN}" 2>/dev/null | head -5)
+  http_status=$(cached_cmd "$TTL_SSL" "curl -sI http://${DOMAIN}" curl -sI --max-time 5 "http://${DOMAIN}" 2>/dev/null | head -5)
   if echo "$http_status" | grep -qiE '301|302|307|308'; then
     local redirect_target
     redirect_target=$(echo "$http_status" | grep -i "location:" | head -1 | sed 's/location:\s*//i' | tr -d '\r')
+    fact redirect_target "$(json_str "$redirect_target")"
     if echo "$redirect_target" | grep -qi "https://"; then
       echo "- HTTP redirects to HTTPS [COLLECTED]"
+      fact https_redirect true
     else
       echo "- HTTP redirects but NOT to HTTPS (target: ${redirect_target}) [COLLECTED]"
+      fact https_redirect false
     fi
   else
+    fact https_redirect false
     echo "- No HTTP to HTTPS redirect detected [COLLECTED]"
   fi
   echo ""
@@ -556,27 +988,35 @@ collect_dns_email() {
   # MX Records
   echo "### MX Records"
   local mx
-  mx=$(dig +short MX "$DOMAIN" 2>/dev/null)
+  mx=$(cached_cmd "$TTL_DNS" "dig MX ${DOMAIN}" dig +short MX "$DOMAIN" 2>/dev/null)
   if [[ -n "$mx" ]]; then
     echo "$mx" | while IFS= read -r record; do
       echo "- ${record} [COLLECTED]"
+      fact 'mx[]' "$(json_str "$record")"
     done
 
     # Detect provider
     if echo "$mx" | grep -qi "google\|gmail\|googlemail"; then
       echo "- **Provider:** Google Workspace [COLLECTED]"
+      fact mail_provider '"Google Workspace"'
     elif echo "$mx" | grep -qi "outlook\|microsoft\|office365"; then
       echo "- **Provider:** Microsoft 365 [COLLECTED]"
+      fact mail_provider '"Microsoft 365"'
     elif echo "$mx" | grep -qi "zoho"; then
       echo "- **Provider:** Zoho Mail [COLLECTED]"
+      fact mail_provider '"Zoho Mail"'
     elif echo "$mx" | grep -qi "protonmail\|proton"; then
       echo "- **Provider:** ProtonMail [COLLECTED]"
+      fact mail_provider '"ProtonMail"'
     elif echo "$mx" | grep -qi "mimecast"; then
       echo "- **Provider:** Mimecast [COLLECTED]"
+      fact mail_provider '"Mimecast"'
     elif echo "$mx" | grep -qi "barracuda"; then
       echo "- **Provider:** Barracuda [COLLECTED]"
+      fact mail_provider '"Barracuda"'
     fi
   else
+    fact mx '[]'
     echo "- No MX records found [COLLECTED]"
   fi
   echo ""
@@ -584,13 +1024,18 @@ collect_dns_email() {
   # SPF
   echo "### SPF Record"
   local spf
-  spf=$(dig +short TXT "$DOMAIN" 2>/dev/null | grep -i "v=spf1" | head -1)
+  spf=$(cached_cmd "$TTL_DNS" "dig TXT ${DOMAIN}" dig +short TXT "$DOMAIN" 2>/dev/null | grep -i "v=spf1" | head -1)
   if [[ -n "$spf" ]]; then
     echo "- \`${spf}\` [COLLECTED]"
+    fact spf "$(json_str "$spf")"
+    echo "$spf" | grep -qi "~all" && fact spf_policy '"~all"'
+    echo "$spf" | grep -qi "\-all" && fact spf_policy '"-all"'
+    echo "$spf" | grep -qi "?all" && fact spf_policy '"?all"'
     echo "$spf" | grep -qi "~all" && echo "- Policy: soft fail (~all) — emails from unauthorized senders may still deliver [COLLECTED]"
     echo "$spf" | grep -qi "\-all" && echo "- Policy: hard fail (-all) — strict, best practice [COLLECTED]"
     echo "$spf" | grep -qi "?all" && echo "- Policy: neutral (?all) — weak, not recommended [COLLECTED]"
   else
+    fact spf null
     echo "- **No SPF record found** — email spoofing risk [COLLECTED]"
   fi
   echo ""
@@ -598,13 +1043,18 @@ collect_dns_email() {
   # DMARC
   echo "### DMARC Record"
   local dmarc
-  dmarc=$(dig +short TXT "_dmarc.${DOMAIN}" 2>/dev/null | head -1)
+  dmarc=$(cached_cmd "$TTL_DNS" "dig TXT _dmarc.${DOMAIN}" dig +short TXT "_dmarc.${DOMAIN}" 2>/dev/null | head -1)
   if [[ -n "$dmarc" ]]; then
     echo "- \`${dmarc}\` [COLLECTED]"
+    fact dmarc "$(json_str "$dmarc")"
+    local dmarc_policy
+    dmarc_policy=$(echo "$dmarc" | grep -oiE 'p=(reject|quarantine|none)' | head -1 | cut -d= -f2 | tr 'A-Z' 'a-z')
+    [[ -n "$dmarc_policy" ]] && fact dmarc_policy "$(json_str "$dmarc_policy")"
     echo "$dmarc" | grep -qi "p=reject" && echo "- Policy: **reject** — strongest protection [COLLECTED]"
     echo "$dmarc" | grep -qi "p=quarantine" && echo "- Policy: **quarantine** — moderate protection [COLLECTED]"
     echo "$dmarc" | grep -qi "p=none" && echo "- Policy: **none** — monitoring only, no protection [COLLECTED]"
   else
+    fact dmarc null
     echo "- **No DMARC record found** — email authentication gap [COLLECTED]"
   fi
   echo ""
@@ -612,29 +1062,40 @@ collect_dns_email() {
   # NS Records
   echo "### Name Servers"
   local ns
-  ns=$(dig +short NS "$DOMAIN" 2>/dev/null)
+  ns=$(cached_cmd "$TTL_DNS" "dig NS ${DOMAIN}" dig +short NS "$DOMAIN" 2>/dev/null)
   if [[ -n "$ns" ]]; then
     echo "$ns" | head -4 | while IFS= read -r record; do
       echo "- ${record} [COLLECTED]"
     done
+    while IFS= read -r record; do
+      fact 'ns[]' "$(json_str "$record")"
+    done <<< "$ns"
 
     # Detect provider
     if echo "$ns" | grep -qi "cloudflare"; then
       echo "- **DNS Provider:** Cloudflare [COLLECTED]"
+      fact dns_provider '"Cloudflare"'
     elif echo "$ns" | grep -qi "awsdns\|amazonaws"; then
       echo "- **DNS Provider:** AWS Route 53 [COLLECTED]"
+      fact dns_provider '"AWS Route 53"'
     elif echo "$ns" | grep -qi "google\|googledomains"; then
       echo "- **DNS Provider:** Google Cloud DNS [COLLECTED]"
+      fact dns_provider '"Google Cloud DNS"'
     elif echo "$ns" | grep -qi "domaincontrol\|godaddy"; then
       echo "- **DNS Provider:** GoDaddy [COLLECTED]"
+      fact dns_provider '"GoDaddy"'
     elif echo "$ns" | grep -qi "namecheap\|registrar-servers"; then
       echo "- **DNS Provider:** Namecheap [COLLECTED]"
+      fact dns_provider '"Namecheap"'
     elif echo "$ns" | grep -qi "digitalocean"; then
       echo "- **DNS Provider:** DigitalOcean [COLLECTED]"
+      fact dns_provider '"DigitalOcean"'
     elif echo "$ns" | grep -qi "vercel"; then
       echo "- **DNS Provider:** Vercel DNS [COLLECTED]"
+      fact dns_provider '"Vercel DNS"'
     fi
   else
+    fact ns '[]'
     echo "- Could not resolve NS records [COLLECTED]"
   fi
   echo ""
@@ -649,9 +1110,10 @@ collect_pagespeed() {
   local api_url="https://www.googleapis.com/pagespeedonline/v5/runPagespeed?url=${BASE_URL}&category=performance&category=seo&category=accessibility&category=best-practices&strategy=mobile"
   local psi_json="${TMP}/pagespeed.json"
 
-  curl -sL --max-time 30 "$api_url" -o "$psi_json" 2>/dev/null
+  fetch_url "$TTL_PAGESPEED" "$api_url" "$psi_json" "" 30
 
   if [[ ! -s "$psi_json" ]]; then
+    fact available false
     echo "**PageSpeed API unavailable** — could not fetch Lighthouse scores [COLLECTED]"
     echo ""
     echo "Note: The PageSpeed Insights API is free and requires no API key for"
@@ -668,6 +1130,13 @@ collect_pagespeed() {
     access=$(jq -r '.lighthouseResult.categories.accessibility.score // empty' "$psi_json" 2>/dev/null)
     bp=$(jq -r '.lighthouseResult.categories["best-practices"].score // empty' "$psi_json" 2>/dev/null)
 
+    fact available true
+    fact strategy '"mobile"'
+    [[ -n "$perf" ]] && fact lighthouse.performance "$(json_num "$perf")"
+    [[ -n "$seo" ]] && fact lighthouse.seo "$(json_num "$seo")"
+    [[ -n "$access" ]] && fact lighthouse.accessibility "$(json_num "$access")"
+    [[ -n "$bp" ]] && fact lighthouse.best_practices "$(json_num "$bp")"
+
     echo "### Lighthouse Scores (Mobile)"
     [[ -n "$perf" ]] && echo "- **Performance:** $(echo "$perf * 100" | bc | cut -d. -f1)/100 [COLLECTED]"
     [[ -n "$seo" ]] && echo "- **SEO:** $(echo "$seo * 100" | bc | cut -d. -f1)/100 [COLLECTED]"
@@ -683,6 +1152,11 @@ collect_pagespeed() {
     cls=$(jq -r '.loadingExperience.metrics.CUMULATIVE_LAYOUT_SHIFT_SCORE.percentile // empty' "$psi_json" 2>/dev/null)
     inp=$(jq -r '.loadingExperience.metrics.INTERACTION_TO_NEXT_PAINT.percentile // empty' "$psi_json" 2>/dev/null)
 
+    [[ -n "$lcp" ]] && fact field.lcp_ms "$(json_num "$lcp")"
+    [[ -n "$fid" ]] && fact field.fid_ms "$(json_num "$fid")"
+    [[ -n "$inp" ]] && fact field.inp_ms "$(json_num "$inp")"
+    [[ -n "$cls" ]] && fact field.cls "$(json_num "$(awk -v cls="$cls" 'BEGIN { printf "%.2f", cls / 100 }')")"
+
     local has_field=0
     [[ -n "$lcp" ]] && echo "- **LCP:** ${lcp}ms $([ "$lcp" -le 2500 ] && echo '(good)' || echo '(needs improvement)') [COLLECTED]" && has_field=1
     [[ -n "$fid" ]] && echo "- **FID:** ${fid}ms $([ "$fid" -le 100 ] && echo '(good)' || echo '(needs improvement)') [COLLECTED]" && has_field=1
@@ -699,6 +1173,10 @@ collect_pagespeed() {
     si=$(jq -r '.lighthouseResult.audits["speed-index"].displayValue // empty' "$psi_json" 2>/dev/null)
     tbt=$(jq -r '.lighthouseResult.audits["total-blocking-time"].displayValue // empty' "$psi_json" 2>/dev/null)
 
+    [[ -n "$fcp" ]] && fact lab.fcp "$(json_str "$fcp")"
+    [[ -n "$si" ]] && fact lab.speed_index "$(json_str "$si")"
+    [[ -n "$tbt" ]] && fact lab.tbt "$(json_str "$tbt")"
+
     [[ -n "$fcp" ]] && echo "- **FCP:** ${fcp} [COLLECTED]"
     [[ -n "$si" ]] && echo "- **Speed Index:** ${si} [COLLECTED]"
     [[ -n "$tbt" ]] && echo "- **TBT:** ${tbt} [COLLECTED]"
@@ -708,12 +1186,17 @@ collect_pagespeed() {
     # Fallback: grep-based parsing (no jq)
     echo "### Lighthouse Scores (Mobile) — parsed without jq"
 
+    fact available true
+    fact strategy '"mobile"'
+
     local perf_score
     perf_score=$(grep -oE '"performance":\{"id":"performance","title":"Performance","score":[0-9.]+' "$psi_json" | grep -oE 'score:[0-9.]+' | cut -d: -f2)
+    [[ -n "$perf_score" ]] && fact lighthouse.performance "$(json_num "$perf_score")"
     [[ -n "$perf_score" ]] && echo "- **Performance:** $(echo "$perf_score * 100" | bc 2>/dev/null || echo "$perf_score")/100 [COLLECTED]"
 
     local seo_score
     seo_score=$(grep -oE '"seo":\{"id":"seo","title":"SEO","score":[0-9.]+' "$psi_json" | grep -oE 'score:[0-9.]+' | cut -d: -f2)
+    [[ -n "$seo_score" ]] && fact lighthouse.seo "$(json_num "$seo_score")"
     [[ -n "$seo_score" ]] && echo "- **SEO:** $(echo "$seo_score * 100" | bc 2>/dev/null || echo "$seo_score")/100 [COLLECTED]"
 
     echo ""
@@ -736,6 +1219,7 @@ collect_cookies() {
   cookies=$(grep -i "^set-cookie:" "$headers" | sed 's/^set-cookie:\s*//i')
 
   if [[ -z "$cookies" ]]; then
+    fact cookies '[]'
     echo "No cookies set on initial page load [COLLECTED]"
     echo ""
     echo "Note: Cookies may be set by JavaScript after page load (e.g., GA4,"
@@ -776,6 +1260,7 @@ collect_cookies() {
     samesite=$(echo "$flags" | grep -oiE 'samesite=[a-z]+' | head -1)
 
     echo "- **\`${name}\`** — ${category} [COLLECTED]"
+    fact 'cookies[]' "{\"name\": $(json_str "$name"), \"category\": $(json_str "$category"), \"secure\": $([[ -n "$secure" ]] && echo true || echo false), \"httponly\": $([[ -n "$httponly" ]] && echo true || echo false), \"samesite\": $([[ -n "$samesite" ]] && json_str "${samesite#*=}" || echo null)}"
     echo "  - Flags: ${secure:-no-Secure} ${httponly:-no-HttpOnly} ${samesite:-no-SameSite}"
   done
   echo ""
@@ -786,6 +1271,10 @@ collect_cookies() {
   analytics_count=$(echo "$cookies" | grep -ciE '_ga|_gid|_gat|__utm' || echo "0")
   marketing_count=$(echo "$cookies" | grep -ciE '_fbp|_fbc|_gcl|_pin|_tt_' || echo "0")
   consent_count=$(echo "$cookies" | grep -ciE 'consent|cookie|gdpr|ccpa' || echo "0")
+  fact counts.analytics "$(json_num "$analytics_count")"
+  fact counts.marketing "$(json_num "$marketing_count")"
+  fact counts.consent "$(json_num "$consent_count")"
+  fact counts.total "$(json_num "$cookie_count")"
   echo "- Analytics cookies: ${analytics_count} [COLLECTED]"
   echo "- Marketing cookies: ${marketing_count} [COLLECTED]"
   echo "- Consent cookies: ${consent_count} [COLLECTED]"
@@ -795,6 +1284,150 @@ collect_cookies() {
 
 # ─── Collector 10: robots.txt & Sitemap ─────────────────────────────────────
 
+# sitemap_stats FILE — stream one sitemap (plain or gzipped XML) and print
+# tab-separated aggregates: its type, URL count, lastmod per month, URLs per
+# top-level path section ("other" for sections with a single URL), media
+# entries and the child sitemaps of an index.
+# Tags are split on "<" so memory use does not grow with the document.
+sitemap_stats() {
+  local file="$1"
+  if [[ "$(head -c 2 "$file" | od -An -tx1 | tr -d ' \n')" == "1f8b" ]]; then
+    gzip -dc "$file" 2>/dev/null
+  else
+    cat "$file"
+  fi | awk '
+    BEGIN { RS = "<"; type = "invalid" }
+    function value(s) {
+      gsub(/^[ \t\r\n]+|[ \t\r\n]+$/, "", s)
+      gsub(/&amp;/, "\\&", s)
+      return s
+    }
+    /^!\[CDATA\[/ {
+      text = substr($0, 9)
+      sub(/\]\]>.*/, "", text)
+      if (field == "loc") loc = loc value(text)
+      else if (field == "lastmod") lastmod = lastmod value(text)
+      next
+    }
+    {
+      gt = index($0, ">")
+      if (!gt) next
+      tag = tolower(substr($0, 1, gt - 1))
+      text = substr($0, gt + 1)
+      if (tag ~ /^\//) {
+        tag = substr(tag, 2)
+        if (tag == "url" && loc != "") {
+          urls++
+          if (lastmod ~ /^[0-9][0-9][0-9][0-9]-[0-9][0-9]/) {
+            months[substr(lastmod, 1, 7)]++
+            if (lastmod > newest) newest = lastmod
+          }
+          path = loc
+          sub(/^[A-Za-z]+:\/\/[^\/]*/, "", path)
+          sub(/[?#].*/, "", path)
+          section = path
+          sub(/^\//, "", section)
+          sub(/\/.*/, "", section)
+          sections["/" section]++
+        } else if (tag == "sitemap" && loc != "") {
+          print "child\t" loc
+          children++
+          if (lastmod > newest) newest = lastmod
+        }
+        field = ""
+        next
+      }
+      sub(/[ \t\r\n\/].*/, "", tag)
+      if (tag == "urlset") type = "urlset"
+      else if (tag == "sitemapindex") type = "index"
+      else if (tag == "url" || tag == "sitemap") { loc = ""; lastmod = "" }
+      else if (tag == "loc") { loc = value(text); field = "loc" }
+      else if (tag == "lastmod") { lastmod = value(text); field = "lastmod" }
+      else if (tag == "image:image") images++
+      else if (tag == "video:video") videos++
+      else if (tag == "news:news") news++
+    }
+    END {
+      print "type\t" type
+      print "urls\t" urls + 0
+      print "children\t" children + 0
+      if (newest != "") print "lastmod\t" newest
+      for (m in months) print "month\t" m "\t" months[m]
+      # Sections with a single URL (every post on a flat site) are only
+      # counted, so the output does not grow with the number of URLs
+      for (s in sections) {
+        if (sections[s] > 1) print "section\t" s "\t" sections[s]
+        else other++
+      }
+      if (other) print "section\tother\t" other
+      print "images\t" images + 0
+      print "videos\t" videos + 0
+      print "news\t" news + 0
+    }
+  '
+}
+
+# walk_sitemaps URL DIR — breadth-first walk from URL through sitemap
+# indexes, downloading each level concurrently. Every sitemap's aggregates
+# are written to DIR/N.stats (1.stats is the root); at most
+# $SITEMAP_MAX_FILES sitemaps and $SITEMAP_MAX_DEPTH index levels are read,
+# and no download starts or runs past $SITEMAP_BUDGET seconds. If a limit
+# cut the walk short, DIR/truncated names it (files, depth or time).
+walk_sitemaps() {
+  local root="$1" dir="$2"
+  local -a level=("$root") next
+  local -A visited=(["$root"]=1)
+  local depth=0 count=0 fetched url i left max_time
+  local deadline=$(( $(now_ms) + SITEMAP_BUDGET * 1000 ))
+  mkdir -p "$dir"
+  : > "${dir}/truncated"
+
+  while [[ ${#level[@]} -gt 0 ]]; do
+    i=$count
+    for url in "${level[@]}"; do
+      while [[ $(jobs -rp | wc -l) -ge $SITEMAP_CONCURRENCY ]]; do sleep 0.1; done
+      left=$(( (deadline - $(now_ms)) / 1000 ))
+      if (( left < 1 )); then
+        echo time > "${dir}/truncated"
+        break
+      fi
+      max_time=$(( left < 30 ? left : 30 ))
+      i=$((i + 1))
+      fetch_url "$TTL_HTML" "$url" "${dir}/${i}.xml" "" "$max_time" &
+    done
+    wait
+    fetched=$(( i - count ))
+
+    # i is now the number of sitemaps fetched so far, this level included
+    next=()
+    for url in "${level[@]:0:fetched}"; do
+      count=$((count + 1))
+      if [[ -s "${dir}/${count}.xml" ]]; then
+        sitemap_stats "${dir}/${count}.xml" > "${dir}/${count}.stats"
+      else
+        printf 'type\tmissing\n' > "${dir}/${count}.stats"
+      fi
+      rm -f "${dir}/${count}.xml"
+      while IFS=$'\t' read -r _ child; do
+        [[ -n "${visited[$child]:-}" ]] && continue
+        visited[$child]=1
+        if (( depth >= SITEMAP_MAX_DEPTH )); then
+          echo depth > "${dir}/truncated"
+          continue
+        fi
+        if (( i + ${#next[@]} >= SITEMAP_MAX_FILES )); then
+          echo files > "${dir}/truncated"
+          continue
+        fi
+        next+=("$child")
+      done < <(grep $'^child\t' "${dir}/${count}.stats")
+    done
+    [[ -s "${dir}/truncated" && "$(<"${dir}/truncated")" == "time" ]] && break
+    level=(${next[@]+"${next[@]}"})
+    depth=$((depth + 1))
+  done
+}
+
 collect_robots_sitemap() {
   echo "## 10. robots.txt & Sitemap"
   echo ""
@@ -802,16 +1435,19 @@ collect_robots_sitemap() {
   # robots.txt
   echo "### robots.txt"
   local robots
-  robots=$(curl -sL --max-time 10 "${BASE_URL}/robots.txt" 2>/dev/null)
+  fetch_url "$TTL_HTML" "${BASE_URL}/robots.txt" "${TMP}/robots.txt"
+  robots=$(cat "${TMP}/robots.txt" 2>/dev/null)
 
   if [[ -n "$robots" ]] && ! echo "$robots" | head -1 | grep -qiE '<html|<!DOCTYPE|404|not found'; then
     echo "robots.txt found [COLLECTED]"
+    fact robots_txt true
     echo ""
 
     # Disallow rules
     local disallow_count
     disallow_count=$(echo "$robots" | grep -ciE '^Disallow:' || echo "0")
     echo "- Disallow rules: ${disallow_count} [COLLECTED]"
+    fact disallow_rules "$(json_num "$disallow_count")"
 
     echo "$robots" | grep -iE '^Disallow:' | head -10 | while IFS= read -r rule; do
       echo "  - \`${rule}\` [COLLECTED]"
@@ -820,6 +1456,7 @@ collect_robots_sitemap() {
     # Allow rules
     local allow_count
     allow_count=$(echo "$robots" | grep -ciE '^Allow:' || echo "0")
+    fact allow_rules "$(json_num "$allow_count")"
     [[ "$allow_count" -gt 0 ]] && echo "- Allow rules: ${allow_count} [COLLECTED]"
 
     # Crawl-delay
@@ -835,9 +1472,11 @@ collect_robots_sitemap() {
       echo "Sitemaps declared in robots.txt:"
       echo "$sitemap_refs" | while IFS= read -r sm; do
         echo "- \`${sm}\` [COLLECTED]"
+        fact 'declared_sitemaps[]' "$(json_str "$(echo "$sm" | tr -d ' \r')")"
       done
     fi
   else
+    fact robots_txt false
     echo "**No robots.txt found or returned HTML** [COLLECTED]"
   fi
   echo ""
@@ -850,36 +1489,102 @@ collect_robots_sitemap() {
     sitemap_url=$(echo "$sitemap_refs" | head -1 | tr -d ' \r')
   fi
 
-  local sitemap
-  sitemap=$(curl -sL --max-time 10 "$sitemap_url" 2>/dev/null)
+  local walk="${TMP}/sitemaps"
+  fact sitemap.url "$(json_str "$sitemap_url")"
+  walk_sitemaps "$sitemap_url" "$walk"
 
-  if [[ -n "$sitemap" ]] && echo "$sitemap" | grep -qiE '<urlset\|<sitemapindex'; then
+  if grep -qE $'^type\t(urlset|index)$' "${walk}/1.stats"; then
+    fact sitemap.found true
     # Is it a sitemap index?
-    if echo "$sitemap" | grep -qi '<sitemapindex'; then
+    if grep -q $'^type\tindex$' "${walk}/1.stats"; then
       local index_count
-      index_count=$(echo "$sitemap" | grep -c '<sitemap>' || echo "0")
+      index_count=$(grep -c $'^child\t' "${walk}/1.stats")
       echo "- **Sitemap index found** with ${index_count} child sitemaps [COLLECTED]"
+      fact sitemap.index true
+      fact sitemap.child_sitemaps "$(json_num "$index_count")"
 
-      echo "$sitemap" | grep -oE '<loc>[^<]*</loc>' | sed 's/<[^>]*>//g' | head -5 | while IFS= read -r loc; do
+      grep $'^child\t' "${walk}/1.stats" | cut -f2 | head -5 | while IFS= read -r loc; do
         echo "  - \`${loc}\` [COLLECTED]"
       done
     else
       local url_count
-      url_count=$(echo "$sitemap" | grep -c '<url>' || echo "0")
+      url_count=$(awk -F'\t' '$1 == "urls" { print $2 }' "${walk}/1.stats")
       echo "- **Sitemap found** with ${url_count} URLs [COLLECTED]"
+      fact sitemap.index false
+      fact sitemap.urls "$(json_num "$url_count")"
     fi
 
+    # Totals across every sitemap reached from the root
+    local totals
+    totals=$(cat "${walk}"/*.stats | awk -F'\t' '
+      $1 == "type" { files++; if ($2 == "urlset") urlsets++ }
+      $1 == "urls" { urls += $2 }
+      $1 == "lastmod" && $2 > newest { newest = $2 }
+      $1 == "month" { months[$2] += $3 }
+      $1 == "section" { sections[$2] += $3 }
+      $1 == "images" { images += $2 }
+      $1 == "videos" { videos += $2 }
+      $1 == "news" { news += $2 }
+      END {
+        print "files\t" files + 0
+        print "urlsets\t" urlsets + 0
+        print "urls\t" urls + 0
+        if (newest != "") print "lastmod\t" newest
+        print "images\t" images + 0
+        print "videos\t" videos + 0
+        print "news\t" news + 0
+        for (m in months) print "month\t" m "\t" months[m]
+        for (s in sections) print "section\t" s "\t" sections[s]
+      }')
+    local total_urls sitemaps_read
+    total_urls=$(echo "$totals" | awk -F'\t' '$1 == "urls" { print $2 }')
+    sitemaps_read=$(echo "$totals" | awk -F'\t' '$1 == "urlsets" { print $2 }')
+    if grep -q $'^type\tindex$' "${walk}/1.stats"; then
+      echo "- Total URLs across ${sitemaps_read} sitemaps: ${total_urls} [COLLECTED]"
+      case "$(<"${walk}/truncated")" in
+        files) echo "- Walk stopped at ${SITEMAP_MAX_FILES} sitemaps; totals are partial [COLLECTED]" ;;
+        depth) echo "- Walk stopped at index depth ${SITEMAP_MAX_DEPTH}; totals are partial [COLLECTED]" ;;
+        time) echo "- Walk stopped after ${SITEMAP_BUDGET}s; totals are partial [COLLECTED]" ;;
+      esac
+    fi
+    fact sitemap.total_urls "$(json_num "$total_urls")"
+    fact sitemap.sitemaps_read "$(json_num "$sitemaps_read")"
+    fact sitemap.truncated "$([[ -s "${walk}/truncated" ]] && echo true || echo false)"
+
     # Last modified dates
     local lastmod
-    lastmod=$(echo "$sitemap" | grep -oE '<lastmod>[^<]*</lastmod>' | sed 's/<[^>]*>//g' | sort -r | head -1)
+    lastmod=$(echo "$totals" | awk -F'\t' '$1 == "lastmod" { print $2 }')
+    [[ -n "$lastmod" ]] && fact sitemap.lastmod "$(json_str "$lastmod")"
     [[ -n "$lastmod" ]] && echo "- Most recent lastmod: ${lastmod} [COLLECTED]"
 
+    # lastmod histogram and section breakdown
+    local months sections
+    months=$(echo "$totals" | awk -F'\t' '$1 == "month" { print $2 "\t" $3 }' | sort -r)
+    if [[ -n "$months" ]]; then
+      echo "- URLs by lastmod month (latest 12):"
+      echo "$months" | head -12 | while IFS=$'\t' read -r month n; do
+        echo "  - ${month}: ${n} [COLLECTED]"
+      done
+      fact sitemap.lastmod_months "$(echo "$months" | awk -F'\t' '{ printf "%s\"%s\": %s", (NR > 1 ? ", " : "{"), $1, $2 } END { print "}" }')"
+    fi
+    sections=$(echo "$totals" | awk -F'\t' '$1 == "section" { print $3 "\t" $2 }' | sort -t$'\t' -k1,1nr -k2,2)
+    if [[ -n "$sections" ]]; then
+      echo "- URLs by section (top 10):"
+      echo "$sections" | head -10 | while IFS=$'\t' read -r n section; do
+        echo "  - \`${section}\`: ${n} [COLLECTED]"
+      done
+      fact sitemap.sections_total "$(echo "$sections" | awk 'END { print NR }')"
+      while IFS=$'\t' read -r n section; do
+        fact "sitemap_sections.${section}" "$n"
+      done < <(echo "$sections" | head -"$SITEMAP_SECTION_FACTS")
+    fi
+
     # Check for common sub-sitemaps
-    local has_images has_video has_news
-    echo "$sitemap" | grep -qi 'image:image' && echo "- Image sitemap entries present [COLLECTED]"
-    echo "$sitemap" | grep -qi 'video:video' && echo "- Video sitemap entries present [COLLECTED]"
-    echo "$sitemap" | grep -qi 'news:news' && echo "- News sitemap entries present [COLLECTED]"
+    echo "$totals" | grep -qE $'^images\t[1-9]' && echo "- Image sitemap entries present [COLLECTED]"
+    echo "$totals" | grep -qE $'^videos\t[1-9]' && echo "- Video sitemap entries present [COLLECTED]"
+    echo "$totals" | grep -qE $'^news\t[1-9]' && echo "- News sitemap entries present [COLLECTED]"
   else
+    fact sitemap.found false
     echo "- **No sitemap.xml found** at ${sitemap_url} [COLLECTED]"
   fi
   echo ""
@@ -887,9 +1592,11 @@ collect_robots_sitemap() {
 
 # ─── Run All Collectors ─────────────────────────────────────────────────────
 
+COLLECTED_AT=$(date -u +%Y-%m-%dT%H:%M:%SZ)
+
 {
   echo "# Collector Data: ${DOMAIN}"
-  echo "Collected: $(date -u +%Y-%m-%dT%H:%M:%SZ)"
+  echo "Collected: ${COLLECTED_AT}"
   echo "Source: bash collectors.sh (raw HTML + headers + DNS + API)"
   echo ""
   echo "---"
@@ -905,28 +1612,31 @@ collect_robots_sitemap() {
   echo ""
 } > "$OUTPUT"
 
-run_collector "Technology Stack" collect_tech_stack
-run_collector "Structured Data" collect_structured_data
-run_collector "HTML Structure" collect_html_structure
-run_collector "Social Links" collect_social_links
-run_collector "Security Headers" collect_security_headers
-run_collector "SSL Certificate" collect_ssl
-run_collector "DNS & Email Auth" collect_dns_email
-run_collector "PageSpeed" collect_pagespeed
-run_collector "Cookies" collect_cookies
-run_collector "robots.txt & Sitemap" collect_robots_sitemap
-
-# Write results
-for result in "${COLLECTOR_RESULTS[@]}"; do
-  echo "$result" >> "$OUTPUT"
+# name, function, time budget in seconds
+run_collector "Technology Stack" collect_tech_stack 30
+run_collector "Structured Data" collect_structured_data 30
+run_collector "HTML Structure" collect_html_structure 30
+run_collector "Social Links" collect_social_links 30
+run_collector "Security Headers" collect_security_headers 15
+run_collector "SSL Certificate" collect_ssl 30
+run_collector "DNS & Email Auth" collect_dns_email 30
+run_collector "PageSpeed" collect_pagespeed 45
+run_collector "Cookies" collect_cookies 15
+run_collector "robots.txt & Sitemap" collect_robots_sitemap 60
+
+wait "${COLLECTOR_PIDS[@]}" || true
+
+# Write results in collector order
+for result_file in "${COLLECTOR_FILES[@]}"; do
+  # $(<file) drops trailing newlines, matching the sequential runner's $(...)
+  echo "$(<"$result_file")" >> "$OUTPUT"
   echo "" >> "$OUTPUT"
   echo "---" >> "$OUTPUT"
   echo "" >> "$OUTPUT"
 done
 
 # Summary footer
-TOTAL_END=$(date +%s)
-TOTAL_DURATION=$((TOTAL_END - TOTAL_START))
+TOTAL_DURATION=$(seconds_since "$TOTAL_START")
 LINE_COUNT=$(wc -l < "$OUTPUT" | tr -d ' ')
 
 {
@@ -940,6 +1650,61 @@ LINE_COUNT=$(wc -l < "$OUTPUT" | tr -d ' ')
   echo "- File: ${OUTPUT}"
 } >> "$OUTPUT"
 
+# Structured sidecar: one object per collector with its status, duration
+# and recorded facts, written atomically so readers never see half a file
+{
+  printf '{\n  "domain": %s,\n  "collected_at": %s,\n  "total_seconds": %s,\n  "collectors": {' \
+    "$(json_str "$DOMAIN")" "$(json_str "$COLLECTED_AT")" "$TOTAL_DURATION"
+  sep=""
+  for result_file in "${COLLECTOR_FILES[@]}"; do
+    IFS=$'\t' read -r key name status duration < "${result_file}.status" \
+      || { key="unknown"; name=""; status="failed"; duration=0; }
+    printf '%s\n    %s: ' "$sep" "$(json_str "$key")"
+    touch "${result_file}.facts"
+    awk -F '\t' -v name="$(json_str "$name")" -v status="$(json_str "$status")" -v seconds="$duration" '
+      {
+        key = $1; val = substr($0, length($1) + 2)
+        list = sub(/\[\]$/, "", key)
+        top = key; field = ""
+        if ((dot = index(key, ".")) > 0) { top = substr(key, 1, dot - 1); field = substr(key, dot + 1) }
+        if (!(top in seen)) { seen[top] = 1; order[++n] = top }
+        if (field != "") {
+          if (!((top, field) in fseen)) { fseen[top, field] = 1; fields[top, ++nf[top]] = field }
+          fval[top, field] = val
+        } else if (list) {
+          items[top] = (nitems[top]++ ? items[top] ", " : "") val
+        } else {
+          scalar[top] = val
+        }
+      }
+      function str(s) { gsub(/\\/, "\\\\", s); gsub(/"/, "\\\"", s); return "\"" s "\"" }
+      END {
+        printf "{\n      \"name\": %s,\n      \"status\": %s,\n      \"seconds\": %s", name, status, seconds
+        for (i = 1; i <= n; i++) {
+          top = order[i]
+          printf ",\n      %s: ", str(top)
+          if (nf[top]) {
+            printf "{"
+            for (j = 1; j <= nf[top]; j++)
+              printf "%s%s: %s", (j > 1 ? ", " : ""), str(fields[top, j]), fval[top, fields[top, j]]
+            printf "}"
+          } else if (nitems[top]) {
+            printf "[%s]", items[top]
+          } else {
+            printf "%s", scalar[top]
+          }
+        }
+        printf "\n    }"
+      }
+    ' "${result_file}.facts"
+    sep=","
+  done
+  printf '\n  }\n}\n'
+} > "${JSON_OUTPUT}.tmp" && mv -f "${JSON_OUTPUT}.tmp" "$JSON_OUTPUT"
+
+PROFILE_SCOPE="run" profile_row total "$DOMAIN" "" "" "" "" "" "" "$TOTAL_DURATION" ""
+cp "$PROFILE" "${PROFILE_OUTPUT}.tmp" && mv -f "${PROFILE_OUTPUT}.tmp" "$PROFILE_OUTPUT"
+
 echo "[collectors] Complete! ${LINE_COUNT} lines written to ${OUTPUT} (${TOTAL_DURATION}s)"
 
 # Cleanup
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Marketing Orchestrator — crawl-data.md index
+
+crawl-data.md holds every crawled page as a "## PAGE: <url>" block (SKILL.md,
+Phase 1). This tool writes a sidecar, crawl-data.md.idx, with the byte offset,
+length, SHA-256 and URL of each block plus the crawl file's size, mtime and
+page and line counts. While the crawl file's size and mtime still match the
+header, consumers get counts and URLs without scanning it, and read only the
+pages they need by memory-mapping just their byte range. A missing or stale
+index is rebuilt in one pass.
+
+Index format (tab-separated, UTF-8):
+
+  crawl-index  1  <size>  <mtime_ns>  <pages>  <lines>
+  <offset>  <length>  <sha256>  <url>        one row per page, in file order
+
+A page runs from the start of its "## PAGE:" line to the next such line or
+the end of the file; the crawl header before the first page is not a page.
+The URL is the first word after "## PAGE:" (empty if there is none).
+
+Usage: python3 crawl_index.py /tmp/marketing-audit-example.com/crawl-data.md
+       python3 crawl_index.py --urls crawl-data.md
+       python3 crawl_index.py --page 2 crawl-data.md
+       python3 crawl_index.py --page https://example.com/pricing crawl-data.md
+
+Dependencies: Python 3.8+ (stdlib only)
+"""
+
+import argparse
+import hashlib
+import mmap
+import os
+import re
+import sys
+from collections import namedtuple
+from typing import Optional
+
+INDEX_SUFFIX = ".idx"
+MAGIC = "crawl-index"
+FORMAT_VERSION = "1"
+
+# Searched for anywhere (a literal prefix is much faster to find than a
+# line anchor), then kept only when nothing but blanks precedes it on its line
+PAGE_RE = re.compile(rb"## PAGE:[ \t]*(\S*)")
+
+# Newlines are counted this many bytes at a time
+COUNT_CHUNK = 1 << 16
+
+Page = namedtuple("Page", "offset length sha256 url")
+
+
+class CrawlIndex:
+    """Page table for one crawl file, as of the size and mtime it was built at."""
+
+    def __init__(self, path: str, size: int, mtime_ns: int, lines: int, pages: list):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.lines = lines
+        self.pages = pages
+        # Set by ensure_index() when the stored index could not be used
+        self.rebuilt = False
+
+    def is_fresh(self) -> bool:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return (st.st_size, st.st_mtime_ns) == (self.size, self.mtime_ns)
+
+    def find(self, url: str) -> Optional[Page]:
+        """The first page crawled from url, if any."""
+        return next((page for page in self.pages if page.url == url), None)
+
+    def read_page(self, page: Page) -> str:
+        """Text of one page, mapping only the part of the file it occupies."""
+        if not page.length:
+            return ""
+        start = page.offset - page.offset % mmap.ALLOCATIONGRANULARITY
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), page.offset + page.length - start,
+                           offset=start, access=mmap.ACCESS_READ) as mm:
+                data = mm[page.offset - start:]
+        return data.decode("utf-8", errors="replace")
+
+    def write(self):
+        """Store the index next to the crawl file (replaced atomically)."""
+        path = index_path(self.path)
+        tmp = f"{path}.tmp{os.getpid()}"
+        rows = [f"{MAGIC}\t{FORMAT_VERSION}\t{self.size}\t{self.mtime_ns}\t{len(self.pages)}\t{self.lines}\n"]
+        rows.extend(f"{p.offset}\t{p.length}\t{p.sha256}\t{p.url}\n" for p in self.pages)
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(rows)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+
+def index_path(crawl_path: str) -> str:
+    return f"{crawl_path}{INDEX_SUFFIX}"
+
+
+def build_index(crawl_path: str) -> CrawlIndex:
+    """Scan a crawl file once: page offsets, lengths, hashes, URLs and line count."""
+    crawl_path = str(crawl_path)
+    with open(crawl_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if not st.st_size:
+            return CrawlIndex(crawl_path, 0, st.st_mtime_ns, 0, [])
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            lines = sum(mm[i:i + COUNT_CHUNK].count(b"\n") for i in range(0, size, COUNT_CHUNK))
+            if mm[size - 1:] != b"\n":
+                lines += 1
+            starts = []
+            for m in PAGE_RE.finditer(mm):
+                line_start = mm.rfind(b"\n", 0, m.start()) + 1
+                if not mm[line_start:m.start()].strip(b" \t"):
+                    starts.append((line_start, m.group(1)))
+            pages = []
+            with memoryview(mm) as view:
+                for i, (offset, url) in enumerate(starts):
+                    end = starts[i + 1][0] if i + 1 < len(starts) else size
+                    pages.append(Page(
+                        offset, end - offset, hashlib.sha256(view[offset:end]).hexdigest(),
+                        url.decode("utf-8", errors="replace"),
+                    ))
+    return CrawlIndex(crawl_path, size, st.st_mtime_ns, lines, pages)
+
+
+def load_index(crawl_path: str) -> Optional[CrawlIndex]:
+    """The stored index for a crawl file, or None if missing, unreadable or stale."""
+    crawl_path = str(crawl_path)
+    try:
+        with open(index_path(crawl_path), encoding="utf-8") as f:
+            header = f.readline().rstrip("\n").split("\t")
+            if len(header) != 6 or header[:2] != [MAGIC, FORMAT_VERSION]:
+                return None
+            size, mtime_ns, count, lines = (int(v) for v in header[2:])
+            pages = []
+            for row in f:
+                offset, length, sha256, url = row.rstrip("\n").split("\t", 3)
+                pages.append(Page(int(offset), int(length), sha256, url))
+    except (OSError, UnicodeDecodeError, ValueError):
+        return None
+    index = CrawlIndex(crawl_path, size, mtime_ns, lines, pages)
+    if len(pages) != count or not index.is_fresh():
+        return None
+    return index
+
+
+def ensure_index(crawl_path: str) -> CrawlIndex:
+    """load_index(), rebuilding and storing the index if it is missing or stale.
+
+    An index is only stored if the crawl file did not change while it was
+    being built, and failing to store it is not an error.
+    """
+    index = load_index(crawl_path)
+    if index is None:
+        index = build_index(crawl_path)
+        index.rebuilt = True
+        if index.is_fresh():
+            try:
+                index.write()
+            except OSError:
+                pass
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the page index of a crawl-data.md file.")
+    parser.add_argument("crawl", help="path to crawl-data.md")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument("--urls", action="store_true", help="print page URLs, one per line, in crawl order")
+    query.add_argument("--page", metavar="N|URL", help="print one page, by 1-based number or URL")
+    args = parser.parse_args()
+
+    try:
+        index = ensure_index(args.crawl)
+    except OSError as e:
+        print(f"Error: {args.crawl}: {e.strerror or e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.urls:
+        sys.stdout.write("".join(f"{page.url}\n" for page in index.pages if page.url))
+    elif args.page:
+        if args.page.isdigit():
+            n = int(args.page)
+            page = index.pages[n - 1] if 1 <= n <= len(index.pages) else None
+        else:
+            page = index.find(args.page)
+        if page is None:
+            print(f"Error: no page {args.page} in {args.crawl}", file=sys.stderr)
+            sys.exit(1)
+        sys.stdout.write(index.read_page(page))
+    else:
+        state = "rebuilt" if index.rebuilt else "up to date"
+        print(f"{index_path(args.crawl)}: {len(index.pages)} pages, {index.lines} lines ({state})")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,38 @@
 Monitors the audit directory and displays real-time progress.
 Launched automatically by the orchestrator in a new terminal window.
 
+Redraws when something in the audit directory changes (inotify on Linux,
+stat polling elsewhere). Parsed files are cached by (inode, mtime, size), so
+only files that actually changed are read again.
+
 Usage: python3 dashboard.py /tmp/marketing-audit-example.com
+       python3 dashboard.py --poll /tmp/marketing-audit-example.com
+       python3 dashboard.py --fleet /tmp     # every marketing-audit-* dir
+       python3 dashboard.py --ndjson --fleet /tmp   # machine-readable stream
+       python3 dashboard.py --serve 8765 --fleet /tmp # HTTP + server-sent events
 """
 
+import argparse
+import ctypes
+import ctypes.util
 import json
 import os
 import re
+import select
+import signal
+import struct
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
 from pathlib import Path
 
+from cmo_review import normalize_name, parse_verdicts
+from crawl_index import build_index, load_index
+
 # ANSI colors
 class C:
     RESET = "\033[0m"
@@ -66,6 +87,49 @@ def clear_screen():
     print("\033[2J\033[H", end="")
 
 
+class Screen:
+    """Flicker-free terminal output.
+
+    Keeps the previous frame and rewrites only the rows that changed, in one
+    buffered write. An unchanged frame writes nothing at all.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._last = None
+        if hasattr(signal, "SIGWINCH"):
+            # A resize can reflow what is on screen; repaint everything.
+            signal.signal(signal.SIGWINCH, lambda *_: self.invalidate())
+
+    def invalidate(self):
+        self._last = None
+
+    def draw(self, lines):
+        """Show a frame (list of lines). Returns True if anything was written."""
+        last = self._last
+        if lines == last:
+            return False
+        if last is None:
+            out = ["\033[?25l\033[2J"]  # hide cursor, clear once
+            last = []
+        else:
+            out = []
+        for row, line in enumerate(lines):
+            if row >= len(last) or last[row] != line:
+                out.append(f"\033[{row + 1};1H{line}\033[K")
+        if len(lines) < len(last):
+            out.append(f"\033[{len(lines) + 1};1H\033[J")
+        out.append(f"\033[{len(lines) + 1};1H")
+        self.stream.write("".join(out))
+        self.stream.flush()
+        self._last = list(lines)
+        return True
+
+    def close(self):
+        self.stream.write("\033[?25h")
+        self.stream.flush()
+
+
 def read_json(path):
     try:
         with open(path) as f:
@@ -74,22 +138,30 @@ def read_json(path):
         return None
 
 
-def detect_phase(audit_dir):
-    """Detect current phase from filesystem state."""
+def detect_phase(audit_dir, agents=None):
+    """Detect current phase from filesystem state.
+
+    agents is get_agent_status() for the directory, if already taken; files
+    that vanish while being looked at (reports replaced by rename) are
+    skipped.
+    """
     d = Path(audit_dir)
+    if agents is None:
+        agents = get_agent_status(audit_dir)
 
     if (d / "FULL-REPORT.md").exists():
         return "complete"
-    if (d / "review" / "cmo-review.md").exists():
+    try:
+        review_time = datetime.fromtimestamp((d / "review" / "cmo-review.md").stat().st_mtime)
+    except OSError:
+        review_time = None
+    if review_time is not None:
         # Check if remediation is happening
-        agents = list((d / "agents").glob("*.md")) if (d / "agents").exists() else []
-        review_time = (d / "review" / "cmo-review.md").stat().st_mtime
-        newer_agents = [a for a in agents if a.stat().st_mtime > review_time]
+        newer_agents = [a for a in agents if a["time"] > review_time]
         if newer_agents:
             return "remediation"
         return "quality_gate"
 
-    agents = list((d / "agents").glob("*.md")) if (d / "agents").exists() else []
     handoff2 = (d / "handoffs" / "batch23-summary.md").exists()
     handoff1 = (d / "handoffs" / "batch1-summary.md").exists()
 
@@ -124,39 +196,111 @@ def parse_agent_report(path):
 
 
 def parse_cmo_review(path):
-    """Extract pass/fail verdicts from CMO review."""
-    results = {}
+    """Extract pass/fail verdicts from CMO review, keyed by normalized name."""
     try:
-        text = path.read_text()
-        # Look for table rows with PASS/FAIL
-        for line in text.split("\n"):
-            if "PASS" in line or "FAIL" in line:
-                parts = [p.strip() for p in line.split("|") if p.strip()]
-                if len(parts) >= 8:
-                    name = parts[0].strip()
-                    verdict = parts[-1].strip()
-                    try:
-                        total = int(parts[-2].strip().split("/")[0])
-                    except (ValueError, IndexError):
-                        total = 0
-                    results[name] = {"verdict": verdict, "total": total}
-    except Exception:
-        pass
-    return results
+        return parse_verdicts(path.read_text())
+    except (OSError, UnicodeDecodeError):
+        return {}
+
 
+def parse_context(path):
+    """Extract business type and industry from context.md."""
+    ctx = path.read_text()
+    btype_match = re.search(r"Type:\s*(.+)", ctx)
+    industry_match = re.search(r"Industry:\s*(.+)", ctx)
+    return {
+        "type": btype_match.group(1).strip() if btype_match else None,
+        "industry": industry_match.group(1).strip() if industry_match else None,
+    }
 
-def get_agent_status(audit_dir):
+
+def parse_crawl_data(path):
+    """Count crawled pages and lines in crawl-data.md.
+
+    Read from the crawl_index.py sidecar while it matches the file; otherwise
+    the file is scanned once through a memory map (the dashboard never
+    writes the index itself).
+    """
+    index = load_index(path) or build_index(path)
+    return {"pages": len(index.pages), "lines": index.lines}
+
+
+def count_lines(path):
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def parse_collectors_json(path):
+    """Summarize per-collector outcomes from the collectors-data.json sidecar."""
+    data = read_json(path)
+    if not isinstance(data, dict):
+        return None
+    collectors = data.get("collectors", {})
+    return {
+        "total": len(collectors),
+        "ok": sum(1 for c in collectors.values() if c.get("status") == "ok"),
+        "failed": [c.get("name", key) for key, c in collectors.items() if c.get("status") != "ok"],
+    }
+
+
+class ParseCache:
+    """Parsed file results, re-parsed only when (inode, mtime, size) changes.
+
+    A lookup on an unchanged file costs one stat() call.
+    """
+
+    def __init__(self):
+        self._entries = {}  # path -> (signature, result)
+
+    def get(self, path, parser, st=None):
+        """Return parser(path), or None if the file does not exist."""
+        key = str(path)
+        if st is None:
+            try:
+                st = os.stat(key)
+            except OSError:
+                self._entries.pop(key, None)
+                return None
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        try:
+            result = parser(Path(key))
+        except (OSError, ValueError):
+            # Gone, or caught half-written (UnicodeDecodeError); the next
+            # change to the file brings it back
+            return None
+        self._entries[key] = (signature, result)
+        return result
+
+    def forget(self, directory):
+        """Drop every entry under a directory that no longer exists."""
+        prefix = str(directory).rstrip(os.sep) + os.sep
+        for key in [k for k in self._entries if k.startswith(prefix)]:
+            del self._entries[key]
+
+
+PARSE_CACHE = ParseCache()
+
+
+def get_agent_status(audit_dir, cache=None):
     """Get status of all agents."""
+    cache = cache or PARSE_CACHE
     agents_dir = Path(audit_dir) / "agents"
     if not agents_dir.exists():
         return []
 
     agents = []
     for f in sorted(agents_dir.glob("*.md")):
+        try:
+            st = f.stat()
+        except OSError:
+            continue
         name = f.stem
-        score, max_score = parse_agent_report(f)
-        size = f.stat().st_size
-        mtime = datetime.fromtimestamp(f.stat().st_mtime)
+        score, max_score = cache.get(f, parse_agent_report, st) or (None, None)
+        size = st.st_size
+        mtime = datetime.fromtimestamp(st.st_mtime)
 
         # Detect if report is truncated/empty
         status = "complete"
@@ -176,6 +320,182 @@ def get_agent_status(audit_dir):
     return agents
 
 
+# Linux inotify constants (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+# Agents stream their reports to disk, so one logical update arrives as a
+# burst of IN_MODIFY events. Collect the whole burst before re-rendering.
+DEBOUNCE = 0.1
+
+
+class InotifyWatcher:
+    """Report changed paths under watched directories using Linux inotify."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._wds = {}  # watch descriptor -> (directory, recursive)
+
+    def add(self, path, recursive=True):
+        """Watch a directory (and by default every directory below it)."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            return
+        self._wds[wd] = (str(path), recursive)
+        if recursive:
+            # The directory may already be gone again; its IN_IGNORED
+            # event drops the watch.
+            try:
+                with os.scandir(path) as entries:
+                    subdirs = [e.path for e in entries if e.is_dir(follow_symlinks=False)]
+            except OSError:
+                return
+            for subdir in subdirs:
+                self.add(subdir, recursive=True)
+
+    def fileno(self):
+        return self._fd
+
+    def read_changes(self):
+        """Drain pending events without blocking; return changed paths."""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped; report every watched directory.
+                    changed.update(d for d, _ in self._wds.values())
+                    continue
+                if wd not in self._wds:
+                    continue
+                directory, recursive = self._wds[wd]
+                if mask & IN_IGNORED:
+                    del self._wds[wd]
+                    continue
+                path = os.path.join(directory, os.fsdecode(name)) if name else directory
+                changed.add(path)
+                if recursive and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self.add(path, recursive=True)
+                    # Files written before the watch existed would be missed.
+                    try:
+                        changed.update(os.path.join(path, n) for n in os.listdir(path))
+                    except OSError:
+                        pass  # removed or renamed before we got to it
+        return changed
+
+    def wait(self, timeout, wake_fds=()):
+        """Block until something changes, a wake fd is readable, or timeout."""
+        ready, _, _ = select.select([self._fd, *wake_fds], [], [], timeout)
+        if self._fd not in ready:
+            return set()
+        changed = self.read_changes()
+        while select.select([self._fd], [], [], DEBOUNCE)[0]:
+            changed |= self.read_changes()
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable fallback: detect changes by comparing stat() snapshots."""
+
+    def __init__(self, interval=2.0):
+        self.interval = interval
+        self._roots = {}  # directory -> recursive
+        self._snapshot = {}
+
+    def add(self, path, recursive=True):
+        self._roots[str(path)] = recursive
+        self._snapshot.update(self._scan(str(path), recursive))
+
+    def _scan(self, root, recursive):
+        entries = {}
+        try:
+            it = os.scandir(root)
+        except OSError:
+            return entries
+        with it:
+            for entry in it:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries[entry.path] = (st.st_ino, st.st_mtime_ns, st.st_size)
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    entries.update(self._scan(entry.path, recursive))
+        return entries
+
+    def fileno(self):
+        return None
+
+    def read_changes(self):
+        snapshot = {}
+        for root, recursive in self._roots.items():
+            snapshot.update(self._scan(root, recursive))
+        old = self._snapshot
+        self._snapshot = snapshot
+        changed = {p for p in snapshot.keys() | old.keys() if snapshot.get(p) != old.get(p)}
+        return changed
+
+    def wait(self, timeout, wake_fds=()):
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = self.read_changes()
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            delay = min(self.interval, remaining)
+            if wake_fds:
+                if select.select(list(wake_fds), [], [], delay)[0]:
+                    return self.read_changes()
+            else:
+                time.sleep(delay)
+
+    def close(self):
+        pass
+
+
+def make_watcher(poll=False, interval=2.0):
+    """Use inotify where available, stat polling everywhere else."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(interval)
+
+
 def format_bar(value, max_val, width=20):
     """Create a progress bar."""
     if max_val == 0:
@@ -199,21 +519,65 @@ def format_score_color(score, max_score):
     return f"{color}{score}/{max_score}{C.RESET}"
 
 
-def render(audit_dir, start_time):
-    clear_screen()
+def collect_status(audit_dir, cache=None):
+    """Snapshot everything the dashboard shows for one audit directory.
+
+    All filesystem access happens here so the view can be redrawn (e.g. to
+    advance the elapsed clock) without touching the disk.
+    """
+    cache = cache or PARSE_CACHE
     d = Path(audit_dir)
-    domain = d.name.replace("marketing-audit-", "")
+    agents = get_agent_status(audit_dir, cache)
+    phase = detect_phase(audit_dir, agents)
+
+    context = cache.get(d / "context.md", parse_context)
+    crawl = cache.get(d / "crawl-data.md", parse_crawl_data)
+    collectors_lines = cache.get(d / "collectors-data.md", count_lines)
+    collectors = cache.get(d / "collectors-data.json", parse_collectors_json)
+
+    cmo_path = d / "review" / "cmo-review.md"
+    cmo_results = cache.get(cmo_path, parse_cmo_review)
+
+    report_path = d / "FULL-REPORT.md"
+    try:
+        report_size = report_path.stat().st_size
+    except OSError:
+        report_size = None
+
+    return {
+        "audit_dir": str(audit_dir),
+        "domain": d.name.replace("marketing-audit-", ""),
+        "phase": phase,
+        "business_type": context.get("type") if context else None,
+        "industry": context.get("industry") if context else None,
+        "crawl": crawl,
+        "collectors_lines": collectors_lines,
+        "collectors": collectors,
+        "agents": agents,
+        "cmo": cmo_results,
+        "handoffs": {
+            "batch1": (d / "handoffs" / "batch1-summary.md").exists(),
+            "batch23": (d / "handoffs" / "batch23-summary.md").exists(),
+        },
+        "report": {"path": str(report_path), "size": report_size} if report_size is not None else None,
+    }
+
+
+def render(status, start_time, footer=None):
+    """Build the detailed view for one audit as a list of lines."""
+    lines = []
+    domain = status["domain"]
     elapsed = time.time() - start_time
     mins, secs = divmod(int(elapsed), 60)
 
     # Header
-    print(f"{C.BOLD}{C.CYAN}╔{'═' * 68}╗{C.RESET}")
-    print(f"{C.BOLD}{C.CYAN}║{C.RESET}  {C.BOLD}MARKETING ORCHESTRATOR{C.RESET} — {C.WHITE}{domain}{C.RESET}{' ' * max(0, 43 - len(domain) - 1)}{C.CYAN}║{C.RESET}")
-    print(f"{C.BOLD}{C.CYAN}╚{'═' * 68}╝{C.RESET}")
-    print()
+    lines.append(f"{C.BOLD}{C.CYAN}╔{'═' * 68}╗{C.RESET}")
+    lines.append(f"{C.BOLD}{C.CYAN}║{C.RESET}  {C.BOLD}MARKETING ORCHESTRATOR{C.RESET} — {C.WHITE}{domain}{C.RESET}{' ' * max(0, 43 - len(domain) - 1)}{C.CYAN}║{C.RESET}")
+    lines.append(f"{C.BOLD}{C.CYAN}╚{'═' * 68}╝{C.RESET}")
+    lines.append("")
 
     # Phase + timing
-    phase = detect_phase(audit_dir)
+    phase = status["phase"]
     phase_label = PHASE_NAMES.get(phase, phase.upper())
 
     if phase == "complete":
@@ -229,48 +593,42 @@ def render(audit_dir, start_time):
     else:
         phase_display = f"{C.BG_BLUE}{C.WHITE} {phase_label} {C.RESET}"
 
-    print(f"  {C.DIM}Phase:{C.RESET}   {phase_display}")
-    print(f"  {C.DIM}Elapsed:{C.RESET} {C.WHITE}{mins:02d}:{secs:02d}{C.RESET}")
+    lines.append(f"  {C.DIM}Phase:{C.RESET}   {phase_display}")
+    lines.append(f"  {C.DIM}Elapsed:{C.RESET} {C.WHITE}{mins:02d}:{secs:02d}{C.RESET}")
 
     # Context info
-    context_path = d / "context.md"
-    if context_path.exists():
-        ctx = context_path.read_text()
-        btype_match = re.search(r"Type:\s*(.+)", ctx)
-        industry_match = re.search(r"Industry:\s*(.+)", ctx)
-        if btype_match:
-            print(f"  {C.DIM}Type:{C.RESET}    {C.WHITE}{btype_match.group(1).strip()}{C.RESET}")
-        if industry_match:
-            print(f"  {C.DIM}Industry:{C.RESET}{C.WHITE} {industry_match.group(1).strip()}{C.RESET}")
+    if status["business_type"]:
+        lines.append(f"  {C.DIM}Type:{C.RESET}    {C.WHITE}{status['business_type']}{C.RESET}")
+    if status["industry"]:
+        lines.append(f"  {C.DIM}Industry:{C.RESET}{C.WHITE} {status['industry']}{C.RESET}")
 
     # Crawl status
-    crawl_path = d / "crawl-data.md"
-    if crawl_path.exists():
-        crawl_text = crawl_path.read_text()
-        page_count = crawl_text.count("## PAGE:")
-        crawl_lines = len(crawl_text.splitlines())
-        print(f"  {C.DIM}Crawled:{C.RESET} {C.GREEN}{page_count} pages{C.RESET} ({crawl_lines:,} lines)")
+    crawl = status["crawl"]
+    if crawl is not None:
+        lines.append(f"  {C.DIM}Crawled:{C.RESET} {C.GREEN}{crawl['pages']} pages{C.RESET} ({crawl['lines']:,} lines)")
 
     # Collectors status
-    collectors_path = d / "collectors-data.md"
-    if collectors_path.exists():
-        collectors_lines = len(collectors_path.read_text().splitlines())
-        print(f"  {C.DIM}Collect:{C.RESET} {C.GREEN}10 collectors{C.RESET} ({collectors_lines:,} lines)")
+    collectors = status["collectors"]
+    if status["collectors_lines"] is not None and collectors:
+        color = C.GREEN if not collectors["failed"] else C.YELLOW
+        line = f"  {C.DIM}Collect:{C.RESET} {color}{collectors['ok']}/{collectors['total']} collectors{C.RESET} ({status['collectors_lines']:,} lines)"
+        if collectors["failed"]:
+            line += f" {C.DIM}failed: {', '.join(collectors['failed'])}{C.RESET}"
+        lines.append(line)
+    elif status["collectors_lines"] is not None:
+        lines.append(f"  {C.DIM}Collect:{C.RESET} {C.GREEN}10 collectors{C.RESET} ({status['collectors_lines']:,} lines)")
     elif phase == "collectors":
-        print(f"  {C.DIM}Collect:{C.RESET} {C.YELLOW}running...{C.RESET}")
+        lines.append(f"  {C.DIM}Collect:{C.RESET} {C.YELLOW}running...{C.RESET}")
 
-    print()
+    lines.append("")
 
     # Agent status table
-    agents = get_agent_status(audit_dir)
-    cmo_results = {}
-    cmo_path = d / "review" / "cmo-review.md"
-    if cmo_path.exists():
-        cmo_results = parse_cmo_review(cmo_path)
+    agents = status["agents"]
+    cmo_results = status["cmo"] or {}
 
     if agents:
-        print(f"  {C.BOLD}{'Agent':<28} {'Model':<8} {'Score':<12} {'Size':<10} {'Gate':<8}{C.RESET}")
-        print(f"  {C.DIM}{'─' * 66}{C.RESET}")
+        lines.append(f"  {C.BOLD}{'Agent':<28} {'Model':<8} {'Score':<12} {'Size':<10} {'Gate':<8}{C.RESET}")
+        lines.append(f"  {C.DIM}{'─' * 66}{C.RESET}")
 
         for agent in agents:
             name = agent["name"]
@@ -287,8 +645,8 @@ def render(audit_dir, start_time):
 
             # CMO gate result
             gate = ""
-            if name in cmo_results:
-                v = cmo_results[name]
+            v = cmo_results.get(normalize_name(name))
+            if v is not None:
                 if v["verdict"] == "PASS":
                     gate = f"{C.GREEN}PASS {v['total']}/25{C.RESET}"
                 else:
@@ -302,9 +660,9 @@ def render(audit_dir, start_time):
             else:
                 icon = f"{C.YELLOW}●{C.RESET}"
 
-            print(f"  {icon} {name:<26} {model_display:<17} {score_display:<21} {size_display:<19} {gate}")
+            lines.append(f"  {icon} {name:<26} {model_display:<17} {score_display:<21} {size_display:<19} {gate}")
 
-        print(f"  {C.DIM}{'─' * 66}{C.RESET}")
+        lines.append(f"  {C.DIM}{'─' * 66}{C.RESET}")
 
         # Summary stats
         complete = sum(1 for a in agents if a["status"] == "complete")
@@ -312,76 +670,581 @@ def render(audit_dir, start_time):
         scores = [a["score"] for a in agents if a["score"] is not None]
         avg = sum(scores) / len(scores) if scores else 0
 
-        print(f"  {C.DIM}Agents:{C.RESET} {C.GREEN}{complete} complete{C.RESET}", end="")
+        summary = f"  {C.DIM}Agents:{C.RESET} {C.GREEN}{complete} complete{C.RESET}"
         if truncated:
-            print(f" {C.RED}{truncated} truncated{C.RESET}", end="")
-        print(f"  {C.DIM}|{C.RESET}  {C.DIM}Avg Score:{C.RESET} {C.WHITE}{avg:.0f}{C.RESET}")
+            summary += f" {C.RED}{truncated} truncated{C.RESET}"
+        summary += f"  {C.DIM}|{C.RESET}  {C.DIM}Avg Score:{C.RESET} {C.WHITE}{avg:.0f}{C.RESET}"
+        lines.append(summary)
 
     else:
-        print(f"  {C.DIM}No agent reports yet...{C.RESET}")
+        lines.append(f"  {C.DIM}No agent reports yet...{C.RESET}")
 
-    print()
+    lines.append("")
 
     # Handoff status
-    h1 = d / "handoffs" / "batch1-summary.md"
-    h23 = d / "handoffs" / "batch23-summary.md"
-    if h1.exists() or h23.exists():
-        print(f"  {C.BOLD}Warm Handoffs{C.RESET}")
-        if h1.exists():
-            print(f"  {C.GREEN}●{C.RESET} Batch 1 → 2+3 handoff ready")
-        if h23.exists():
-            print(f"  {C.GREEN}●{C.RESET} Batch 2+3 → 4 handoff ready")
-        print()
+    handoffs = status["handoffs"]
+    if handoffs["batch1"] or handoffs["batch23"]:
+        lines.append(f"  {C.BOLD}Warm Handoffs{C.RESET}")
+        if handoffs["batch1"]:
+            lines.append(f"  {C.GREEN}●{C.RESET} Batch 1 → 2+3 handoff ready")
+        if handoffs["batch23"]:
+            lines.append(f"  {C.GREEN}●{C.RESET} Batch 2+3 → 4 handoff ready")
+        lines.append("")
 
     # Quality gate
-    if cmo_path.exists():
+    if status["cmo"] is not None:
         passed = sum(1 for v in cmo_results.values() if v.get("verdict") == "PASS")
         failed = sum(1 for v in cmo_results.values() if v.get("verdict") == "FAIL")
         total = passed + failed
-        print(f"  {C.BOLD}Quality Gate{C.RESET}")
+        lines.append(f"  {C.BOLD}Quality Gate{C.RESET}")
         if total > 0:
-            print(f"  {C.GREEN}PASS: {passed}{C.RESET}  {C.RED}FAIL: {failed}{C.RESET}  ({passed}/{total} = {passed/total*100:.0f}%)")
-        print()
+            lines.append(f"  {C.GREEN}PASS: {passed}{C.RESET}  {C.RED}FAIL: {failed}{C.RESET}  ({passed}/{total} = {passed/total*100:.0f}%)")
+        lines.append("")
 
     # Final report
-    report_path = d / "FULL-REPORT.md"
-    if report_path.exists():
-        report_size = report_path.stat().st_size / 1024
-        print(f"  {C.BG_GREEN}{C.WHITE} REPORT READY {C.RESET}")
-        print(f"  {C.GREEN}{report_path} ({report_size:.1f}KB){C.RESET}")
-        print()
+    report = status["report"]
+    if report is not None:
+        report_size = report["size"] / 1024
+        lines.append(f"  {C.BG_GREEN}{C.WHITE} REPORT READY {C.RESET}")
+        lines.append(f"  {C.GREEN}{report['path']} ({report_size:.1f}KB){C.RESET}")
+        lines.append("")
 
     # Footer
-    print(f"  {C.DIM}Watching: {audit_dir}{C.RESET}")
-    print(f"  {C.DIM}Ctrl+C to close dashboard (orchestrator keeps running){C.RESET}")
+    lines.append(f"  {C.DIM}Watching: {status['audit_dir']}{C.RESET}")
+    lines.append(f"  {C.DIM}{footer or 'Ctrl+C to close dashboard (orchestrator keeps running)'}{C.RESET}")
+    return lines
+
+
+def summarize_status(status):
+    """Reduce a collect_status() snapshot to one fleet summary row."""
+    agents = status["agents"]
+    scores = [a["score"] for a in agents if a["score"] is not None]
+    verdicts = (status["cmo"] or {}).values()
+    passed = sum(1 for v in verdicts if v.get("verdict") == "PASS")
+    gated = sum(1 for v in verdicts if v.get("verdict") in ("PASS", "FAIL"))
+    return {
+        "domain": status["domain"],
+        "phase": status["phase"],
+        "agents": len(agents),
+        "avg_score": sum(scores) / len(scores) if scores else None,
+        "gate_passed": passed,
+        "gate_total": gated,
+        "gate_rate": passed / gated if gated else None,
+    }
+
+
+def status_to_json(status):
+    """JSON-serialisable form of a collect_status() snapshot."""
+    cmo = status["cmo"]
+    gate = None
+    if cmo is not None:
+        summary = summarize_status(status)
+        gate = {
+            "verdicts": cmo,
+            "passed": summary["gate_passed"],
+            "failed": summary["gate_total"] - summary["gate_passed"],
+            "pass_rate": summary["gate_rate"],
+        }
+    started = session_start(status["audit_dir"], None)
+    return {
+        "audit_dir": status["audit_dir"],
+        "domain": status["domain"],
+        "phase": status["phase"],
+        "phase_label": PHASE_NAMES.get(status["phase"], status["phase"].upper()),
+        "started_at": datetime.fromtimestamp(started, timezone.utc).isoformat() if started else None,
+        "business_type": status["business_type"],
+        "industry": status["industry"],
+        "crawl": status["crawl"],
+        "collectors_lines": status["collectors_lines"],
+        "collectors": status["collectors"],
+        "agents": [
+            {
+                "name": a["name"],
+                "model": a["model"],
+                "score": a["score"],
+                "max_score": a["max_score"],
+                "status": a["status"],
+                "truncated": a["status"] == "truncated",
+                "size": a["size"],
+                "updated_at": a["time"].astimezone(timezone.utc).isoformat(),
+                "gate": (cmo or {}).get(normalize_name(a["name"])),
+            }
+            for a in status["agents"]
+        ],
+        "gate": gate,
+        "handoffs": status["handoffs"],
+        "report": status["report"],
+    }
+
+
+AUDIT_PREFIX = "marketing-audit-"
+
+
+class Fleet:
+    """Every marketing-audit-* directory under a root.
+
+    All audits share one watcher and one parse cache, and a change only
+    re-collects the audit it happened in.
+    """
+
+    def __init__(self, root, watcher, cache=None):
+        self.root = os.path.abspath(root)
+        self.watcher = watcher
+        self.cache = cache or PARSE_CACHE
+        self.audits = {}  # audit dir -> collect_status() snapshot
+        watcher.add(self.root, recursive=False)
+        self.rescan()
+
+    def rescan(self):
+        """Pick up new audit directories and drop deleted ones."""
+        found = set()
+        for entry in os.scandir(self.root):
+            if entry.name.startswith(AUDIT_PREFIX) and entry.is_dir():
+                found.add(entry.path)
+        for path in sorted(found - self.audits.keys()):
+            self.watcher.add(path)
+            self.audits[path] = collect_status(path, self.cache)
+        for path in self.audits.keys() - found:
+            del self.audits[path]
+            self.cache.forget(path)
+
+    def apply(self, changed):
+        """Refresh the audits touched by a change set. True if any were."""
+        dirty = set()
+        rescan = False
+        for path in changed:
+            rel = os.path.relpath(path, self.root)
+            if rel.startswith(os.pardir):
+                continue
+            top = rel.split(os.sep, 1)[0]
+            if not top.startswith(AUDIT_PREFIX):
+                continue
+            audit = os.path.join(self.root, top)
+            if os.sep not in rel or audit not in self.audits:
+                rescan = True
+            dirty.add(audit)
+        if rescan:
+            self.rescan()
+        for audit in dirty & self.audits.keys():
+            self.audits[audit] = collect_status(audit, self.cache)
+        return bool(dirty)
+
+    def ordered(self):
+        return sorted(self.audits)
+
+
+def render_fleet(fleet, selection=""):
+    """Build the fleet summary view as a list of lines."""
+    lines = []
+    lines.append(f"{C.BOLD}{C.CYAN}╔{'═' * 68}╗{C.RESET}")
+    title = f"{len(fleet.audits)} audits"
+    lines.append(f"{C.BOLD}{C.CYAN}║{C.RESET}  {C.BOLD}MARKETING ORCHESTRATOR{C.RESET} — {C.WHITE}{title}{C.RESET}{' ' * max(0, 43 - len(title) - 1)}{C.CYAN}║{C.RESET}")
+    lines.append(f"{C.BOLD}{C.CYAN}╚{'═' * 68}╝{C.RESET}")
+    lines.append("")
+
+    audits = fleet.ordered()
+    if not audits:
+        lines.append(f"  {C.DIM}No {AUDIT_PREFIX}* directories yet...{C.RESET}")
+    else:
+        lines.append(f"  {C.BOLD}{'#':>3} {'Domain':<26} {'Phase':<20} {'Agents':>6} {'Avg':>5} {'Gate':>10}{C.RESET}")
+        lines.append(f"  {C.DIM}{'─' * 74}{C.RESET}")
+        for i, audit in enumerate(audits, 1):
+            row = summarize_status(fleet.audits[audit])
+            phase = PHASE_NAMES.get(row["phase"], row["phase"].upper())
+            phase_color = C.GREEN if row["phase"] == "complete" else C.YELLOW if row["phase"] == "remediation" else C.BLUE
+            avg = f"{row['avg_score']:.0f}" if row["avg_score"] is not None else "--"
+            if row["gate_rate"] is None:
+                gate = f"{C.DIM}{'--':>10}{C.RESET}"
+            else:
+                gate_color = C.GREEN if row["gate_rate"] >= 0.75 else C.YELLOW if row["gate_rate"] >= 0.5 else C.RED
+                gate = f"{gate_color}{row['gate_passed']:>3}/{row['gate_total']:<2} {row['gate_rate'] * 100:3.0f}%{C.RESET}"
+            lines.append(f"  {i:>3} {row['domain'][:26]:<26} {phase_color}{phase[:20]:<20}{C.RESET} {row['agents']:>6} {avg:>5} {gate}")
+        lines.append(f"  {C.DIM}{'─' * 74}{C.RESET}")
+
+    lines.append("")
+    lines.append(f"  {C.DIM}Watching: {fleet.root}/{AUDIT_PREFIX}*{C.RESET}")
+    if selection:
+        lines.append(f"  {C.WHITE}Open audit #{selection}_{C.RESET}")
+    else:
+        lines.append(f"  {C.DIM}Type a number + Enter for details, q to quit{C.RESET}")
+    return lines
+
+
+class Keyboard:
+    """Unbuffered single-key input while stdin is a terminal."""
+
+    def __init__(self):
+        self.fd = sys.stdin.fileno() if sys.stdin.isatty() else None
+        self._saved = None
+
+    def __enter__(self):
+        if self.fd is not None:
+            import termios
+            import tty
+            self._saved = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+        return self
+
+    def __exit__(self, *exc):
+        if self._saved is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._saved)
+
+    @property
+    def fds(self):
+        return (self.fd,) if self.fd is not None else ()
+
+    def read(self):
+        """Return any keys typed so far without blocking."""
+        if self.fd is None or not select.select([self.fd], [], [], 0)[0]:
+            return ""
+        return os.read(self.fd, 64).decode(errors="ignore")
+
+
+def session_start(audit_dir, default):
+    """An audit's clock starts when its context.md was written."""
+    try:
+        return os.path.getmtime(os.path.join(audit_dir, "context.md"))
+    except OSError:
+        return default
+
+
+def run_fleet(root, watcher, interval, screen):
+    fleet = Fleet(root, watcher)
+    started = time.time()
+    selected = None
+    typed = ""
+    with Keyboard() as keyboard:
+        while True:
+            if selected in fleet.audits:
+                screen.draw(render(
+                    fleet.audits[selected], session_start(selected, started),
+                    footer="b to return to the fleet view, q to quit",
+                ))
+            else:
+                selected = None
+                screen.draw(render_fleet(fleet, typed))
+
+            changed = watcher.wait(timeout=interval, wake_fds=keyboard.fds)
+            if changed:
+                fleet.apply(changed)
+
+            for key in keyboard.read():
+                if key in "qQ":
+                    return
+                if selected is not None:
+                    if key in "bB\x1b\x7f":
+                        selected = None
+                elif key.isdigit():
+                    typed += key
+                elif key == "\x7f":
+                    typed = typed[:-1]
+                elif key in "\r\n" and typed:
+                    audits = fleet.ordered()
+                    index = int(typed) - 1
+                    if 0 <= index < len(audits):
+                        selected = audits[index]
+                    typed = ""
+                elif key == "\x1b":
+                    typed = ""
+
+
+def emit(record):
+    sys.stdout.write(json.dumps(record) + "\n")
+    sys.stdout.flush()
+
+
+def iter_snapshots(audit_dir, fleet_root, watcher):
+    """Yield {audit_dir: status_to_json(...)} now and after every change."""
+    if fleet_root:
+        fleet = Fleet(fleet_root, watcher)
+        while True:
+            yield {a: status_to_json(fleet.audits[a]) for a in fleet.ordered()}
+            while not fleet.apply(watcher.wait(timeout=60)):
+                pass
+    else:
+        if not os.path.isdir(audit_dir):
+            print(f"Waiting for {audit_dir}...", file=sys.stderr)
+            while not os.path.isdir(audit_dir):
+                time.sleep(0.5)
+        watcher.add(audit_dir)
+        while True:
+            yield {audit_dir: status_to_json(collect_status(audit_dir))}
+            while not watcher.wait(timeout=60):
+                pass
+
+
+def run_stream(audit_dir, fleet_root, watcher, once):
+    """Write status snapshots as JSON instead of drawing the terminal UI.
+
+    With once=True a single document is written. Otherwise one NDJSON line
+    is written per audit whenever its snapshot changes.
+    """
+    if once and audit_dir and not fleet_root and not os.path.isdir(audit_dir):
+        sys.exit(f"Error: directory not found: {audit_dir}")
+
+    sent = {}
+    for latest in iter_snapshots(audit_dir, fleet_root, watcher):
+        if once:
+            if fleet_root:
+                emit({"root": os.path.abspath(fleet_root), "audits": list(latest.values())})
+            else:
+                emit(latest[audit_dir])
+            return
+        for audit, snapshot in latest.items():
+            if sent.get(audit) != snapshot:
+                emit(snapshot)
+        for audit in sent.keys() - latest.keys():
+            emit({"audit_dir": audit, "removed": True})
+        sent = latest
+
+
+class StatusHub:
+    """Shared in-memory audit state for the HTTP server.
+
+    One watcher thread calls update() with fresh snapshots; every request
+    reads from here. Each change is recorded as a numbered event so clients
+    can long-poll or resume a stream from the last event they saw.
+    """
+
+    def __init__(self, history=1000):
+        self._cond = threading.Condition()
+        self.version = 0
+        self.audits = {}  # domain -> status_to_json() snapshot
+        self._events = deque(maxlen=history)  # (id, event, domain, data)
+
+    def update(self, latest):
+        by_domain = {snap["domain"]: snap for snap in latest.values()}
+        with self._cond:
+            for domain, snap in by_domain.items():
+                old = self.audits.get(domain)
+                if old == snap:
+                    continue
+                if old is None or old["phase"] != snap["phase"]:
+                    self._record("phase", domain, snap)
+                old_agents = {a["name"] for a in old["agents"]} if old else set()
+                if {a["name"] for a in snap["agents"]} - old_agents:
+                    self._record("agent", domain, snap)
+                elif old is not None and old["phase"] == snap["phase"]:
+                    self._record("status", domain, snap)
+            for domain in self.audits.keys() - by_domain.keys():
+                self._record("removed", domain, {"domain": domain, "removed": True})
+            self.audits = by_domain
+            self._cond.notify_all()
+
+    def _record(self, event, domain, data):
+        self.version += 1
+        self._events.append((self.version, event, domain, data))
+
+    def events_since(self, since, domain=None, timeout=0.0):
+        """Events newer than `since`, waiting up to `timeout` for one."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                found = [
+                    e for e in self._events
+                    if e[0] > since and (domain is None or e[2] == domain)
+                ]
+                remaining = deadline - time.monotonic()
+                if found or remaining <= 0:
+                    return found, self.version
+                self._cond.wait(remaining)
+
+    def snapshot(self, domain=None):
+        with self._cond:
+            if domain is None:
+                return {"version": self.version, "audits": dict(self.audits)}
+            return self.audits.get(domain)
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """GET /status[/<domain>]           current state
+    GET /events?since=N&timeout=S      long-poll for events after N
+    GET /stream[?audit=<domain>]       server-sent events
+    """
+
+    hub = None  # set by serve()
+    KEEPALIVE = 15
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [p for p in url.path.split("/") if p]
+        try:
+            if parts[:1] == ["status"] and len(parts) <= 2:
+                data = self.hub.snapshot(parts[1] if len(parts) == 2 else None)
+                if data is None:
+                    return self._send_json({"error": "unknown audit"}, 404)
+                return self._send_json(data)
+            if parts == ["events"]:
+                since = int(query.get("since", 0))
+                timeout = min(float(query.get("timeout", 30)), 300)
+                events, version = self.hub.events_since(since, query.get("audit"), timeout)
+                return self._send_json({
+                    "version": version,
+                    "events": [
+                        {"id": i, "event": e, "audit": d, "data": data}
+                        for i, e, d, data in events
+                    ],
+                })
+            if parts == ["stream"]:
+                return self._stream(query.get("audit"))
+        except ValueError:
+            return self._send_json({"error": "bad query parameter"}, 400)
+        self._send_json({"error": "not found"}, 404)
+
+    def _send_json(self, data, code=200):
+        body = json.dumps(data).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream(self, domain):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        last_id = self.headers.get("Last-Event-ID")
+        if last_id and last_id.isdigit():
+            since = int(last_id)
+        else:
+            # Fresh client: start from the current state.
+            state = self.hub.snapshot()
+            since = state["version"]
+            for snap in state["audits"].values():
+                if domain is None or snap["domain"] == domain:
+                    self._write_event(since, "snapshot", snap)
+        try:
+            while True:
+                events, _ = self.hub.events_since(since, domain, self.KEEPALIVE)
+                if not events:
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+                    continue
+                for event_id, event, _domain, data in events:
+                    self._write_event(event_id, event, data)
+                    since = event_id
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _write_event(self, event_id, event, data):
+        self.wfile.write(f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode())
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(address, audit_dir, fleet_root, watcher):
+    """Serve audit status over HTTP, fed by a single watcher thread."""
+    host, _, port = address.rpartition(":")
+    hub = StatusHub()
+    snapshots = iter_snapshots(audit_dir, fleet_root, watcher)
+    hub.update(next(snapshots))
+
+    def follow():
+        for latest in snapshots:
+            hub.update(latest)
+
+    threading.Thread(target=follow, daemon=True).start()
+
+    handler = type("Handler", (StatusHandler,), {"hub": hub})
+    server = ThreadingHTTPServer((host or "127.0.0.1", int(port)), handler)
+    server.daemon_threads = True
+    print(f"Serving audit status on http://{server.server_address[0]}:{server.server_address[1]}/status", file=sys.stderr)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
 
 
 def main():
-    if len(sys.argv) < 2:
-        print(f"Usage: python3 {sys.argv[0]} /tmp/marketing-audit-<domain>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Live dashboard for a marketing audit directory.",
+    )
+    parser.add_argument("audit_dir", nargs="?", help="e.g. /tmp/marketing-audit-example.com")
+    parser.add_argument(
+        "--fleet", nargs="?", const="/tmp", metavar="ROOT",
+        help="summarize every marketing-audit-* directory under ROOT (default: /tmp)",
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--json", action="store_true",
+        help="print one JSON status snapshot and exit",
+    )
+    output.add_argument(
+        "--ndjson", action="store_true",
+        help="stream a JSON line each time an audit's status changes",
+    )
+    output.add_argument(
+        "--serve", metavar="[HOST:]PORT",
+        help="serve status over HTTP with long-poll and server-sent events",
+    )
+    parser.add_argument(
+        "--poll", action="store_true",
+        help="use stat polling instead of inotify to detect changes",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=2.0,
+        help="seconds between clock redraws / stat polls (default: 2)",
+    )
+    args = parser.parse_args()
+    if not args.audit_dir and not args.fleet:
+        parser.error("an audit directory or --fleet is required")
+
+    watcher = make_watcher(poll=args.poll, interval=args.interval)
+    if args.serve:
+        try:
+            serve(args.serve, args.audit_dir, args.fleet, watcher)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            watcher.close()
+        return
+    if args.json or args.ndjson:
+        try:
+            run_stream(args.audit_dir, args.fleet, watcher, once=args.json)
+        except (KeyboardInterrupt, BrokenPipeError):
+            pass
+        finally:
+            watcher.close()
+        return
+
+    screen = Screen()
+    try:
+        if args.fleet:
+            run_fleet(args.fleet, watcher, args.interval, screen)
+        else:
+            run_single(args.audit_dir, watcher, args.interval, screen)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        screen.close()
+    clear_screen()
+    print(f"{C.CYAN}Dashboard closed.{C.RESET}")
 
-    audit_dir = sys.argv[1]
 
+def run_single(audit_dir, watcher, interval, screen):
     # Wait for directory to exist
     print(f"Waiting for {audit_dir}...")
     while not os.path.isdir(audit_dir):
         time.sleep(0.5)
 
-    start_time = time.time()
-
     # Check if session started earlier
-    context_path = os.path.join(audit_dir, "context.md")
-    if os.path.exists(context_path):
-        start_time = os.path.getmtime(context_path)
-
-    try:
-        while True:
-            render(audit_dir, start_time)
-            time.sleep(2)
-    except KeyboardInterrupt:
-        clear_screen()
-        print(f"{C.CYAN}Dashboard closed.{C.RESET}")
+    start_time = session_start(audit_dir, time.time())
+
+    watcher.add(audit_dir)
+    status = collect_status(audit_dir)
+    while True:
+        screen.draw(render(status, start_time))
+        # Between changes only the clock moves, so redraw from the
+        # existing snapshot instead of rescanning the directory.
+        if watcher.wait(timeout=interval):
+            status = collect_status(audit_dir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,726 @@
+#!/usr/bin/env python3
+"""Marketing Orchestrator — Markdown document tree
+
+Parses the markdown subset the agents write (headings, paragraphs, lists,
+tables, code blocks, rules and inline code/bold/italic/links) into a tree of
+plain lists and dicts, and renders that tree as HTML, plain text or a slide
+outline. A document is parsed once; every export format walks the same tree,
+and AstCache keeps parsed trees on disk by content hash so a later export
+does not parse the same report again. to_html() converts straight to HTML
+without a tree, for text that is only converted once.
+
+A document is a list of block nodes:
+
+  {"type": "heading", "level": 2, "inline": "..."}
+  {"type": "paragraph", "inline": "..."}
+  {"type": "list", "ordered": False, "items": ["...", ...]}
+  {"type": "table", "header": ["...", ...], "rows": [["...", ...], ...]}
+  {"type": "code", "lang": "py", "lines": ["..."]}
+  {"type": "hr"}
+
+Inline content ("...") is a string with its spans marked by control
+characters, which keeps trees small and makes HTML a single str.translate().
+inline_tokens() turns it into a flat token stream for other consumers:
+strings are text, lists are markers ["code"], ["/code"], ["strong"],
+["/strong"], ["em"], ["/em"], ["a", href] and ["/a"]. Markers are not always
+properly nested ("**a *b** c*" closes strong inside em), which is why they
+are a stream and not a tree. token_tree() gives a whole document in that
+form (the JSON export).
+
+Usage: python3 md_ast.py --format text agents/seo-audit.md
+       python3 md_ast.py --format json --cache /tmp/ast-cache agents/*.md
+       python3 md_ast.py --format outline FULL-REPORT.md
+
+Dependencies: Python 3.8+ (stdlib only)
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import textwrap
+import time
+from pathlib import Path
+from typing import Optional
+
+HEADER_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+UL_RE = re.compile(r"^[-*+]\s+(.+)$")
+OL_RE = re.compile(r"^\d+\.\s+(.+)$")
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+TAG_RE = re.compile(r"<[^>]+>")
+
+# Inline patterns, applied in this order. None of them can match across a
+# newline, which is what lets _mark_inline() run them over a whole batch.
+CODE_SPAN_RE = re.compile(r"`([^`\n]+)`")
+BOLD_ITALIC_RE = re.compile(r"\*\*\*(.+?)\*\*\*")
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+ITALIC_RE = re.compile(r"\*(.+?)\*")
+LINK_RE = re.compile(r"\[([^\]\n]+)\]\(([^)\n]+)\)")
+
+# Inline spans are marked with control characters (link: "\x0e" href "\x0f"
+# label "\x10"). None of them is "*", "`", "[", "]", "(", ")" or a newline, so
+# each pattern matches exactly where it would against finished HTML tags.
+# parse() turns any already in the text into U+FFFD.
+MARKERS = {
+    "\x01": "code", "\x02": "/code",
+    "\x03": "strong", "\x04": "/strong",
+    "\x05": "em", "\x06": "/em",
+    "\x10": "/a",
+}
+CONTROLS = "\x01\x02\x03\x04\x05\x06\x0e\x0f\x10"
+CONTROL_RE = re.compile(f"[{CONTROLS}]")
+MARKER_RE = re.compile("([\x01-\x06\x0e\x10])")
+MARKER_HTML = {
+    "\x01": "<code>", "\x02": "</code>",
+    "\x03": "<strong>", "\x04": "</strong>",
+    "\x05": "<em>", "\x06": "</em>",
+    "\x0e": '<a href="', "\x0f": '">', "\x10": "</a>",
+}
+INLINE_HTML = str.maketrans(MARKER_HTML)
+MARKER_SELF = {marker: marker for marker in MARKER_HTML}
+
+# Any edit to this module (parser or tree shape) invalidates cached trees
+PARSER_VERSION = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+# Seconds before an unfinished cache write counts as abandoned
+CACHE_TMP_MAX_AGE = 600
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def _wrap_matches(pattern: re.Pattern, before: str, after: str, text: str) -> str:
+    """Same as pattern.sub(before + r"\1" + after, text) for a one-group pattern.
+
+    re.split() hands back the groups directly, which avoids expanding the
+    replacement template once per match.
+    """
+    parts = pattern.split(text)
+    if len(parts) > 1:
+        parts[1::2] = [before + p + after for p in parts[1::2]]
+    return "".join(parts)
+
+
+def _mark_inline(texts: list[str], html: bool = False) -> list[str]:
+    """Mark inline spans (code, bold, italic, links) in many strings.
+
+    The strings (which never contain newlines) are joined with newlines and
+    each pattern runs once over the batch, skipping patterns whose trigger
+    character does not occur. Because no match can span a newline, the result
+    is the same as marking every string on its own. With html=True the spans
+    are marked with HTML tags instead of control characters.
+    """
+    if not texts:
+        return []
+    tags = MARKER_HTML if html else MARKER_SELF
+    text = "\n".join(texts)
+    # Code spans first; bold/italic inside them are still marked, as they
+    # always have been
+    if "`" in text:
+        text = _wrap_matches(CODE_SPAN_RE, tags["\x01"], tags["\x02"], text)
+    if "*" in text:
+        if "***" in text:
+            text = _wrap_matches(BOLD_ITALIC_RE, tags["\x03"] + tags["\x05"], tags["\x06"] + tags["\x04"], text)
+        if "**" in text:
+            text = _wrap_matches(BOLD_RE, tags["\x03"], tags["\x04"], text)
+        if "*" in text:
+            text = _wrap_matches(ITALIC_RE, tags["\x05"], tags["\x06"], text)
+    if "](" in text:
+        parts = LINK_RE.split(text)
+        if len(parts) > 1:
+            # Spans marked inside an href stay there, as HTML
+            if html:
+                parts[1::3] = [f'<a href="{href}">{label}' for label, href in zip(parts[1::3], parts[2::3])]
+            else:
+                parts[1::3] = [
+                    f"\x0e{href.translate(INLINE_HTML)}\x0f{label}"
+                    for label, href in zip(parts[1::3], parts[2::3])
+                ]
+            parts[2::3] = [tags["\x10"]] * (len(parts) // 3)
+            text = "".join(parts)
+    return text.split("\n")
+
+
+def parse(md_text: str) -> list[dict]:
+    """Parse markdown into a list of block nodes (see the module docstring).
+
+    Block structure is resolved line by line. Text that needs inline
+    formatting is collected along the way and marked in a single batch, then
+    handed to the nodes that hold it. A table ends at the first line that is
+    not a table row.
+    """
+    # Nodes hold indexes into inline until the batch has been marked
+    doc: list[dict] = []
+    inline: list[str] = []
+    table: Optional[dict] = None
+    code: Optional[dict] = None
+    items: Optional[dict] = None  # the open list
+    paragraph: list[int] = []
+
+    if any(c in md_text for c in CONTROLS):
+        md_text = CONTROL_RE.sub("\ufffd", md_text)
+    for line in md_text.split("\n"):
+        stripped = line.strip()
+        first = stripped[:1]
+
+        # Code blocks
+        if first == "`" and stripped.startswith("```"):
+            if code is not None:
+                code = None
+            else:
+                if paragraph:
+                    doc.append({"type": "paragraph", "inline": paragraph})
+                    paragraph = []
+                items = table = None
+                code = {"type": "code", "lang": stripped[3:].strip(), "lines": []}
+                doc.append(code)
+            continue
+
+        if code is not None:
+            code["lines"].append(line)
+            continue
+
+        # Empty line
+        if not first:
+            table = None
+            if paragraph:
+                doc.append({"type": "paragraph", "inline": paragraph})
+                paragraph = []
+            continue
+
+        # Horizontal rule
+        if stripped in ("---", "***", "___") and table is None:
+            if paragraph:
+                doc.append({"type": "paragraph", "inline": paragraph})
+                paragraph = []
+            items = None
+            doc.append({"type": "hr"})
+            continue
+
+        # Headers
+        if first == "#":
+            header_match = HEADER_RE.match(stripped)
+            if header_match:
+                if paragraph:
+                    doc.append({"type": "paragraph", "inline": paragraph})
+                    paragraph = []
+                items = table = None
+                doc.append({"type": "heading", "level": len(header_match.group(1)), "inline": len(inline)})
+                inline.append(header_match.group(2))
+                continue
+
+        # Table rows
+        if first == "|":
+            if paragraph:
+                doc.append({"type": "paragraph", "inline": paragraph})
+                paragraph = []
+            items = None
+            # Check if separator row
+            cells = [c.strip() for c in stripped.split("|")[1:-1]]
+            if all(not c.strip("-:") for c in cells if c):
+                continue  # Skip separator row
+
+            row = list(range(len(inline), len(inline) + len(cells)))
+            inline.extend(cells)
+            if table is None:
+                # First row = header
+                table = {"type": "table", "header": row, "rows": []}
+                doc.append(table)
+            else:
+                table["rows"].append(row)
+            continue
+
+        table = None
+
+        # Unordered / ordered list items
+        item = None
+        if first in ("-", "*", "+"):
+            item = UL_RE.match(stripped)
+            ordered = False
+        elif first.isdigit():
+            item = OL_RE.match(stripped)
+            ordered = True
+        if item:
+            if paragraph:
+                doc.append({"type": "paragraph", "inline": paragraph})
+                paragraph = []
+            if items is None or items["ordered"] != ordered:
+                items = {"type": "list", "ordered": ordered, "items": []}
+                doc.append(items)
+            items["items"].append(len(inline))
+            inline.append(item.group(1))
+            continue
+
+        # End list if not a list item
+        items = None
+
+        # Regular paragraph text
+        paragraph.append(len(inline))
+        inline.append(stripped)
+
+    if paragraph:
+        doc.append({"type": "paragraph", "inline": paragraph})
+
+    marked = _mark_inline(inline)
+    for node in doc:
+        kind = node["type"]
+        if kind == "paragraph":
+            node["inline"] = " ".join([marked[i] for i in node["inline"]])
+        elif kind == "list":
+            node["items"] = [marked[i] for i in node["items"]]
+        elif kind == "table":
+            node["header"] = [marked[i] for i in node["header"]]
+            node["rows"] = [[marked[i] for i in row] for row in node["rows"]]
+        elif kind == "heading":
+            node["inline"] = marked[node["inline"]]
+    return doc
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def content_digest(md_text: str) -> str:
+    return hashlib.sha256(md_text.encode()).hexdigest()
+
+
+class AstCache:
+    """Parsed documents on disk as JSON, one file per content hash.
+
+    Failures to read or write are treated as misses.
+    """
+
+    def __init__(self, directory):
+        self.dir = Path(directory)
+
+    def key(self, digest: str) -> str:
+        """Cache key for a document whose content_digest() is digest."""
+        return hashlib.sha256(f"{PARSER_VERSION}\0{digest}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[list]:
+        try:
+            return json.loads((self.dir / f"{key}.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, doc: list):
+        path = self.dir / f"{key}.json"
+        tmp = path.with_suffix(f".tmp{os.getpid()}")
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(doc, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def prune(self, keep: list[str]):
+        """Delete trees not in keep (e.g. of reports since edited).
+
+        A temporary file may be a tree another process is writing right now,
+        so only those left behind for CACHE_TMP_MAX_AGE are removed.
+        """
+        keep_names = {f"{key}.json" for key in keep}
+        cutoff = time.time() - CACHE_TMP_MAX_AGE
+        try:
+            entries = list(self.dir.iterdir())
+        except OSError:
+            return
+        for p in entries:
+            try:
+                if p.suffix == ".json":
+                    if p.name not in keep_names:
+                        p.unlink()
+                elif p.suffix.startswith(".tmp") and p.stat().st_mtime < cutoff:
+                    p.unlink()
+            except OSError:
+                pass
+
+
+def parse_cached(md_text: str, cache: Optional[AstCache]) -> list[dict]:
+    """parse(), reusing the tree cached for identical text if there is one."""
+    if cache is None:
+        return parse(md_text)
+    key = cache.key(content_digest(md_text))
+    doc = cache.get(key)
+    if doc is None:
+        doc = parse(md_text)
+        cache.put(key, doc)
+    return doc
+
+
+# ---------------------------------------------------------------------------
+# Renderers
+# ---------------------------------------------------------------------------
+
+def inline_tokens(inline: str) -> list:
+    """The token stream for marked inline content (see the module docstring)."""
+    tokens: list = []
+    marker = None
+    for i, part in enumerate(MARKER_RE.split(inline)):
+        if i % 2:
+            marker = part
+            if marker != "\x0e":
+                tokens.append([MARKERS[marker]])
+            continue
+        if marker == "\x0e":
+            href, part = part.split("\x0f", 1)
+            tokens.append(["a", href])
+        if part:
+            tokens.append(part)
+    return tokens
+
+
+def inline_text(inline: str) -> str:
+    """Marked inline content as plain text; links become "label (href)"."""
+    out: list[str] = []
+    hrefs: list[str] = []
+    for t in inline_tokens(inline):
+        if type(t) is str:
+            out.append(t)
+        elif t[0] == "a":
+            hrefs.append(TAG_RE.sub("", t[1]))
+        elif t[0] == "/a" and hrefs:
+            out.append(f" ({hrefs.pop()})")
+    return "".join(out)
+
+
+def token_tree(doc: list[dict]) -> list[dict]:
+    """A copy of doc with every inline string replaced by its token stream."""
+    tree = []
+    for node in doc:
+        node = dict(node)
+        kind = node["type"]
+        if kind in ("heading", "paragraph"):
+            node["inline"] = inline_tokens(node["inline"])
+        elif kind == "list":
+            node["items"] = [inline_tokens(item) for item in node["items"]]
+        elif kind == "table":
+            node["header"] = [inline_tokens(cell) for cell in node["header"]]
+            node["rows"] = [[inline_tokens(cell) for cell in row] for row in node["rows"]]
+        tree.append(node)
+    return tree
+
+
+def _escape_code(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def render_html(doc: list[dict]) -> str:
+    """HTML for a parsed document, one block element per line.
+
+    Inline content goes out still marked; the markers are swapped for tags
+    over the whole document at the end, which is much cheaper than doing it
+    string by string.
+    """
+    out: list[str] = []
+    for node in doc:
+        kind = node["type"]
+        if kind == "paragraph":
+            out.append("<p>" + node["inline"] + "</p>")
+        elif kind == "list":
+            tag = "ol" if node["ordered"] else "ul"
+            out.append(f"<{tag}>")
+            out.extend(["<li>" + item + "</li>" for item in node["items"]])
+            out.append(f"</{tag}>")
+        elif kind == "heading":
+            level, text = node["level"], node["inline"].translate(INLINE_HTML)
+            slug = SLUG_RE.sub("-", text.lower().replace("<strong>", "").replace("</strong>", "").replace("<em>", "").replace("</em>", ""))
+            slug = TAG_RE.sub("", slug).strip("-")
+            out.append(f'<h{level} id="{slug}">{node["inline"]}</h{level}>')
+        elif kind == "table":
+            out.append('<div class="table-wrapper"><table>')
+            out.append("<thead><tr>")
+            out.extend(["<th>" + cell + "</th>" for cell in node["header"]])
+            out.append("</tr></thead><tbody>")
+            for row in node["rows"]:
+                out.append("<tr>")
+                out.extend(["<td>" + cell + "</td>" for cell in row])
+                out.append("</tr>")
+            out.append("</tbody></table></div>")
+        elif kind == "code":
+            lang = node["lang"]
+            out.append(f'<pre><code class="language-{lang}">' if lang else "<pre><code>")
+            if node["lines"]:
+                out.append(_escape_code("\n".join(node["lines"])))
+            out.append("</code></pre>")
+        elif kind == "hr":
+            out.append("<hr>")
+    html = "\n".join(out)
+    for marker, tag in MARKER_HTML.items():
+        if marker in html:
+            html = html.replace(marker, tag)
+    return html
+
+
+def to_html(md_text: str) -> str:
+    """Same as render_html(parse(md_text)), without building the tree.
+
+    For text converted once, as most of a report is: HTML parts are emitted
+    while the blocks are resolved, with slots for the inline text that is
+    marked in one batch at the end.
+    """
+    # Each part is finished HTML or a slot waiting for inline text:
+    # ("wrap", before, index, after), ("row", before, cell open tag, cell close
+    # tag, first index, count, after), ("h", level, index) or ("p", indexes)
+    html_parts: list = []
+    inline: list[str] = []
+    in_table = False
+    in_code = False
+    list_type = None  # "ul" or "ol" while inside a list
+    paragraph: list[int] = []
+    code: list[str] = []
+
+    if any(c in md_text for c in CONTROLS):
+        md_text = CONTROL_RE.sub("\ufffd", md_text)
+    for line in md_text.split("\n"):
+        stripped = line.strip()
+        first = stripped[:1]
+
+        # Code blocks
+        if first == "`" and stripped.startswith("```"):
+            if in_code:
+                if code:
+                    html_parts.append(_escape_code("\n".join(code)))
+                    code = []
+                html_parts.append("</code></pre>")
+                in_code = False
+            else:
+                if paragraph:
+                    html_parts.append(("p", paragraph))
+                    paragraph = []
+                if list_type:
+                    html_parts.append(f"</{list_type}>")
+                    list_type = None
+                if in_table:
+                    html_parts.append("</tbody></table></div>")
+                    in_table = False
+                lang = stripped[3:].strip()
+                html_parts.append(f'<pre><code class="language-{lang}">' if lang else "<pre><code>")
+                in_code = True
+            continue
+
+        if in_code:
+            code.append(line)
+            continue
+
+        # Empty line
+        if not first:
+            if in_table:
+                html_parts.append("</tbody></table></div>")
+                in_table = False
+            if paragraph:
+                html_parts.append(("p", paragraph))
+                paragraph = []
+            continue
+
+        # Horizontal rule
+        if stripped in ("---", "***", "___") and not in_table:
+            if paragraph:
+                html_parts.append(("p", paragraph))
+                paragraph = []
+            if list_type:
+                html_parts.append(f"</{list_type}>")
+                list_type = None
+            html_parts.append("<hr>")
+            continue
+
+        # Headers
+        if first == "#":
+            header_match = HEADER_RE.match(stripped)
+            if header_match:
+                if paragraph:
+                    html_parts.append(("p", paragraph))
+                    paragraph = []
+                if list_type:
+                    html_parts.append(f"</{list_type}>")
+                    list_type = None
+                if in_table:
+                    html_parts.append("</tbody></table></div>")
+                    in_table = False
+                html_parts.append(("h", len(header_match.group(1)), len(inline)))
+                inline.append(header_match.group(2))
+                continue
+
+        # Table rows
+        if first == "|":
+            if paragraph:
+                html_parts.append(("p", paragraph))
+                paragraph = []
+            if list_type:
+                html_parts.append(f"</{list_type}>")
+                list_type = None
+            # Check if separator row
+            cells = [c.strip() for c in stripped.split("|")[1:-1]]
+            if all(not c.strip("-:") for c in cells if c):
+                continue  # Skip separator row
+
+            if not in_table:
+                html_parts.append('<div class="table-wrapper"><table>')
+                in_table = True
+                # First row = header
+                html_parts.append(("row", "<thead><tr>", "<th>", "</th>", len(inline), len(cells), "</tr></thead><tbody>"))
+            else:
+                html_parts.append(("row", "<tr>", "<td>", "</td>", len(inline), len(cells), "</tr>"))
+            inline.extend(cells)
+            continue
+
+        if in_table:
+            html_parts.append("</tbody></table></div>")
+            in_table = False
+
+        # Unordered / ordered list items
+        item = None
+        if first in ("-", "*", "+"):
+            item = UL_RE.match(stripped)
+            kind = "ul"
+        elif first.isdigit():
+            item = OL_RE.match(stripped)
+            kind = "ol"
+        if item:
+            if paragraph:
+                html_parts.append(("p", paragraph))
+                paragraph = []
+            if list_type != kind:
+                if list_type:
+                    html_parts.append(f"</{list_type}>")
+                html_parts.append(f"<{kind}>")
+                list_type = kind
+            html_parts.append(("wrap", "<li>", len(inline), "</li>"))
+            inline.append(item.group(1))
+            continue
+
+        # End list if not a list item
+        if list_type:
+            html_parts.append(f"</{list_type}>")
+            list_type = None
+
+        # Regular paragraph text
+        paragraph.append(len(inline))
+        inline.append(stripped)
+
+    # Flush remaining state
+    if code:
+        html_parts.append(_escape_code("\n".join(code)))
+    if paragraph:
+        html_parts.append(("p", paragraph))
+    if list_type:
+        html_parts.append(f"</{list_type}>")
+    if in_table:
+        html_parts.append("</tbody></table></div>")
+    if in_code:
+        html_parts.append("</code></pre>")
+
+    marked = _mark_inline(inline, html=True)
+    out: list[str] = []
+    for part in html_parts:
+        if type(part) is str:
+            out.append(part)
+        elif part[0] == "wrap":
+            out.append(part[1] + marked[part[2]] + part[3])
+        elif part[0] == "row":
+            _, before, open_tag, close_tag, start, count, after = part
+            out.append(before)
+            out.extend([open_tag + cell + close_tag for cell in marked[start:start + count]])
+            out.append(after)
+        elif part[0] == "p":
+            out.append("<p>" + " ".join([marked[i] for i in part[1]]) + "</p>")
+        else:
+            level, text = part[1], marked[part[2]]
+            slug = SLUG_RE.sub("-", text.lower().replace("<strong>", "").replace("</strong>", "").replace("<em>", "").replace("</em>", ""))
+            slug = TAG_RE.sub("", slug).strip("-")
+            out.append(f'<h{level} id="{slug}">{text}</h{level}>')
+    return "\n".join(out)
+
+
+def render_text(doc: list[dict], width: int = 72) -> str:
+    """Plain text for email: underlined headings, wrapped paragraphs, aligned tables."""
+    def fill(text: str, first: str = "", rest: str = "") -> str:
+        return textwrap.fill(
+            text, width, initial_indent=first, subsequent_indent=rest,
+            break_long_words=False, break_on_hyphens=False,
+        ) or first.rstrip()
+
+    blocks: list[str] = []
+    for node in doc:
+        kind = node["type"]
+        if kind == "heading":
+            text = inline_text(node["inline"])
+            if node["level"] <= 2:
+                text += "\n" + ("=" if node["level"] == 1 else "-") * len(text)
+            blocks.append(text)
+        elif kind == "paragraph":
+            blocks.append(fill(inline_text(node["inline"])))
+        elif kind == "list":
+            lines = []
+            for n, item in enumerate(node["items"], 1):
+                bullet = f"{n}. " if node["ordered"] else "- "
+                lines.append(fill(inline_text(item), bullet, " " * len(bullet)))
+            blocks.append("\n".join(lines))
+        elif kind == "table":
+            rows = [[inline_text(cell) for cell in row] for row in [node["header"], *node["rows"]]]
+            columns = max(len(row) for row in rows)
+            widths = [max((len(row[c]) for row in rows if c < len(row)), default=0) for c in range(columns)]
+            lines = ["  ".join(cell.ljust(widths[c]) for c, cell in enumerate(row)).rstrip() for row in rows]
+            lines.insert(1, "  ".join("-" * w for w in widths))
+            blocks.append("\n".join(lines))
+        elif kind == "code":
+            blocks.append("\n".join(("    " + line).rstrip() for line in node["lines"]))
+        elif kind == "hr":
+            blocks.append("* * *")
+    return "\n\n".join(blocks) + "\n" if blocks else ""
+
+
+def render_outline(doc: list[dict]) -> str:
+    """Slide outline: headings as nested bullets, list items under their heading."""
+    levels = [node["level"] for node in doc if node["type"] == "heading"]
+    top = min(levels, default=1)
+    depth = -1
+    lines: list[str] = []
+    for node in doc:
+        if node["type"] == "heading":
+            depth = node["level"] - top
+            lines.append("  " * depth + "- " + inline_text(node["inline"]))
+        elif node["type"] == "list":
+            lines.extend("  " * (depth + 1) + "- " + inline_text(item) for item in node["items"])
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+RENDERERS = {
+    "html": lambda doc: render_html(doc) + "\n",
+    "text": render_text,
+    "outline": render_outline,
+    "json": lambda doc: json.dumps(token_tree(doc), ensure_ascii=False) + "\n",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse markdown reports and render them in another format.")
+    parser.add_argument("files", nargs="+", metavar="file.md")
+    parser.add_argument("--format", choices=sorted(RENDERERS), default="text", help="output format (default: text)")
+    parser.add_argument("--cache", metavar="DIR", help="reuse parsed trees stored in DIR")
+    args = parser.parse_args()
+
+    render = RENDERERS[args.format]
+    cache = AstCache(args.cache) if args.cache else None
+    status = 0
+    for path in args.files:
+        try:
+            text = Path(path).read_text()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error: {path}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        if args.format == "html" and cache is None:
+            sys.stdout.write(to_html(text) + "\n")
+        else:
+            sys.stdout.write(render(parse_cached(text, cache)))
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""Marketing Orchestrator — PDF Worker
+
+Keeps one headless Chrome/Chromium instance warm and renders a queue of HTML
+files to PDF over the DevTools protocol, so rendering many reports pays for
+browser startup once instead of once per report.
+
+Each job gets its own tab and its own timeout. If the browser crashes or
+stops answering, it is killed and a fresh one is started; a job that was
+interrupted by a crash is retried once. The browser is also recycled every
+--recycle-after jobs to keep its memory bounded.
+
+The browser is $CHROME_PATH if set, else google-chrome / chromium on PATH,
+else the macOS Google Chrome bundle. Any program that accepts Chrome's
+--user-data-dir and --remote-debugging-port=0 flags, writes
+DevToolsActivePort into the profile directory and answers the handful of
+DevTools commands used below can stand in for it (e.g. a local fake renderer
+in tests).
+
+Usage: python3 pdf_worker.py /tmp/marketing-audit-*/FULL-REPORT.html
+       python3 pdf_worker.py --timeout 60 report.html
+       printf 'a.html\\tout/a.pdf\\n' | python3 pdf_worker.py -
+
+Output: <name>.pdf next to each HTML file (or the path after a tab on stdin)
+
+Dependencies: Python 3.8+ (stdlib only), Chrome or Chromium
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import queue
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from urllib.parse import urlsplit
+
+CHROME_NAMES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+MAC_CHROME = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+
+CHROME_FLAGS = [
+    "--headless",
+    "--disable-gpu",
+    "--no-sandbox",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--hide-scrollbars",
+    "--mute-audio",
+]
+
+# Same output as `chrome --print-to-pdf --no-pdf-header-footer`
+PRINT_OPTIONS = {
+    "printBackground": True,
+    "preferCSSPageSize": True,
+    "displayHeaderFooter": False,
+}
+
+JOB_TIMEOUT = 60
+STARTUP_TIMEOUT = 30
+RECYCLE_AFTER = 100
+# Time allowed for tidying up (closing a tab, shutting the browser down)
+CLEANUP_TIMEOUT = 5
+
+
+class PdfError(Exception):
+    """A job failed; the browser is still usable."""
+
+
+class PdfTimeout(PdfError):
+    """A job did not finish within its timeout."""
+
+
+class BrowserError(Exception):
+    """The browser could not be started, crashed or dropped the connection."""
+
+
+def find_chrome():
+    """Path of a Chrome/Chromium executable, or None."""
+    env = os.environ.get("CHROME_PATH")
+    if env:
+        return shutil.which(env) or (env if os.path.exists(env) else None)
+    for name in CHROME_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    if os.path.exists(MAC_CHROME):
+        return MAC_CHROME
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Minimal WebSocket client (RFC 6455, text frames only)
+# ---------------------------------------------------------------------------
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+
+class WebSocket:
+    def __init__(self, url, timeout):
+        parts = urlsplit(url)
+        self.sock = socket.create_connection((parts.hostname, parts.port or 80), timeout=timeout)
+        self.buf = bytearray()
+        key = base64.b64encode(os.urandom(16)).decode()
+        request = (
+            f"GET {parts.path or '/'} HTTP/1.1\r\n"
+            f"Host: {parts.hostname}:{parts.port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        self.sock.sendall(request.encode())
+        while b"\r\n\r\n" not in self.buf:
+            self._fill()
+        head, _, rest = bytes(self.buf).partition(b"\r\n\r\n")
+        self.buf = bytearray(rest)
+        lines = head.decode("latin-1").split("\r\n")
+        if lines[0].split()[1:2] != ["101"]:
+            raise BrowserError(f"WebSocket handshake refused: {lines[0]}")
+        expected = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(":") for line in lines[1:])}
+        if headers.get("sec-websocket-accept") != expected:
+            raise BrowserError("WebSocket handshake returned a bad accept key")
+
+    def settimeout(self, timeout):
+        self.sock.settimeout(timeout)
+
+    def _fill(self):
+        chunk = self.sock.recv(65536)
+        if not chunk:
+            raise BrowserError("DevTools connection closed")
+        self.buf += chunk
+
+    def _read(self, n):
+        while len(self.buf) < n:
+            self._fill()
+        data = bytes(self.buf[:n])
+        del self.buf[:n]
+        return data
+
+    def _send_frame(self, opcode, payload):
+        header = bytearray([0x80 | opcode])
+        n = len(payload)
+        if n < 126:
+            header.append(0x80 | n)
+        elif n < 1 << 16:
+            header.append(0x80 | 126)
+            header += struct.pack("!H", n)
+        else:
+            header.append(0x80 | 127)
+            header += struct.pack("!Q", n)
+        mask = os.urandom(4)
+        self.sock.sendall(bytes(header) + mask + _mask(payload, mask))
+
+    def send(self, text):
+        self._send_frame(OP_TEXT, text.encode())
+
+    def recv(self):
+        """Next complete text message."""
+        message = bytearray()
+        while True:
+            b0, b1 = self._read(2)
+            opcode, n = b0 & 0x0F, b1 & 0x7F
+            if n == 126:
+                n = struct.unpack("!H", self._read(2))[0]
+            elif n == 127:
+                n = struct.unpack("!Q", self._read(8))[0]
+            mask = self._read(4) if b1 & 0x80 else None
+            payload = self._read(n)
+            if mask:
+                payload = _mask(payload, mask)
+            if opcode == OP_PING:
+                self._send_frame(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                raise BrowserError("DevTools connection closed by the browser")
+            message += payload
+            if b0 & 0x80:
+                return message.decode()
+
+    def close(self):
+        try:
+            self._send_frame(OP_CLOSE, b"")
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def _mask(payload, mask):
+    """XOR payload with the repeating 4-byte mask (as one big integer)."""
+    n = len(payload)
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
+
+
+# ---------------------------------------------------------------------------
+# Browser
+# ---------------------------------------------------------------------------
+
+class Browser:
+    """A headless browser process and its DevTools connection."""
+
+    def __init__(self, command, startup_timeout=STARTUP_TIMEOUT):
+        self.profile = tempfile.mkdtemp(prefix="pdf-worker-")
+        self.proc = subprocess.Popen(
+            [command, *CHROME_FLAGS, f"--user-data-dir={self.profile}", "--remote-debugging-port=0", "about:blank"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self.ws = None
+        self.next_id = 0
+        self.events = []
+        try:
+            self.ws = WebSocket(self._wait_for_endpoint(startup_timeout), startup_timeout)
+        except (OSError, BrowserError) as e:
+            self.close()
+            raise BrowserError(f"could not start {command}: {e}") from None
+
+    def _wait_for_endpoint(self, timeout):
+        """ws:// URL from the DevToolsActivePort file Chrome writes at startup."""
+        port_file = Path(self.profile) / "DevToolsActivePort"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise BrowserError(f"exited with status {self.proc.returncode}")
+            try:
+                lines = port_file.read_text().split("\n")
+            except OSError:
+                lines = []
+            if len(lines) >= 2 and lines[0].strip() and lines[1].strip():
+                return f"ws://127.0.0.1:{lines[0].strip()}{lines[1].strip()}"
+            time.sleep(0.05)
+        raise BrowserError(f"no DevTools endpoint after {timeout}s")
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def call(self, method, params=None, session=None, deadline=None):
+        """Send one DevTools command and return its result."""
+        self.next_id += 1
+        message = {"id": self.next_id, "method": method, "params": params or {}}
+        if session:
+            message["sessionId"] = session
+        self._settimeout(deadline)
+        try:
+            self.ws.send(json.dumps(message))
+            while True:
+                reply = self._receive(deadline)
+                if reply.get("id") == message["id"]:
+                    break
+                if "method" in reply:
+                    self.events.append(reply)
+        except socket.timeout:
+            # A browser too busy to take the command is a timeout, not a crash
+            raise PdfTimeout("timed out") from None
+        except OSError as e:
+            raise BrowserError(f"{method}: {e}") from None
+        if "error" in reply:
+            raise PdfError(f"{method}: {reply['error'].get('message', reply['error'])}")
+        return reply.get("result", {})
+
+    def wait_event(self, method, session, deadline):
+        for i, event in enumerate(self.events):
+            if event["method"] == method and event.get("sessionId") == session:
+                return self.events.pop(i)
+        try:
+            while True:
+                event = self._receive(deadline)
+                if event.get("method") == method and event.get("sessionId") == session:
+                    return event
+                if "method" in event:
+                    self.events.append(event)
+        except OSError as e:
+            raise BrowserError(f"waiting for {method}: {e}") from None
+
+    def _settimeout(self, deadline):
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise PdfTimeout("timed out")
+            self.ws.settimeout(remaining)
+
+    def _receive(self, deadline):
+        self._settimeout(deadline)
+        try:
+            return json.loads(self.ws.recv())
+        except socket.timeout:
+            raise PdfTimeout("timed out") from None
+        except ValueError:
+            raise BrowserError("malformed DevTools message") from None
+
+    def render(self, html_path, pdf_path, timeout):
+        """Print one HTML file to PDF in a fresh tab."""
+        deadline = time.monotonic() + timeout
+        target = self.call("Target.createTarget", {"url": "about:blank"}, deadline=deadline)["targetId"]
+        try:
+            session = self.call("Target.attachToTarget", {"targetId": target, "flatten": True}, deadline=deadline)["sessionId"]
+            self.call("Page.enable", session=session, deadline=deadline)
+            nav = self.call("Page.navigate", {"url": Path(html_path).resolve().as_uri()}, session, deadline)
+            if nav.get("errorText"):
+                raise PdfError(f"could not load page: {nav['errorText']}")
+            self.wait_event("Page.loadEventFired", session, deadline)
+            data = base64.b64decode(self.call("Page.printToPDF", PRINT_OPTIONS, session, deadline)["data"])
+        except PdfTimeout:
+            # A reply may be half read, so the connection cannot be reused;
+            # the worker replaces the browser
+            raise
+        except PdfError:
+            self.close_target(target)
+            raise
+        self.close_target(target)
+        self.events.clear()
+        tmp = f"{pdf_path}.tmp{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, pdf_path)
+
+    def close_target(self, target):
+        """Close a tab; a browser that cannot do this is treated as crashed."""
+        try:
+            self.call("Target.closeTarget", {"targetId": target}, deadline=time.monotonic() + CLEANUP_TIMEOUT)
+        except PdfTimeout:
+            raise BrowserError("browser stopped responding") from None
+
+    def close(self, graceful=True):
+        """Shut the browser down; graceful=False skips asking it over DevTools."""
+        if self.ws is not None:
+            if graceful:
+                try:
+                    self.call("Browser.close", deadline=time.monotonic() + CLEANUP_TIMEOUT)
+                except (BrowserError, PdfError):
+                    pass
+            self.ws.close()
+            self.ws = None
+        if self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(CLEANUP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        shutil.rmtree(self.profile, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+class PdfWorker:
+    """Renders queued HTML files to PDF with one long-lived browser.
+
+    Jobs run one at a time on a background thread; submit() returns a
+    Future that resolves to the PDF path. The browser starts with the first
+    job and is replaced when it crashes, hangs or has rendered
+    recycle_after jobs.
+    """
+
+    def __init__(self, command=None, timeout=JOB_TIMEOUT, startup_timeout=STARTUP_TIMEOUT,
+                 recycle_after=RECYCLE_AFTER, retries=1):
+        self.command = command or find_chrome()
+        if not self.command:
+            raise BrowserError("Chrome/Chromium not found (set CHROME_PATH)")
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.recycle_after = recycle_after
+        self.retries = retries
+        self.browser = None
+        self.jobs_on_browser = 0
+        self.restarts = 0
+        self.jobs = queue.Queue()
+        self.closed = False
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name="pdf-worker", daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, html_path, pdf_path=None, timeout=None):
+        """Queue a job; once done, future.elapsed holds its render time.
+
+        Raises RuntimeError once the worker has been closed.
+        """
+        future = Future()
+        pdf_path = pdf_path or str(Path(html_path).with_suffix(".pdf"))
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("cannot submit to a closed PdfWorker")
+            self.jobs.put((future, str(html_path), str(pdf_path), timeout or self.timeout))
+        return future
+
+    def render(self, html_path, pdf_path=None, timeout=None):
+        """Render one file and wait for it; raises PdfError or BrowserError."""
+        return self.submit(html_path, pdf_path, timeout).result()
+
+    def close(self):
+        """Finish queued jobs, then shut the browser down."""
+        with self.lock:
+            if not self.closed:
+                self.closed = True
+                self.jobs.put(None)
+        self.thread.join()
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            future, html_path, pdf_path, timeout = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            start = time.monotonic()
+            try:
+                self._render(html_path, pdf_path, timeout)
+            except BaseException as e:
+                future.elapsed = time.monotonic() - start
+                future.set_exception(e)
+            else:
+                future.elapsed = time.monotonic() - start
+                future.set_result(pdf_path)
+        self._recycle()
+
+    def _render(self, html_path, pdf_path, timeout):
+        for attempt in range(self.retries + 1):
+            if self.browser is not None and (not self.browser.alive() or self.jobs_on_browser >= self.recycle_after):
+                self._recycle()
+            if self.browser is None:
+                self.browser = Browser(self.command, self.startup_timeout)
+            self.jobs_on_browser += 1
+            try:
+                self.browser.render(html_path, pdf_path, timeout)
+                return
+            except PdfTimeout:
+                # Not retried: a page that hangs once will hang again
+                self._recycle(graceful=False)
+                self.restarts += 1
+                raise PdfTimeout(f"no PDF after {timeout:g}s") from None
+            except BrowserError:
+                self._recycle(graceful=False)
+                self.restarts += 1
+                if attempt == self.retries:
+                    raise
+
+    def _recycle(self, graceful=True):
+        if self.browser is not None:
+            self.browser.close(graceful)
+            self.browser = None
+        self.jobs_on_browser = 0
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def read_jobs(inputs):
+    """(html, pdf or None) pairs from arguments, or from stdin for "-"."""
+    for item in inputs:
+        if item != "-":
+            yield item, None
+            continue
+        for line in sys.stdin:
+            html_path, _, pdf_path = line.rstrip("\n").partition("\t")
+            if html_path.strip():
+                yield html_path.strip(), pdf_path.strip() or None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render HTML files to PDF with one warm headless Chrome.",
+    )
+    parser.add_argument("inputs", nargs="+", help='HTML files, or "-" to read "html[<TAB>pdf]" lines from stdin')
+    parser.add_argument("--browser", help="browser executable (default: $CHROME_PATH, then PATH, then macOS Chrome)")
+    parser.add_argument("--timeout", type=float, default=JOB_TIMEOUT, help=f"seconds per PDF (default: {JOB_TIMEOUT})")
+    parser.add_argument(
+        "--startup-timeout", type=float, default=STARTUP_TIMEOUT,
+        help=f"seconds to wait for the browser to start (default: {STARTUP_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--recycle-after", type=int, default=RECYCLE_AFTER,
+        help=f"restart the browser after this many PDFs (default: {RECYCLE_AFTER})",
+    )
+    args = parser.parse_args()
+
+    try:
+        worker = PdfWorker(args.browser, args.timeout, args.startup_timeout, args.recycle_after)
+    except BrowserError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    failed = 0
+    start = time.monotonic()
+    with worker:
+        submitted = [(html_path, worker.submit(html_path, pdf_path)) for html_path, pdf_path in read_jobs(args.inputs)]
+        for html_path, future in submitted:
+            try:
+                pdf_path = future.result()
+            except (PdfError, BrowserError, OSError) as e:
+                failed += 1
+                print(f"FAILED {html_path}: {e}", file=sys.stderr)
+            else:
+                print(f"PDF: {pdf_path} ({os.path.getsize(pdf_path) / (1024 * 1024):.2f} MB)")
+    print(
+        f"{len(submitted) - failed}/{len(submitted)} PDFs in {time.monotonic() - start:.1f}s"
+        + (f", {worker.restarts} browser restarts" if worker.restarts else ""),
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
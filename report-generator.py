@@ -6,183 +6,151 @@ report, then generates a professional HTML document and converts it to PDF
 via Chrome headless.
 
 Usage: python3 report-generator.py /tmp/marketing-audit-example.com
+       python3 report-generator.py --workers 4 /tmp/marketing-audit-example.com
+       python3 report-generator.py --no-cache /tmp/marketing-audit-example.com
+       python3 report-generator.py --export text --export json /tmp/marketing-audit-example.com
+       python3 report-generator.py --jobs 4 "/tmp/marketing-audit-*"   # batch
 
 Output:
   /tmp/marketing-audit-example.com/FULL-REPORT.html
   /tmp/marketing-audit-example.com/FULL-REPORT.pdf
+  /tmp/marketing-audit-example.com/FULL-REPORT.{txt,json}, FULL-REPORT-outline.txt
+                                                   (with --export)
+  /tmp/marketing-audit-example.com/.report-cache/  (rendered chapters and parsed
+                                                    agent reports, reused by the
+                                                    next build)
 
-Dependencies: Python 3.8+ (stdlib only), Google Chrome
+Dependencies: Python 3.8+ (stdlib only), Chrome or Chromium (see pdf_worker.py)
 """
 
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
 import json
 import os
 import re
-import subprocess
 import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from cmo_review import normalize_name, parse_verdicts
+from md_ast import (
+    CACHE_TMP_MAX_AGE, HEADER_RE, PARSER_VERSION, AstCache, content_digest, parse_cached, render_outline,
+    render_text, to_html, token_tree,
+)
+from pdf_worker import PdfTimeout, PdfWorker, find_chrome
 
 
 # ---------------------------------------------------------------------------
-# Lightweight Markdown → HTML converter (stdlib only)
+# Markdown → HTML (parsing and rendering live in md_ast.py)
 # ---------------------------------------------------------------------------
 
-def md_to_html(md_text: str) -> str:
-    """Convert markdown text to HTML. Handles the subset we actually use."""
-    lines = md_text.split("\n")
-    html_parts: list[str] = []
-    in_table = False
-    in_code = False
-    in_list = False
-    list_type = None  # "ul" or "ol"
-    in_paragraph = False
-    buffer: list[str] = []
-
-    def flush_paragraph():
-        nonlocal in_paragraph, buffer
-        if in_paragraph and buffer:
-            html_parts.append("<p>" + " ".join(buffer) + "</p>")
-            buffer = []
-            in_paragraph = False
-
-    def flush_list():
-        nonlocal in_list, list_type
-        if in_list:
-            html_parts.append(f"</{list_type}>")
-            in_list = False
-            list_type = None
-
-    def inline_format(text: str) -> str:
-        """Handle inline formatting: bold, italic, code, links."""
-        # Code spans first (so bold/italic inside code aren't processed)
-        text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
-        # Bold + italic
-        text = re.sub(r"\*\*\*(.+?)\*\*\*", r"<strong><em>\1</em></strong>", text)
-        # Bold
-        text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
-        # Italic
-        text = re.sub(r"\*(.+?)\*", r"<em>\1</em>", text)
-        # Links
-        text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2">\1</a>', text)
-        return text
+SECTION_NUMBER_RE = re.compile(r"^\d+[.)]\s+")
+WORD_RE = re.compile(r"[a-z0-9]+")
 
-    for line in lines:
-        # Code blocks
-        if line.strip().startswith("```"):
-            if in_code:
-                html_parts.append("</code></pre>")
-                in_code = False
-            else:
-                flush_paragraph()
-                flush_list()
-                lang = line.strip()[3:].strip()
-                cls = f' class="language-{lang}"' if lang else ""
-                html_parts.append(f"<pre><code{cls}>")
-                in_code = True
-            continue
 
-        if in_code:
-            html_parts.append(line.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"))
-            continue
+def md_to_html(md_text: str) -> str:
+    """Convert markdown text to HTML. Handles the subset we actually use.
+
+    Converts in a single pass without building a document tree; the output is
+    the same as md_ast.render_html(md_ast.parse(md_text)). Trees are only
+    built (and cached) for the exports.
+    """
+    return to_html(md_text)
+
+
+# Below this much markdown in total, starting worker processes costs more
+# than converting the documents in-process
+PARALLEL_MIN_BYTES = 256 * 1024
+
+
+def md_to_html_many(texts: Iterable[str], workers: Optional[int] = None,
+                    count: Optional[int] = None, total_bytes: Optional[int] = None) -> Iterator[str]:
+    """md_to_html() over independent documents, spread over processes.
+
+    Yields results in input order, identical to converting each text in
+    turn. texts may be a lazy iterable: at most two documents per worker are
+    in flight, so they never all sit in memory. Pass count and total_bytes
+    for lazy input (a list is measured here). workers=None uses one process
+    per CPU; small batches and workers=1 stay in-process.
+    """
+    if count is None or total_bytes is None:
+        texts = list(texts)
+        count, total_bytes = len(texts), sum(len(t) for t in texts)
+    workers = min(workers or os.cpu_count() or 1, count)
+    if workers < 2 or total_bytes < PARALLEL_MIN_BYTES:
+        return (md_to_html(t) for t in texts)
+    return _md_to_html_pool(texts, workers)
+
+
+def _md_to_html_pool(texts: Iterable[str], workers: int) -> Iterator[str]:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for text in texts:
+            pending.append(pool.submit(md_to_html, text))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
-        stripped = line.strip()
 
-        # Horizontal rule
-        if stripped in ("---", "***", "___") and not in_table:
-            flush_paragraph()
-            flush_list()
-            html_parts.append("<hr>")
-            continue
+# ---------------------------------------------------------------------------
+# Synthesis sections
+# ---------------------------------------------------------------------------
 
-        # Headers
-        header_match = re.match(r"^(#{1,6})\s+(.+)$", stripped)
-        if header_match:
-            flush_paragraph()
-            flush_list()
-            level = len(header_match.group(1))
-            text = inline_format(header_match.group(2))
-            slug = re.sub(r"[^a-z0-9]+", "-", text.lower().replace("<strong>", "").replace("</strong>", "").replace("<em>", "").replace("</em>", ""))
-            slug = re.sub(r"<[^>]+>", "", slug).strip("-")
-            html_parts.append(f'<h{level} id="{slug}">{text}</h{level}>')
-            continue
+def section_key(header: str) -> str:
+    """Lookup form of a header: lowercase words, no numbering or punctuation.
 
-        # Table rows
-        if "|" in stripped and stripped.startswith("|"):
-            flush_paragraph()
-            flush_list()
-            # Check if separator row
-            cells = [c.strip() for c in stripped.split("|")[1:-1]]
-            if all(re.match(r"^[-:]+$", c) for c in cells if c):
-                continue  # Skip separator row
-
-            if not in_table:
-                html_parts.append('<div class="table-wrapper"><table>')
-                in_table = True
-                # First row = header
-                html_parts.append("<thead><tr>")
-                for cell in cells:
-                    html_parts.append(f"<th>{inline_format(cell)}</th>")
-                html_parts.append("</tr></thead><tbody>")
-                continue
+    "## 2. Top 10 Quick Wins (Highest ROI)" -> "top 10 quick wins highest roi"
+    """
+    header = SECTION_NUMBER_RE.sub("", header.strip())
+    return " ".join(WORD_RE.findall(header.lower()))
 
-            html_parts.append("<tr>")
-            for cell in cells:
-                html_parts.append(f"<td>{inline_format(cell)}</td>")
-            html_parts.append("</tr>")
-            continue
 
-        if in_table and "|" not in stripped:
-            html_parts.append("</tbody></table></div>")
-            in_table = False
-
-        # Unordered list
-        ul_match = re.match(r"^[-*+]\s+(.+)$", stripped)
-        if ul_match:
-            flush_paragraph()
-            if not in_list or list_type != "ul":
-                flush_list()
-                html_parts.append("<ul>")
-                in_list = True
-                list_type = "ul"
-            html_parts.append(f"<li>{inline_format(ul_match.group(1))}</li>")
-            continue
+def index_sections(md_text: str) -> dict[str, str]:
+    """Index every ##-or-deeper section of a markdown document by header.
 
-        # Ordered list
-        ol_match = re.match(r"^\d+\.\s+(.+)$", stripped)
-        if ol_match:
-            flush_paragraph()
-            if not in_list or list_type != "ol":
-                flush_list()
-                html_parts.append("<ol>")
-                in_list = True
-                list_type = "ol"
-            html_parts.append(f"<li>{inline_format(ol_match.group(1))}</li>")
+    Headers are recognised the way md_to_html() renders them (ignoring code
+    blocks), and a section runs to the next header of the same or a higher
+    level. Each section is stored under every word prefix of its key, so
+    "Quick Wins" finds "## Quick Wins for Q3"; when several headers share a
+    prefix the first one in the document wins.
+    """
+    lines = md_text.split("\n")
+    spans: list[tuple[int, int, str]] = []  # (first line, end line, key)
+    open_sections: list[tuple[int, int, str]] = []  # (level, first line, key)
+    in_code = False
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_code = not in_code
             continue
-
-        # End list if not a list item
-        if in_list and stripped:
-            flush_list()
-
-        # Empty line
-        if not stripped:
-            flush_paragraph()
+        if in_code or not stripped.startswith("##"):
             continue
-
-        # Regular paragraph text
-        if not in_paragraph:
-            in_paragraph = True
-            buffer = []
-        buffer.append(inline_format(stripped))
-
-    # Flush remaining state
-    flush_paragraph()
-    flush_list()
-    if in_table:
-        html_parts.append("</tbody></table></div>")
-    if in_code:
-        html_parts.append("</code></pre>")
-
-    return "\n".join(html_parts)
+        m = HEADER_RE.match(stripped)
+        if not m:
+            continue
+        level = len(m.group(1))
+        while open_sections and open_sections[-1][0] >= level:
+            _, start, key = open_sections.pop()
+            spans.append((start, i, key))
+        open_sections.append((level, i, section_key(m.group(2))))
+    spans.extend((start, len(lines), key) for _, start, key in open_sections)
+
+    sections: dict[str, str] = {}
+    for start, end, key in sorted(spans):
+        text = "\n".join(lines[start:end]).strip()
+        words = key.split()
+        for n in range(1, len(words) + 1):
+            sections.setdefault(" ".join(words[:n]), text)
+    return sections
 
 
 # ---------------------------------------------------------------------------
@@ -605,21 +573,116 @@ pre code {
 """
 
 
+# ---------------------------------------------------------------------------
+# Chapter cache
+# ---------------------------------------------------------------------------
+
+CACHE_DIR = ".report-cache"
+
+# Any edit to this script (chapter template) or to the markdown converter
+# invalidates the cache
+GENERATOR_VERSION = hashlib.sha256(Path(__file__).read_bytes() + PARSER_VERSION.encode()).hexdigest()
+
+class ChapterCache:
+    """Rendered agent chapters on disk, one file per content hash.
+
+    Lets a rebuild after remediation re-render only the chapters whose
+    inputs changed. Failures to read or write are treated as misses.
+    """
+
+    def __init__(self, directory: Path):
+        self.dir = directory
+
+    def key(self, *inputs: str) -> str:
+        h = hashlib.sha256(GENERATOR_VERSION.encode())
+        for value in inputs:
+            h.update(b"\0" + value.encode())
+        return h.hexdigest()
+
+    def has(self, key: str) -> bool:
+        return (self.dir / f"{key}.html").exists()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return (self.dir / f"{key}.html").read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put(self, key: str, html: str):
+        path = self.dir / f"{key}.html"
+        tmp = path.with_suffix(f".tmp{os.getpid()}")
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(html, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def prune(self, keep: list[str]):
+        """Delete chapters this build did not use (e.g. superseded reports).
+
+        A temporary file may be a chapter another build is writing right now,
+        so only those left behind for CACHE_TMP_MAX_AGE are removed.
+        """
+        keep_names = {f"{key}.html" for key in keep}
+        cutoff = time.time() - CACHE_TMP_MAX_AGE
+        try:
+            entries = list(self.dir.iterdir())
+        except OSError:
+            return
+        for p in entries:
+            try:
+                if p.suffix == ".html":
+                    if p.name not in keep_names:
+                        p.unlink()
+                elif p.suffix.startswith(".tmp") and p.stat().st_mtime < cutoff:
+                    p.unlink()
+            except OSError:
+                pass
+
+
 # ---------------------------------------------------------------------------
 # Report Builder
 # ---------------------------------------------------------------------------
 
+# Formats for --export and the file each one is written to
+EXPORTS = {
+    "text": "FULL-REPORT.txt",
+    "json": "FULL-REPORT.json",
+    "outline": "FULL-REPORT-outline.txt",
+}
+
+
+def _write_chunks(path: str, chunks: Iterable[str]):
+    """Stream chunks to path via a temporary file in the same directory."""
+    tmp = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
 class ReportBuilder:
     """Builds the full HTML report from audit directory contents."""
 
-    def __init__(self, audit_dir: str):
+    def __init__(self, audit_dir: str, workers: Optional[int] = None, cache: bool = True):
         self.d = Path(audit_dir)
+        self.workers = workers
+        self.cache = ChapterCache(self.d / CACHE_DIR / "chapters") if cache else None
+        self.ast_cache = AstCache(self.d / CACHE_DIR / "ast") if cache else None
         self.domain = self.d.name.replace("marketing-audit-", "")
         self.agents: list[dict] = []
         self.context: dict = {}
         self.brand_dna: str = ""
         self.synthesis: str = ""
+        self.sections: dict[str, str] = {}
         self.cmo_review: str = ""
+        self.cmo_verdicts: dict[str, dict] = {}
         self.maturity_score: int = 0
 
     def load(self):
@@ -650,6 +713,7 @@ class ReportBuilder:
         agents_dir = self.d / "agents"
         if not agents_dir.exists():
             return
+        # Only metadata is kept; chapters read the markdown again when rendered
         for f in sorted(agents_dir.glob("*.md")):
             text = f.read_text()
             score_match = re.search(r"##\s*Score:\s*(\d+)\s*/\s*(\d+)", text)
@@ -660,7 +724,8 @@ class ReportBuilder:
                 "title": f.stem.replace("-", " ").title(),
                 "score": score,
                 "max_score": max_score,
-                "content": text,
+                "path": f,
+                "digest": content_digest(text),
                 "size_kb": f.stat().st_size / 1024,
             })
 
@@ -668,6 +733,7 @@ class ReportBuilder:
         p = self.d / "FULL-REPORT.md"
         if p.exists():
             self.synthesis = p.read_text()
+            self.sections = index_sections(self.synthesis)
             # Try multiple formats for maturity score
             for pattern in [
                 r"Overall Maturity Score:\s*(\d+)/100",
@@ -685,11 +751,22 @@ class ReportBuilder:
         p = self.d / "review" / "cmo-review.md"
         if p.exists():
             self.cmo_review = p.read_text()
+            self.cmo_verdicts = parse_verdicts(self.cmo_review)
 
     # ------- HTML Generation -------
 
     def build_html(self) -> str:
-        parts = [
+        return "".join(self.iter_html())
+
+    def write_html(self, path: str):
+        _write_chunks(path, self.iter_html())
+
+    def write_export(self, fmt: str, path: str):
+        _write_chunks(path, self.iter_export(fmt))
+
+    def iter_html(self) -> Iterator[str]:
+        """Produce the report in pieces, one section or chapter at a time."""
+        yield "\n".join([
             "<!DOCTYPE html>",
             '<html lang="en">',
             "<head>",
@@ -699,26 +776,70 @@ class ReportBuilder:
             f"<style>{CSS}</style>",
             "</head>",
             "<body>",
-            self._cover_page(),
-            self._methodology_section(),
-            self._table_of_contents(),
-            '<div class="content">',
-            self._exec_summary_section(),
-            self._score_breakdown_section(),
-            self._quick_wins_section(),
-            self._critical_issues_section(),
-            self._roadmap_section(),
-            self._agent_deepdives(),
-            self._quality_gate_section(),
-            self._competitive_section(),
-            self._scoring_methodology_section(),
-            self._audit_log_section(),
+        ])
+        for section in (self._cover_page, self._methodology_section, self._table_of_contents):
+            yield "\n" + section()
+        yield '\n<div class="content">'
+        for section in (
+            self._exec_summary_section,
+            self._score_breakdown_section,
+            self._quick_wins_section,
+            self._critical_issues_section,
+            self._roadmap_section,
+        ):
+            yield "\n" + section()
+        yield "\n"
+        for i, chapter in enumerate(self._iter_agent_chapters()):
+            yield "\n" + chapter if i else chapter
+        for section in (
+            self._quality_gate_section,
+            self._competitive_section,
+            self._scoring_methodology_section,
+            self._audit_log_section,
+        ):
+            yield "\n" + section()
+        yield "\n" + "\n".join([
             "</div>",
             '<div class="page-footer">Confidential</div>',
             "</body>",
             "</html>",
-        ]
-        return "\n".join(parts)
+        ])
+
+    def iter_export(self, fmt: str) -> Iterator[str]:
+        """Produce the agent reports as "text", "json" or an "outline".
+
+        Each format walks the parsed tree of every report (see md_ast.py), so
+        with a warm cache exporting parses nothing.
+        """
+        verdicts = [self.cmo_verdicts.get(normalize_name(agent["name"])) for agent in self.agents]
+        if fmt == "json":
+            yield f'{{"domain": {json.dumps(self.domain)}, "business": {json.dumps(self._business_name(), ensure_ascii=False)}, "agents": ['
+            for i, (agent, verdict) in enumerate(zip(self.agents, verdicts)):
+                yield (", " if i else "") + json.dumps({
+                    "name": agent["name"],
+                    "title": agent["title"],
+                    "score": agent["score"],
+                    "max_score": agent["max_score"],
+                    "verdict": verdict["verdict"] if verdict else None,
+                    "blocks": token_tree(self._agent_doc(agent)),
+                }, ensure_ascii=False)
+            yield "]}\n"
+            return
+
+        render = {"text": render_text, "outline": render_outline}[fmt]
+        title = f"Marketing Audit: {self._business_name()}"
+        yield f"{title}\n{'=' * len(title)}\n" if fmt == "text" else f"# {title}\n"
+        for agent, verdict in zip(self.agents, verdicts):
+            heading = agent["title"]
+            if agent["score"] is not None:
+                heading += f" ({agent['score']}/{agent['max_score']})"
+            if verdict is not None:
+                heading += f" [Quality Gate: {verdict['verdict']}]"
+            body = render(self._agent_doc(agent))
+            if fmt == "text":
+                yield f"\n\n{heading}\n{'=' * len(heading)}\n\n{body}"
+            else:
+                yield f"\n## {heading}\n{body}"
 
     def _business_name(self) -> str:
         return self.context.get("business", self.domain)
@@ -863,11 +984,9 @@ organic demand can be highly successful despite low infrastructure scores.</p>
         toc.append("</div>")
         return "\n".join(toc)
 
-    def _extract_section(self, header_pattern: str) -> str:
-        """Extract a section from the synthesis report by header pattern."""
-        pattern = rf"(##\s*{header_pattern}.*?)(?=\n##\s|\Z)"
-        m = re.search(pattern, self.synthesis, re.DOTALL | re.IGNORECASE)
-        return m.group(1).strip() if m else ""
+    def _extract_section(self, header: str) -> str:
+        """Look up a synthesis section whose header starts with these words."""
+        return self.sections.get(section_key(header), "")
 
     def _exec_summary_section(self) -> str:
         content = self._extract_section("Executive Summary")
@@ -915,48 +1034,85 @@ organic demand can be highly successful despite low infrastructure scores.</p>
             content = "## 90-Day Roadmap\n\nSee individual agent reports for implementation timelines."
         return f'<div class="chapter" id="90-day-roadmap">\n{md_to_html(content)}\n</div>'
 
-    def _agent_deepdives(self) -> str:
-        """Generate one chapter per agent with full report content."""
-        chapters = []
-        for agent in self.agents:
-            score_text = ""
-            score_class = ""
-            if agent["score"] is not None:
-                pct = (agent["score"] / agent["max_score"] * 100) if agent["max_score"] else 0
-                if pct >= 70:
-                    score_class = "score-high"
-                elif pct >= 50:
-                    score_class = "score-mid"
-                else:
-                    score_class = "score-low"
-                score_text = f'<span class="score-badge {score_class}">{agent["score"]}/{agent["max_score"]}</span>'
-
-            # Parse the CMO review verdict for this agent
-            gate_html = ""
-            if self.cmo_review:
-                for line in self.cmo_review.splitlines():
-                    name_variants = [agent["name"], agent["title"].lower()]
-                    if any(v in line.lower() for v in name_variants):
-                        if "PASS" in line:
-                            gate_html = '<span class="gate-pass">PASS</span>'
-                        elif "FAIL" in line:
-                            gate_html = '<span class="gate-fail">FAIL</span>'
-
-            meta_parts = [f"{agent['size_kb']:.1f} KB report"]
-            if gate_html:
-                meta_parts.append(f"Quality Gate: {gate_html}")
-
-            chapter = f"""
+    def _iter_agent_chapters(self) -> Iterator[str]:
+        """Generate one chapter per agent with full report content.
+
+        Chapters whose inputs are unchanged since the last build come from
+        the chapter cache; only the rest are converted (see md_to_html_many),
+        reading each agent's markdown from disk just before it is needed.
+        """
+        verdicts = [self.cmo_verdicts.get(normalize_name(agent["name"])) for agent in self.agents]
+        keys: list = [None] * len(self.agents)
+        cached = [False] * len(self.agents)
+        if self.cache:
+            for i, (agent, verdict) in enumerate(zip(self.agents, verdicts)):
+                keys[i] = self.cache.key(
+                    agent["name"], f"{agent['size_kb']:.1f}",
+                    verdict["verdict"] if verdict else "", agent["digest"],
+                )
+                cached[i] = self.cache.has(keys[i])
+
+        missing = [i for i in range(len(self.agents)) if not cached[i]]
+        bodies = md_to_html_many(
+            (self._agent_content(self.agents[i]) for i in missing), self.workers,
+            count=len(missing), total_bytes=int(sum(self.agents[i]["size_kb"] for i in missing) * 1024),
+        )
+        for i, agent in enumerate(self.agents):
+            chapter = self.cache.get(keys[i]) if cached[i] else None
+            if chapter is None:
+                # Not cached, or the cache entry vanished since has()
+                body = md_to_html(self._agent_content(agent)) if cached[i] else next(bodies)
+                chapter = self._agent_chapter(agent, verdicts[i], body)
+                # A report edited since it was loaded no longer matches its key
+                if self.cache and not agent.get("changed"):
+                    self.cache.put(keys[i], chapter)
+            yield chapter
+        if self.cache:
+            self.cache.prune(keys)
+            self.ast_cache.prune([self.ast_cache.key(agent["digest"]) for agent in self.agents])
+
+    def _agent_content(self, agent: dict) -> str:
+        """The agent's markdown as it is now, noting if it changed since loading."""
+        text = agent["path"].read_text()
+        agent["changed"] = content_digest(text) != agent["digest"]
+        return text
+
+    def _agent_doc(self, agent: dict) -> list[dict]:
+        return parse_cached(self._agent_content(agent), self.ast_cache)
+
+    def _agent_chapter(self, agent: dict, verdict: Optional[dict], body: str) -> str:
+        score_text = ""
+        score_class = ""
+        if agent["score"] is not None:
+            pct = (agent["score"] / agent["max_score"] * 100) if agent["max_score"] else 0
+            if pct >= 70:
+                score_class = "score-high"
+            elif pct >= 50:
+                score_class = "score-mid"
+            else:
+                score_class = "score-low"
+            score_text = f'<span class="score-badge {score_class}">{agent["score"]}/{agent["max_score"]}</span>'
+
+        # CMO review verdict for this agent
+        gate_html = ""
+        if verdict is not None:
+            if verdict["verdict"] == "PASS":
+                gate_html = '<span class="gate-pass">PASS</span>'
+            else:
+                gate_html = '<span class="gate-fail">FAIL</span>'
+
+        meta_parts = [f"{agent['size_kb']:.1f} KB report"]
+        if gate_html:
+            meta_parts.append(f"Quality Gate: {gate_html}")
+
+        return f"""
 <div class="chapter" id="agent-{agent['name']}">
     <div class="chapter-header">
         <h2>{agent['title']} {score_text}</h2>
         <div class="chapter-meta">{' &bull; '.join(meta_parts)}</div>
     </div>
-    {md_to_html(agent['content'])}
+    {body}
 </div>"""
-            chapters.append(chapter)
-
-        return "\n".join(chapters)
 
     def _quality_gate_section(self) -> str:
         if not self.cmo_review:
@@ -995,12 +1151,191 @@ organic demand can be highly successful despite low infrastructure scores.</p>
 # Main
 # ---------------------------------------------------------------------------
 
+def build_report(audit_dir: str, workers: Optional[int] = None, cache: bool = True,
+                 exports: Iterable[str] = ()) -> str:
+    """Write FULL-REPORT.html (and any EXPORTS asked for) into an audit directory.
+
+    Returns the HTML path.
+    """
+    builder = ReportBuilder(audit_dir, workers=workers, cache=cache)
+    builder.load()
+    html_path = os.path.join(audit_dir, "FULL-REPORT.html")
+    builder.write_html(html_path)
+    for fmt in exports:
+        builder.write_export(fmt, os.path.join(audit_dir, EXPORTS[fmt]))
+    return html_path
+
+
+def _batch_build(audit_dir: str, cache: bool, exports: list[str]) -> dict:
+    """Process-pool task for batch mode: errors are returned, not raised."""
+    start = time.perf_counter()
+    try:
+        html_path, error = build_report(audit_dir, workers=1, cache=cache, exports=exports), None
+    except Exception as e:
+        html_path, error = None, f"{type(e).__name__}: {e}"
+    return {"audit_dir": audit_dir, "html": html_path, "build": time.perf_counter() - start, "error": error}
+
+
+def _batch_builds(audit_dirs: list[str], jobs: int, cache: bool, exports: list[str]) -> Iterator[dict]:
+    """_batch_build() results in completion order, surviving dead build processes.
+
+    At most jobs directories are building at any time, so when a build
+    process dies (and takes the pool with it) the directories that were
+    building are known. The rest carry on in a fresh pool; the interrupted
+    ones are then rebuilt one at a time, which pins the failure on the
+    directory whose build really kills its process.
+    """
+    queue = deque(audit_dirs)
+    suspects: deque = deque()
+    while queue or suspects:
+        isolated = bool(suspects) and not queue
+        todo, window = (suspects, 1) if isolated else (queue, jobs)
+        with ProcessPoolExecutor(max_workers=window) as pool:
+            running = {}
+            while todo or running:
+                while todo and len(running) < window:
+                    audit_dir = todo.popleft()
+                    running[pool.submit(_batch_build, audit_dir, cache, exports)] = audit_dir
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in done:
+                    audit_dir = running.pop(future)
+                    try:
+                        yield future.result()
+                    except BrokenProcessPool:
+                        broken = True
+                        running[future] = audit_dir
+                if broken:
+                    if len(running) == 1:
+                        yield {"audit_dir": next(iter(running.values())), "html": None, "build": None,
+                               "error": "build process died"}
+                    else:
+                        suspects.extend(running.values())
+                    break
+
+
+def expand_audit_dirs(patterns: list[str]) -> list[str]:
+    """Audit directories from paths and (quoted) globs, in order, without repeats."""
+    dirs, seen = [], set()
+    for pattern in patterns:
+        pattern = os.path.expanduser(pattern)
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            real = os.path.realpath(path)
+            if real not in seen and (os.path.isdir(path) or not glob.has_magic(pattern)):
+                seen.add(real)
+                dirs.append(path.rstrip(os.sep) or path)
+    return dirs
+
+
+def run_batch(audit_dirs: list[str], args) -> int:
+    """Build many reports in a process pool, printing PDFs through one browser."""
+    jobs = min(args.jobs or os.cpu_count() or 1, len(audit_dirs))
+    chrome = None if args.no_pdf else find_chrome()
+    if not chrome and not args.no_pdf:
+        print("Warning: Chrome/Chromium not found (set CHROME_PATH to its executable); building HTML only")
+
+    print(f"[batch] Building {len(audit_dirs)} reports, {jobs} at a time")
+    start = time.perf_counter()
+    results = {d: {"audit_dir": d, "html": None, "build": None, "pdf": None, "error": None} for d in audit_dirs}
+    pdf_jobs = {}
+    worker = PdfWorker(chrome, timeout=args.pdf_timeout) if chrome else None
+    try:
+        found = []
+        for audit_dir in audit_dirs:
+            if os.path.isdir(audit_dir):
+                found.append(audit_dir)
+            else:
+                results[audit_dir]["error"] = "directory not found"
+        for r in _batch_builds(found, jobs, not args.no_cache, args.export):
+            results[r["audit_dir"]].update(r)
+            if r["error"]:
+                print(f"[batch] {r['audit_dir']}: FAILED {r['error']}")
+                continue
+            print(f"[batch] {r['audit_dir']}: HTML in {r['build']:.2f}s")
+            if worker:
+                pdf_path = os.path.join(r["audit_dir"], "FULL-REPORT.pdf")
+                pdf_jobs[r["audit_dir"]] = worker.submit(r["html"], pdf_path)
+        for audit_dir, future in pdf_jobs.items():
+            try:
+                future.result()
+            except Exception as e:
+                results[audit_dir]["error"] = f"PDF: {e}"
+                print(f"[batch] {audit_dir}: PDF FAILED {e}")
+            else:
+                print(f"[batch] {audit_dir}: PDF in {future.elapsed:.2f}s")
+            results[audit_dir]["pdf"] = future.elapsed
+    finally:
+        if worker:
+            worker.close()
+
+    wall = time.perf_counter() - start
+    rows = list(results.values())
+    failed = [r for r in rows if r["error"]]
+    builds = [r["build"] for r in rows if r["build"] is not None]
+    pdfs = [r["pdf"] for r in rows if r["pdf"] is not None]
+
+    print("")
+    print("Batch Summary")
+    print(f"- Reports: {len(rows)} ({len(rows) - len(failed)} ok, {len(failed)} failed)")
+    print(f"- Wall time: {wall:.1f}s with {jobs} build processes" + (" and one browser" if worker else ""))
+    for label, times in (("HTML build", builds), ("PDF render", pdfs)):
+        if times:
+            print(f"- {label}: {sum(times):.1f}s total, {sum(times) / len(times):.2f}s mean, {max(times):.2f}s max")
+    print("")
+    width = max(len(r["audit_dir"]) for r in rows)
+    print(f"{'audit directory':<{width}}  {'html':>7}  {'pdf':>7}  status")
+    for r in rows:
+        build = f"{r['build']:.2f}s" if r["build"] is not None else "-"
+        pdf = f"{r['pdf']:.2f}s" if r["pdf"] is not None else "-"
+        print(f"{r['audit_dir']:<{width}}  {build:>7}  {pdf:>7}  {'FAILED ' + r['error'] if r['error'] else 'ok'}")
+    return 1 if failed else 0
+
+
 def main():
-    if len(sys.argv) < 2:
-        print(f"Usage: python3 {sys.argv[0]} /tmp/marketing-audit-<domain>")
+    parser = argparse.ArgumentParser(
+        description="Build FULL-REPORT.html and FULL-REPORT.pdf for one or more audit directories.",
+    )
+    parser.add_argument(
+        "audit_dirs", nargs="+", metavar="audit_dir",
+        help='e.g. /tmp/marketing-audit-example.com; several directories or a quoted glob such as "/tmp/marketing-audit-*" run as a batch',
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="processes for rendering agent chapters (default: one per CPU; 1 = no pool)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="batch mode: reports built at the same time (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--pdf-timeout", type=float, default=30,
+        help="seconds allowed for printing each PDF (default: 30)",
+    )
+    parser.add_argument("--no-pdf", action="store_true", help="build the HTML only")
+    parser.add_argument(
+        "--export", action="append", choices=sorted(EXPORTS), default=[],
+        help="also write the agent reports as " + ", ".join(f"{fmt} ({name})" for fmt, name in EXPORTS.items())
+        + "; may be repeated",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"re-render every chapter instead of reusing {CACHE_DIR}/ in the audit directory",
+    )
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    audit_dirs = expand_audit_dirs(args.audit_dirs)
+    if not audit_dirs:
+        print(f"Error: no audit directories match: {' '.join(args.audit_dirs)}")
         sys.exit(1)
+    if len(audit_dirs) > 1 or glob.has_magic(args.audit_dirs[0]):
+        sys.exit(run_batch(audit_dirs, args))
 
-    audit_dir = sys.argv[1]
+    audit_dir = audit_dirs[0]
 
     if not os.path.isdir(audit_dir):
         print(f"Error: directory not found: {audit_dir}")
@@ -1009,55 +1344,35 @@ def main():
     print(f"Building report for: {audit_dir}")
 
     # Build report
-    builder = ReportBuilder(audit_dir)
-    builder.load()
-    html = builder.build_html()
-
-    # Write HTML
-    html_path = os.path.join(audit_dir, "FULL-REPORT.html")
-    with open(html_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    html_path = build_report(audit_dir, workers=args.workers, cache=not args.no_cache, exports=args.export)
     print(f"HTML report: {html_path} ({os.path.getsize(html_path) / 1024:.1f} KB)")
+    for fmt in args.export:
+        path = os.path.join(audit_dir, EXPORTS[fmt])
+        print(f"Export ({fmt}): {path} ({os.path.getsize(path) / 1024:.1f} KB)")
+    if args.no_pdf:
+        return
 
     # Convert to PDF via Chrome headless
     pdf_path = os.path.join(audit_dir, "FULL-REPORT.pdf")
-    chrome = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+    chrome = find_chrome()
 
-    if not os.path.exists(chrome):
-        print(f"Warning: Chrome not found at {chrome}")
+    if not chrome:
+        print("Warning: Chrome/Chromium not found (set CHROME_PATH to its executable)")
         print("HTML report generated. Convert manually or install Chrome.")
         return
 
     print("Converting to PDF via Chrome headless...")
     try:
-        result = subprocess.run(
-            [
-                chrome,
-                "--headless",
-                "--disable-gpu",
-                "--no-sandbox",
-                "--run-all-compositor-stages-before-draw",
-                "--virtual-time-budget=3000",
-                f"--print-to-pdf={pdf_path}",
-                "--no-pdf-header-footer",
-                html_path,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        if os.path.exists(pdf_path):
-            size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
-            print(f"PDF report:  {pdf_path} ({size_mb:.2f} MB)")
-            print("Done.")
-        else:
-            print(f"PDF conversion may have failed. stderr: {result.stderr[:500]}")
-    except subprocess.TimeoutExpired:
+        with PdfWorker(chrome, timeout=args.pdf_timeout) as worker:
+            worker.render(html_path, pdf_path)
+        size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+        print(f"PDF report:  {pdf_path} ({size_mb:.2f} MB)")
+        print("Done.")
+    except PdfTimeout:
         print("Chrome timed out. HTML report is still available.")
     except Exception as e:
         print(f"PDF conversion error: {e}")
         print("HTML report is still available.")
 
-
 if __name__ == "__main__":
     main()
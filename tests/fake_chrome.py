@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Stand-in for headless Chrome, for testing pdf_worker.py without a browser.
+
+Started the way pdf_worker.Browser starts Chrome: it reads --user-data-dir,
+listens on a free port, writes DevToolsActivePort into the profile directory
+and answers the DevTools commands the worker sends over one WebSocket
+connection. Page.printToPDF returns a small fake PDF naming the page and this
+process's pid.
+
+Pages steer it with a marker comment:
+
+  <!-- fake:crash -->       exit as soon as the page is printed
+  <!-- fake:crash-once -->  the same, unless <page>.crashed exists (created
+                            on the first crash, so a retry succeeds)
+  <!-- fake:hang -->        never answer Page.printToPDF
+
+If $FAKE_CHROME_LOG is set, one line with the pid is appended to it per
+browser start.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+import sys
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf_worker import OP_CLOSE, OP_TEXT, WS_GUID, _mask  # noqa: E402
+
+
+class Connection:
+    """Server side of one WebSocket connection (text frames only)."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.buf = b""
+        while b"\r\n\r\n" not in self.buf:
+            self._fill()
+        head, _, self.buf = self.buf.partition(b"\r\n\r\n")
+        headers = {}
+        for line in head.decode("latin-1").split("\r\n")[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        accept = base64.b64encode(hashlib.sha1((headers["sec-websocket-key"] + WS_GUID).encode()).digest())
+        self.sock.sendall(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+
+    def _fill(self):
+        chunk = self.sock.recv(65536)
+        if not chunk:
+            raise EOFError
+        self.buf += chunk
+
+    def _read(self, n):
+        while len(self.buf) < n:
+            self._fill()
+        data, self.buf = self.buf[:n], self.buf[n:]
+        return data
+
+    def recv(self):
+        """Next text message, or None once the client closes."""
+        b0, b1 = self._read(2)
+        n = b1 & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", self._read(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", self._read(8))[0]
+        mask = self._read(4)
+        payload = _mask(self._read(n), mask)
+        if b0 & 0x0F == OP_CLOSE:
+            return None
+        return payload.decode()
+
+    def send(self, message):
+        data = json.dumps(message).encode()
+        n = len(data)
+        if n < 126:
+            header = bytes([0x80 | OP_TEXT, n])
+        elif n < 1 << 16:
+            header = bytes([0x80 | OP_TEXT, 126]) + struct.pack("!H", n)
+        else:
+            header = bytes([0x80 | OP_TEXT, 127]) + struct.pack("!Q", n)
+        self.sock.sendall(header + data)
+
+
+def page_path(url):
+    return unquote(urlsplit(url).path)
+
+
+def serve(conn):
+    targets = 0
+    pages = {}  # session -> page path
+    while True:
+        text = conn.recv()
+        if text is None:
+            return
+        message = json.loads(text)
+        method, params, session = message["method"], message.get("params", {}), message.get("sessionId")
+        reply = {"id": message["id"], "result": {}}
+        if session:
+            reply["sessionId"] = session
+
+        if method == "Target.createTarget":
+            targets += 1
+            reply["result"] = {"targetId": f"target-{targets}"}
+        elif method == "Target.attachToTarget":
+            reply["result"] = {"sessionId": f"session-{params['targetId']}"}
+        elif method == "Page.navigate":
+            path = page_path(params["url"])
+            if not os.path.exists(path):
+                reply["result"] = {"errorText": "net::ERR_FILE_NOT_FOUND"}
+            else:
+                pages[session] = path
+                reply["result"] = {"frameId": "frame"}
+                conn.send(reply)
+                conn.send({"method": "Page.loadEventFired", "params": {}, "sessionId": session})
+                continue
+        elif method == "Page.printToPDF":
+            path = pages[session]
+            html = Path(path).read_text()
+            if "<!-- fake:hang -->" in html:
+                continue
+            if "<!-- fake:crash -->" in html:
+                os._exit(1)
+            if "<!-- fake:crash-once -->" in html and not os.path.exists(path + ".crashed"):
+                Path(path + ".crashed").touch()
+                os._exit(1)
+            pdf = f"%PDF-1.4\n% {Path(path).name} rendered by {os.getpid()}\n%%EOF\n".encode()
+            reply["result"] = {"data": base64.b64encode(pdf).decode()}
+        elif method == "Browser.close":
+            conn.send(reply)
+            return
+        conn.send(reply)
+
+
+def main():
+    profile = next(arg.split("=", 1)[1] for arg in sys.argv[1:] if arg.startswith("--user-data-dir="))
+    log = os.environ.get("FAKE_CHROME_LOG")
+    if log:
+        with open(log, "a") as f:
+            f.write(f"{os.getpid()}\n")
+
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    tmp = os.path.join(profile, "DevToolsActivePort.tmp")
+    with open(tmp, "w") as f:
+        f.write(f"{port}\n/devtools/browser/fake\n")
+    os.replace(tmp, os.path.join(profile, "DevToolsActivePort"))
+
+    sock, _ = server.accept()
+    try:
+        serve(Connection(sock))
+    except (EOFError, OSError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Shared helpers for the test suite.
+
+Run from the repository root with either runner:
+
+  python3 -m unittest discover -s tests
+  python3 -m pytest tests
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def load_script(name, filename):
+    """Import a script from the repository root (the generator's name has a hyphen).
+
+    The module is registered in sys.modules so its functions can be pickled
+    for worker processes, and loaded only once per test run.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def report_generator():
+    return load_script("report_generator", "report-generator.py")
@@ -0,0 +1,59 @@
+"""CMO review verdict parsing shared by the dashboard and report generator."""
+
+import unittest
+
+import support  # noqa: F401  (puts the repository root on sys.path)
+from cmo_review import normalize_name, parse_verdicts
+
+REVIEW = """\
+# CMO Review
+
+## Verdicts
+
+| Report | Depth | Evidence | Action | Brand | Consist | Honesty | Insight | Total | Verdict |
+|--------|-------|----------|--------|-------|---------|---------|---------|-------|---------|
+| SEO Audit | 5 | 4 | 5 | 4 | 4 | 5 | 4 | 31/35 | ✅ PASS |
+| **page-cro.md** | 3 | 2 | 3 | 3 | 2 | 3 | 2 | 18/35 | ❌ FAIL |
+| Copywriting | 4 | 4 | 4 | 4 | 4 | 4 | 4 | n/a | PASS |
+| seo_audit | 1 | 1 | 1 | 1 | 1 | 1 | 1 | 7/35 | FAIL |
+
+## Weak Reports (FAIL)
+
+| Report | Reason | Action |
+|--------|--------|--------|
+| Paid Ads | Generic | PASS to remediation |
+"""
+
+
+class NormalizeNameTest(unittest.TestCase):
+    def test_report_names_match_agent_files(self):
+        for name in ("SEO Audit", "seo-audit.md", "**seo_audit**", "`SEO  audit`"):
+            with self.subTest(name=name):
+                self.assertEqual(normalize_name(name), "seo-audit")
+
+
+class ParseVerdictsTest(unittest.TestCase):
+    def setUp(self):
+        self.verdicts = parse_verdicts(REVIEW)
+
+    def test_verdict_rows(self):
+        self.assertEqual(self.verdicts["seo-audit"], {"name": "SEO Audit", "verdict": "PASS", "total": 31})
+        self.assertEqual(self.verdicts["page-cro"], {"name": "**page-cro.md**", "verdict": "FAIL", "total": 18})
+
+    def test_unreadable_total_is_zero(self):
+        self.assertEqual(self.verdicts["copywriting"]["total"], 0)
+
+    def test_first_row_wins(self):
+        self.assertEqual(self.verdicts["seo-audit"]["verdict"], "PASS")
+
+    def test_narrow_tables_are_not_verdicts(self):
+        self.assertNotIn("paid-ads", self.verdicts)
+        self.assertEqual(sorted(self.verdicts), ["copywriting", "page-cro", "seo-audit"])
+
+    def test_no_table(self):
+        self.assertEqual(parse_verdicts(""), {})
+        self.assertEqual(parse_verdicts("Everything looks PASS-able."), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""crawl_index.py: building, storing, loading and querying the page index."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (puts the repository root on sys.path)
+import crawl_index
+from crawl_index import build_index, ensure_index, index_path, load_index
+
+CRAWL = (
+    "# Crawl Data: example.com\n"
+    "Crawled 3 pages\n"
+    "\n"
+    "## PAGE: https://example.com/\n"
+    "Home page ✓\n"
+    "See the ## PAGE: section below (not a page).\n"
+    "\n"
+    "  ## PAGE: https://example.com/pricing\n"
+    "Pricing\n"
+    "## PAGE:\n"
+    "No URL"
+)
+
+
+class CrawlIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.crawl = self.dir / "crawl-data.md"
+        self.crawl.write_text(CRAWL, encoding="utf-8")
+
+    def expected_pages(self):
+        data = CRAWL.encode()
+        starts = [data.index(b"## PAGE: https://example.com/\n"), data.index(b"  ## PAGE: https://example.com/pricing"),
+                  data.index(b"## PAGE:\nNo URL")]
+        ends = starts[1:] + [len(data)]
+        return [data[start:end] for start, end in zip(starts, ends)]
+
+    def test_build(self):
+        index = build_index(self.crawl)
+        self.assertEqual([page.url for page in index.pages], ["https://example.com/", "https://example.com/pricing", ""])
+        self.assertEqual(index.size, len(CRAWL.encode()))
+        self.assertEqual(index.lines, CRAWL.count("\n") + 1)
+        for page, expected in zip(index.pages, self.expected_pages()):
+            self.assertEqual(index.read_page(page), expected.decode())
+            self.assertEqual(page.sha256, hashlib.sha256(expected).hexdigest())
+
+    def test_round_trip(self):
+        built = build_index(self.crawl)
+        built.write()
+        loaded = load_index(self.crawl)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.pages, built.pages)
+        self.assertEqual((loaded.size, loaded.mtime_ns, loaded.lines), (built.size, built.mtime_ns, built.lines))
+        self.assertEqual(loaded.read_page(loaded.pages[0]), self.expected_pages()[0].decode())
+
+    def test_find(self):
+        index = build_index(self.crawl)
+        self.assertEqual(index.find("https://example.com/pricing"), index.pages[1])
+        self.assertIsNone(index.find("https://example.com/missing"))
+
+    def test_ensure_index_stores_and_reuses(self):
+        self.assertIsNone(load_index(self.crawl))
+        index = ensure_index(self.crawl)
+        self.assertTrue(index.rebuilt)
+        self.assertTrue(os.path.exists(index_path(str(self.crawl))))
+        again = ensure_index(self.crawl)
+        self.assertFalse(again.rebuilt)
+        self.assertEqual(again.pages, index.pages)
+
+    def test_stale_after_modification(self):
+        ensure_index(self.crawl)
+        with open(self.crawl, "a", encoding="utf-8") as f:
+            f.write("\n## PAGE: https://example.com/blog\nBlog\n")
+        self.assertIsNone(load_index(self.crawl))
+        index = ensure_index(self.crawl)
+        self.assertTrue(index.rebuilt)
+        self.assertEqual(index.pages[-1].url, "https://example.com/blog")
+        self.assertEqual(index.read_page(index.pages[-1]), "## PAGE: https://example.com/blog\nBlog\n")
+
+    def test_corrupt_index_is_rebuilt(self):
+        Path(index_path(str(self.crawl))).write_text(f"{crawl_index.MAGIC}\t{crawl_index.FORMAT_VERSION}\tx\n")
+        self.assertIsNone(load_index(self.crawl))
+        self.assertTrue(ensure_index(self.crawl).rebuilt)
+
+    def test_empty_file(self):
+        self.crawl.write_bytes(b"")
+        index = ensure_index(self.crawl)
+        self.assertEqual((index.pages, index.lines, index.size), ([], 0, 0))
+        self.assertEqual(load_index(self.crawl).pages, [])
+
+    def test_page_marker_mid_line_is_not_a_page(self):
+        self.crawl.write_text("intro ## PAGE: https://example.com/a\n## PAGE: https://example.com/b\n")
+        self.assertEqual([page.url for page in build_index(self.crawl).pages], ["https://example.com/b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+"""Dashboard parse cache and fleet bookkeeping."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import support  # noqa: F401  (puts the repository root on sys.path)
+import dashboard
+
+
+class CountingParser:
+    """A parser that records how often it actually ran."""
+
+    def __init__(self, parser=None):
+        self.parser = parser or (lambda path: path.read_text())
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        return self.parser(path)
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = self.dir / "context.md"
+        self.path.write_text("Type: SaaS\n")
+        self.cache = dashboard.ParseCache()
+        self.parser = CountingParser()
+
+    def set_mtime(self, ns):
+        os.utime(self.path, ns=(ns, ns))
+
+    def test_unchanged_file_is_parsed_once(self):
+        self.assertEqual(self.cache.get(self.path, self.parser), "Type: SaaS\n")
+        self.assertEqual(self.cache.get(self.path, self.parser), "Type: SaaS\n")
+        self.assertEqual(self.parser.calls, 1)
+
+    def test_size_change_reparses(self):
+        self.set_mtime(1_000_000_000)
+        self.cache.get(self.path, self.parser)
+        self.path.write_text("Type: E-commerce\n")
+        self.set_mtime(1_000_000_000)
+        self.assertEqual(self.cache.get(self.path, self.parser), "Type: E-commerce\n")
+        self.assertEqual(self.parser.calls, 2)
+
+    def test_mtime_change_reparses(self):
+        self.set_mtime(1_000_000_000)
+        self.cache.get(self.path, self.parser)
+        self.path.write_text("Type: Agency\n")  # same size
+        self.set_mtime(2_000_000_000)
+        self.assertEqual(self.cache.get(self.path, self.parser), "Type: Agency\n")
+        self.assertEqual(self.parser.calls, 2)
+
+    def test_replaced_file_reparses(self):
+        self.set_mtime(1_000_000_000)
+        self.cache.get(self.path, self.parser)
+        other = self.dir / "context.md.tmp"
+        other.write_text("Type: Agency\n")
+        os.utime(other, ns=(1_000_000_000, 1_000_000_000))
+        os.replace(other, self.path)  # same size and mtime, new inode
+        self.assertEqual(self.cache.get(self.path, self.parser), "Type: Agency\n")
+        self.assertEqual(self.parser.calls, 2)
+
+    def test_missing_file(self):
+        self.cache.get(self.path, self.parser)
+        self.path.unlink()
+        self.assertIsNone(self.cache.get(self.path, self.parser))
+        self.path.write_text("Type: SaaS\n")
+        self.assertEqual(self.cache.get(self.path, self.parser), "Type: SaaS\n")
+        self.assertEqual(self.parser.calls, 2)
+
+    def test_undecodable_file_is_not_an_error(self):
+        self.path.write_bytes(b"Type: \xff\xfe half-written")
+        self.assertIsNone(self.cache.get(self.path, dashboard.parse_context))
+        self.path.write_text("Type: SaaS\n")
+        self.assertEqual(self.cache.get(self.path, dashboard.parse_context)["type"], "SaaS")
+
+    def test_forget_drops_entries_below_a_directory(self):
+        sibling = self.dir.parent / (self.dir.name + "-other")
+        sibling.mkdir()
+        self.addCleanup(shutil.rmtree, sibling)
+        (sibling / "context.md").write_text("Type: SaaS\n")
+        self.cache.get(self.path, self.parser)
+        self.cache.get(sibling / "context.md", self.parser)
+        self.cache.forget(self.dir)
+        self.cache.get(self.path, self.parser)
+        self.cache.get(sibling / "context.md", self.parser)
+        self.assertEqual(self.parser.calls, 3)
+
+
+class FleetTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        self.make_audit("a.com", "Type: SaaS\n")
+        (self.root / "unrelated").mkdir()
+        self.watcher = dashboard.PollingWatcher()
+        self.fleet = dashboard.Fleet(self.root, self.watcher, dashboard.ParseCache())
+
+    def make_audit(self, domain, context):
+        audit = self.root / f"marketing-audit-{domain}"
+        audit.mkdir()
+        (audit / "context.md").write_text(context)
+        return audit
+
+    def audit(self, domain):
+        return self.fleet.audits[str(self.root / f"marketing-audit-{domain}")]
+
+    def test_finds_audit_directories_only(self):
+        self.assertEqual([Path(p).name for p in self.fleet.ordered()], ["marketing-audit-a.com"])
+        self.assertEqual(self.audit("a.com")["business_type"], "SaaS")
+
+    def test_new_audit_is_picked_up(self):
+        audit = self.make_audit("b.com", "Type: Agency\n")
+        self.assertTrue(self.fleet.apply({str(audit)}))
+        self.assertEqual(self.audit("b.com")["business_type"], "Agency")
+
+    def test_change_refreshes_only_its_audit(self):
+        self.make_audit("b.com", "Type: Agency\n")
+        self.fleet.rescan()
+        before = self.audit("a.com")
+        context = self.root / "marketing-audit-b.com" / "context.md"
+        context.write_text("Type: Local services\n")
+        self.assertTrue(self.fleet.apply({str(context)}))
+        self.assertEqual(self.audit("b.com")["business_type"], "Local services")
+        self.assertIs(self.audit("a.com"), before)
+
+    def test_changes_outside_audits_are_ignored(self):
+        unrelated = self.root / "unrelated" / "notes.md"
+        unrelated.write_text("x")
+        self.assertFalse(self.fleet.apply({str(unrelated), str(self.root.parent / "elsewhere")}))
+
+    def test_deleted_audit_is_dropped_with_its_cache_entries(self):
+        audit = self.make_audit("b.com", "Type: Agency\n")
+        self.fleet.rescan()
+        shutil.rmtree(audit)
+        self.fleet.apply({str(audit)})
+        self.assertNotIn(str(audit), self.fleet.audits)
+        prefix = str(audit) + os.sep
+        self.assertFalse([key for key in self.fleet.cache._entries if key.startswith(prefix)])
+
+
+class CollectStatusTest(unittest.TestCase):
+    def setUp(self):
+        self.audit = Path(tempfile.mkdtemp()) / "marketing-audit-a.com"
+        self.addCleanup(shutil.rmtree, self.audit.parent)
+        (self.audit / "agents").mkdir(parents=True)
+        (self.audit / "review").mkdir()
+        (self.audit / "context.md").write_text("Type: SaaS\n")
+        for name in ("seo-audit", "page-cro"):
+            (self.audit / "agents" / f"{name}.md").write_text(f"# {name}\n\n## Score: 70/100\n")
+        self.review = self.audit / "review" / "cmo-review.md"
+        self.review.write_text("# CMO Review\n")
+
+    def set_mtime(self, path, seconds):
+        os.utime(path, (seconds, seconds))
+
+    def collect(self, vanished=()):
+        """collect_status() with the named files vanishing after being found."""
+        stat, exists = Path.stat, Path.exists
+
+        def vanishing_stat(path, *args, **kwargs):
+            if path.name in vanished:
+                raise FileNotFoundError(2, "No such file or directory", str(path))
+            return stat(path, *args, **kwargs)
+
+        def still_exists(path):
+            return path.name in vanished or exists(path)
+
+        with mock.patch.object(Path, "stat", vanishing_stat), mock.patch.object(Path, "exists", still_exists):
+            return dashboard.collect_status(self.audit, dashboard.ParseCache())
+
+    def test_phase_from_agent_and_review_times(self):
+        self.set_mtime(self.review, 2_000)
+        for report in (self.audit / "agents").iterdir():
+            self.set_mtime(report, 1_000)
+        self.assertEqual(self.collect()["phase"], "quality_gate")
+        self.set_mtime(self.audit / "agents" / "page-cro.md", 3_000)
+        self.assertEqual(self.collect()["phase"], "remediation")
+
+    def test_agent_report_replaced_during_refresh(self):
+        status = self.collect(vanished={"page-cro.md"})
+        self.assertEqual([agent["name"] for agent in status["agents"]], ["seo-audit"])
+        self.assertIn(status["phase"], ("quality_gate", "remediation"))
+
+    def test_review_replaced_during_refresh(self):
+        status = self.collect(vanished={"cmo-review.md"})
+        self.assertEqual(status["phase"], "batch1")
+
+    def test_report_replaced_during_refresh(self):
+        (self.audit / "FULL-REPORT.md").write_text("# Report\n")
+        self.assertEqual(self.collect()["report"]["size"], 9)
+        self.assertIsNone(self.collect(vanished={"FULL-REPORT.md"})["report"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""md_ast.py: the parsed tree, its renderers and AstCache."""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (puts the repository root on sys.path)
+import md_ast
+from md_ast import AstCache, content_digest, parse, parse_cached, render_html, to_html
+
+DOC = """# Audit *Summary*
+
+Intro with **bold**, `code` and [a link](https://example.com/a_b).
+Second line.
+
+- one
+- two **2**
+1. first
+
+| Area | Score |
+|------|------:|
+| SEO | 70 |
+after the table
+
+```py
+x = 1 < 2
+```
+---
+"""
+
+
+class ParseTest(unittest.TestCase):
+    def test_tree(self):
+        doc = parse(DOC)
+        self.assertEqual([node["type"] for node in doc], [
+            "heading", "paragraph", "list", "list", "table", "paragraph", "code", "hr",
+        ])
+        self.assertEqual(doc[0]["level"], 1)
+        self.assertEqual(md_ast.inline_text(doc[0]["inline"]), "Audit Summary")
+        self.assertEqual(doc[2]["ordered"], False)
+        self.assertEqual(doc[3]["ordered"], True)
+        self.assertEqual(doc[4]["header"], ["Area", "Score"])
+        self.assertEqual(doc[4]["rows"], [["SEO", "70"]])
+        self.assertEqual(doc[6], {"type": "code", "lang": "py", "lines": ["x = 1 < 2"]})
+
+    def test_inline_tokens(self):
+        tokens = md_ast.inline_tokens(parse("a **b** [c](d)")[0]["inline"])
+        self.assertEqual(tokens, ["a ", ["strong"], "b", ["/strong"], " ", ["a", "d"], "c", ["/a"]])
+
+    def test_control_characters_in_the_text(self):
+        self.assertEqual(render_html(parse("a\x03b\x0ec")), "<p>a�b�c</p>")
+
+    def test_exports(self):
+        doc = parse(DOC)
+        text = md_ast.render_text(doc)
+        self.assertIn("Audit Summary", text)
+        self.assertNotIn("**", text)
+        self.assertEqual(md_ast.render_outline(doc), "- Audit Summary\n  - one\n  - two 2\n  - first\n")
+        tree = json.loads(json.dumps(md_ast.token_tree(doc)))
+        self.assertEqual(tree[0]["inline"], ["Audit ", ["em"], "Summary", ["/em"]])
+
+
+class ToHtmlTest(unittest.TestCase):
+    """to_html() is the tree-free path and must render exactly like the tree."""
+
+    def assertSameHtml(self, text):
+        self.assertEqual(to_html(text), render_html(parse(text)))
+
+    def test_document(self):
+        self.assertSameHtml(DOC)
+
+    def test_edge_cases(self):
+        for text in [
+            "", "\n\n", "plain", "```", "```\nunterminated", "| a |\n# h\n| b |", "| a |\n```\nx\n```",
+            "- a\n| t |\n1. b", "---\n| a |\n---", "**a *b** c*", "[x](y*z*)", "\x01\x10", "#nohead\n3.nolist",
+        ]:
+            with self.subTest(text=text):
+                self.assertSameHtml(text)
+
+    def test_agent_reports(self):
+        for path in sorted(support.ROOT.glob("agents/*.md")):
+            with self.subTest(path=path.name):
+                self.assertSameHtml(path.read_text())
+
+
+class AstCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.cache = AstCache(self.dir / "ast")
+
+    def test_key(self):
+        digest = content_digest("# A")
+        self.assertEqual(self.cache.key(digest), AstCache(self.dir / "elsewhere").key(digest))
+        self.assertNotEqual(self.cache.key(digest), self.cache.key(content_digest("# B")))
+
+    def test_key_changes_with_the_parser(self):
+        key = self.cache.key("abc")
+        self.addCleanup(setattr, md_ast, "PARSER_VERSION", md_ast.PARSER_VERSION)
+        md_ast.PARSER_VERSION = "0" * 64
+        self.assertNotEqual(self.cache.key("abc"), key)
+
+    def test_round_trip(self):
+        doc = parse(DOC)
+        self.assertIsNone(self.cache.get(self.cache.key("abc")))
+        self.cache.put(self.cache.key("abc"), doc)
+        self.assertEqual(self.cache.get(self.cache.key("abc")), doc)
+
+    def test_parse_cached(self):
+        self.assertEqual(parse_cached(DOC, self.cache), parse(DOC))
+        key = self.cache.key(content_digest(DOC))
+        self.assertTrue((self.cache.dir / f"{key}.json").exists())
+        # A hit comes from the file, not from parsing again
+        self.cache.put(key, [{"type": "hr"}])
+        self.assertEqual(parse_cached(DOC, self.cache), [{"type": "hr"}])
+
+    def test_corrupt_entry_is_a_miss(self):
+        key = self.cache.key(content_digest(DOC))
+        self.cache.dir.mkdir(parents=True)
+        (self.cache.dir / f"{key}.json").write_text("{not json")
+        self.assertIsNone(self.cache.get(key))
+        self.assertEqual(parse_cached(DOC, self.cache), parse(DOC))
+
+    def test_prune(self):
+        keep, stale = self.cache.key("kept"), self.cache.key("stale")
+        self.cache.put(keep, [])
+        self.cache.put(stale, [])
+        self.cache.prune([keep])
+        self.assertEqual(self.cache.get(keep), [])
+        self.assertIsNone(self.cache.get(stale))
+
+    def test_prune_spares_another_processes_write_in_progress(self):
+        self.cache.dir.mkdir(parents=True)
+        key = self.cache.key("other process")
+        writing = self.cache.dir / f"{key}.tmp99999"
+        abandoned = self.cache.dir / f"{key}.tmp99998"
+        writing.write_text("[")
+        abandoned.write_text("[")
+        old = time.time() - md_ast.CACHE_TMP_MAX_AGE - 60
+        os.utime(abandoned, (old, old))
+        self.cache.prune([])
+        self.assertTrue(writing.exists())
+        self.assertFalse(abandoned.exists())
+
+    def test_missing_directory(self):
+        self.cache.prune([])
+        self.assertIsNone(self.cache.get(self.cache.key("x")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""md_to_html() must keep producing what the original converter produced.
+
+The expected HTML below, and fixtures/geo-audit.html, are the output of the
+converter as it was before it was optimized. The one intended difference is
+that a table now ends at the first line that is not a table row.
+"""
+
+import unittest
+
+from support import FIXTURES, ROOT, report_generator
+
+CASES = [
+    (
+        "# Title with **bold** and `code`",
+        '<h1 id="title-with-bold-and-code-code-code">Title with <strong>bold</strong> and <code>code</code></h1>',
+    ),
+    (
+        "Line one\nline two\n\nNext paragraph",
+        "<p>Line one line two</p>\n<p>Next paragraph</p>",
+    ),
+    (
+        "- a\n- b\n1. one\n2. two\n\ntext",
+        "<ul>\n<li>a</li>\n<li>b</li>\n</ul>\n<ol>\n<li>one</li>\n<li>two</li>\n</ol>\n<p>text</p>",
+    ),
+    (
+        "***both*** **bold** *em* `a*b*` [label](https://x.com/a_b)",
+        '<p><strong><em>both</em></strong> <strong>bold</strong> <em>em</em> <code>a<em>b</em></code> '
+        '<a href="https://x.com/a_b">label</a></p>',
+    ),
+    (
+        "**a *b** c*",
+        "<p><strong>a <em>b</strong> c</em></p>",
+    ),
+    (
+        "| A | B |\n|---|:-:|\n| `x` | **y** |\n\nafter",
+        '<div class="table-wrapper"><table>\n<thead><tr>\n<th>A</th>\n<th>B</th>\n</tr></thead><tbody>\n'
+        "<tr>\n<td><code>x</code></td>\n<td><strong>y</strong></td>\n</tr>\n</tbody></table></div>\n<p>after</p>",
+    ),
+    (
+        "```py\nif a < b & c > d:\n```\n---\n___",
+        '<pre><code class="language-py">\nif a &lt; b &amp; c &gt; d:\n</code></pre>\n<hr>\n<hr>',
+    ),
+    (
+        "[**bold link**](https://e.com/**x**)",
+        '<p><a href="https://e.com/<strong>x</strong>"><strong>bold link</strong></a></p>',
+    ),
+    (
+        "## 3. Über Café & Co",
+        '<h2 id="3-ber-caf-co">3. Über Café & Co</h2>',
+    ),
+]
+
+
+class MdToHtmlTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rg = report_generator()
+
+    def test_matches_original_converter(self):
+        for md, html in CASES:
+            with self.subTest(md=md):
+                self.assertEqual(self.rg.md_to_html(md), html)
+
+    def test_agent_document_matches_original_converter(self):
+        md = (ROOT / "agents" / "geo-audit.md").read_text()
+        expected = (FIXTURES / "geo-audit.html").read_text()
+        self.assertEqual(self.rg.md_to_html(md), expected)
+
+    def test_table_ends_at_first_non_row(self):
+        html = self.rg.md_to_html("| A |\n|---|\n| 1 |\n## Next")
+        self.assertEqual(
+            html,
+            '<div class="table-wrapper"><table>\n<thead><tr>\n<th>A</th>\n</tr></thead><tbody>\n'
+            '<tr>\n<td>1</td>\n</tr>\n</tbody></table></div>\n<h2 id="next">Next</h2>',
+        )
+
+    def test_many_matches_one_at_a_time(self):
+        texts = [md for md, _ in CASES] * 3
+        self.assertEqual(list(self.rg.md_to_html_many(texts, workers=1)), [self.rg.md_to_html(t) for t in texts])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""PdfWorker against a local stand-in renderer (fake_chrome.py)."""
+
+import os
+import shutil
+import socket
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import support  # noqa: F401  (puts the repository root on sys.path)
+import pdf_worker
+from pdf_worker import BrowserError, PdfError, PdfTimeout, PdfWorker
+
+FAKE_CHROME = str(Path(__file__).resolve().parent / "fake_chrome.py")
+
+
+class PdfWorkerTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.log = self.dir / "launches"
+        os.environ["FAKE_CHROME_LOG"] = str(self.log)
+        self.addCleanup(os.environ.pop, "FAKE_CHROME_LOG", None)
+
+    def worker(self, **kwargs):
+        worker = PdfWorker(FAKE_CHROME, startup_timeout=10, **kwargs)
+        self.addCleanup(worker.close)
+        return worker
+
+    def page(self, name, marker=""):
+        path = self.dir / f"{name}.html"
+        path.write_text(f"<html><body>{name}{marker}</body></html>")
+        return path
+
+    def launches(self):
+        return len(self.log.read_text().split()) if self.log.exists() else 0
+
+    def renderer_pid(self, pdf_path):
+        return Path(pdf_path).read_text().split("rendered by ")[1].split()[0]
+
+    def test_renders_jobs_with_one_browser(self):
+        worker = self.worker()
+        futures = [worker.submit(self.page(name)) for name in ("a", "b", "c")]
+        paths = [future.result(timeout=30) for future in futures]
+        self.assertEqual(paths, [str(self.dir / f"{name}.pdf") for name in ("a", "b", "c")])
+        for path in paths:
+            self.assertTrue(Path(path).read_text().startswith("%PDF-"))
+        self.assertEqual(len({self.renderer_pid(p) for p in paths}), 1)
+        self.assertEqual(self.launches(), 1)
+        self.assertGreaterEqual(futures[0].elapsed, 0)
+        self.assertEqual(worker.restarts, 0)
+
+    def test_explicit_output_path(self):
+        worker = self.worker()
+        out = self.dir / "out.pdf"
+        self.assertEqual(worker.render(self.page("a"), out), str(out))
+        self.assertTrue(out.exists())
+
+    def test_page_error_keeps_the_browser(self):
+        worker = self.worker()
+        with self.assertRaises(PdfError) as caught:
+            worker.render(self.dir / "missing.html")
+        self.assertNotIsInstance(caught.exception, PdfTimeout)
+        worker.render(self.page("a"))
+        self.assertEqual(self.launches(), 1)
+
+    def test_crash_is_retried_on_a_new_browser(self):
+        worker = self.worker()
+        pdf = worker.render(self.page("flaky", "<!-- fake:crash-once -->"))
+        self.assertTrue(Path(pdf).exists())
+        self.assertEqual(worker.restarts, 1)
+        self.assertEqual(self.launches(), 2)
+
+    def test_repeated_crash_fails_the_job_only(self):
+        worker = self.worker()
+        with self.assertRaises(BrowserError):
+            worker.render(self.page("broken", "<!-- fake:crash -->"))
+        self.assertEqual(self.launches(), 2)  # first try and one retry
+        self.assertTrue(Path(worker.render(self.page("a"))).exists())
+
+    def test_timeout_is_not_retried(self):
+        worker = self.worker()
+        start = time.monotonic()
+        with self.assertRaises(PdfTimeout):
+            worker.render(self.page("hang", "<!-- fake:hang -->"), timeout=0.5)
+        self.assertLess(time.monotonic() - start, 10)
+        self.assertEqual(self.launches(), 1)
+        self.assertEqual(worker.restarts, 1)
+        # The hung browser was replaced
+        worker.render(self.page("a"))
+        self.assertEqual(self.launches(), 2)
+
+    def test_browser_is_recycled(self):
+        worker = self.worker(recycle_after=2)
+        paths = [worker.render(self.page(f"p{i}")) for i in range(5)]
+        pids = [self.renderer_pid(p) for p in paths]
+        self.assertEqual(self.launches(), 3)
+        self.assertEqual(pids[0], pids[1])
+        self.assertEqual(pids[2], pids[3])
+        self.assertEqual(len(set(pids)), 3)
+        self.assertEqual(worker.restarts, 0)
+
+    def test_close_finishes_queued_jobs(self):
+        worker = self.worker()
+        futures = [worker.submit(self.page(f"p{i}")) for i in range(3)]
+        worker.close()
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertTrue(all(Path(future.result()).exists() for future in futures))
+
+    def test_submit_after_close(self):
+        worker = self.worker()
+        worker.close()
+        with self.assertRaises(RuntimeError):
+            worker.submit(self.page("a"))
+        worker.close()  # closing twice is fine
+
+
+class SendTimeout:
+    """A DevTools connection whose send buffer is full."""
+
+    def settimeout(self, timeout):
+        pass
+
+    def send(self, text):
+        raise socket.timeout("timed out")
+
+
+class BrowserCallTest(unittest.TestCase):
+    def test_send_timeout_is_a_timeout(self):
+        browser = pdf_worker.Browser.__new__(pdf_worker.Browser)
+        browser.ws = SendTimeout()
+        browser.next_id = 0
+        browser.events = []
+        with self.assertRaises(PdfTimeout):
+            browser.call("Page.printToPDF", deadline=time.monotonic() + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Batch mode of report-generator.py."""
+
+import argparse
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from support import report_generator
+
+
+def crashing_build(audit_dir, cache, exports):
+    """Stands in for _batch_build(): kills its process for "crash" directories."""
+    if "crash" in os.path.basename(audit_dir):
+        os._exit(1)
+    return {"audit_dir": audit_dir, "html": audit_dir + "/FULL-REPORT.html", "build": 0.0, "error": None}
+
+
+class BatchBuildsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rg = report_generator()
+
+    def setUp(self):
+        build = self.rg._batch_build
+        self.addCleanup(setattr, self.rg, "_batch_build", build)
+        self.rg._batch_build = crashing_build
+
+    def run_builds(self, names, jobs):
+        results = list(self.rg._batch_builds([f"/audits/{n}" for n in names], jobs, False, []))
+        return {os.path.basename(r["audit_dir"]): r["error"] for r in results}, len(results)
+
+    def test_dead_build_process_fails_only_its_directory(self):
+        names = [f"d{i}" for i in range(4)] + ["crash"] + [f"e{i}" for i in range(6)]
+        errors, count = self.run_builds(names, jobs=3)
+        self.assertEqual(count, len(names))
+        self.assertEqual(errors.pop("crash"), "build process died")
+        self.assertEqual(set(errors), set(names) - {"crash"})
+        self.assertFalse(any(errors.values()))
+
+    def test_several_dead_build_processes(self):
+        names = ["crash-1", "a", "b", "crash-2", "c", "crash-3"]
+        errors, count = self.run_builds(names, jobs=2)
+        self.assertEqual(count, len(names))
+        self.assertEqual(sorted(n for n, e in errors.items() if e), ["crash-1", "crash-2", "crash-3"])
+
+    def test_single_process(self):
+        errors, _ = self.run_builds(["a", "crash", "b"], jobs=1)
+        self.assertEqual(errors, {"a": None, "crash": "build process died", "b": None})
+
+
+class RunBatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rg = report_generator()
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def make_audit(self, domain):
+        d = self.root / f"marketing-audit-{domain}"
+        (d / "agents").mkdir(parents=True)
+        (d / "context.md").write_text(f"# Context\n- Business: {domain}\n- Type: SaaS\n")
+        (d / "agents" / "seo-audit.md").write_text("# SEO Audit\n\n## Score: 70/100\n\nFine.\n")
+        (d / "FULL-REPORT.md").write_text("# Marketing Audit\n\n## Executive Summary\n\nAll good.\n")
+        return str(d)
+
+    def test_missing_directory_does_not_stop_the_others(self):
+        dirs = [self.make_audit("a.com"), str(self.root / "marketing-audit-missing.com"), self.make_audit("b.com")]
+        args = argparse.Namespace(jobs=2, no_pdf=True, no_cache=True, export=["text"], pdf_timeout=60)
+        with redirect_stdout(io.StringIO()) as out:
+            status = self.rg.run_batch(dirs, args)
+        self.assertIn("directory not found", out.getvalue())
+        self.assertEqual(status, 1)
+        for d in (dirs[0], dirs[2]):
+            self.assertTrue(os.path.exists(os.path.join(d, "FULL-REPORT.html")))
+            self.assertTrue(os.path.exists(os.path.join(d, "FULL-REPORT.txt")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Chapter cache keys, storage and pruning in report-generator.py."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from support import report_generator
+
+
+class ChapterCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rg = report_generator()
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.cache = self.rg.ChapterCache(self.dir / "chapters")
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.cache.key("seo-audit", "PASS", "abc"), self.cache.key("seo-audit", "PASS", "abc"))
+        other = self.rg.ChapterCache(self.dir / "elsewhere")
+        self.assertEqual(self.cache.key("seo-audit", "abc"), other.key("seo-audit", "abc"))
+
+    def test_key_depends_on_every_input(self):
+        base = self.cache.key("seo-audit", "PASS", "abc")
+        self.assertNotEqual(base, self.cache.key("seo-audit", "FAIL", "abc"))
+        self.assertNotEqual(base, self.cache.key("seo-audit", "PASS", "abd"))
+        self.assertNotEqual(base, self.cache.key("page-cro", "PASS", "abc"))
+
+    def test_key_keeps_inputs_apart(self):
+        self.assertNotEqual(self.cache.key("ab", "c"), self.cache.key("a", "bc"))
+        self.assertNotEqual(self.cache.key("a", ""), self.cache.key("a"))
+
+    def test_key_changes_with_the_generator(self):
+        key = self.cache.key("seo-audit", "abc")
+        version = self.rg.GENERATOR_VERSION
+        self.addCleanup(setattr, self.rg, "GENERATOR_VERSION", version)
+        self.rg.GENERATOR_VERSION = "0" * 64
+        self.assertNotEqual(self.cache.key("seo-audit", "abc"), key)
+
+    def test_round_trip(self):
+        key = self.cache.key("seo-audit", "abc")
+        self.assertFalse(self.cache.has(key))
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, "<h2>SEO ✓</h2>")
+        self.assertTrue(self.cache.has(key))
+        self.assertEqual(self.cache.get(key), "<h2>SEO ✓</h2>")
+        self.assertEqual([p.name for p in self.cache.dir.iterdir()], [f"{key}.html"])
+
+    def test_prune_keeps_used_chapters(self):
+        keep, stale = self.cache.key("kept"), self.cache.key("stale")
+        self.cache.put(keep, "kept")
+        self.cache.put(stale, "stale")
+        self.cache.prune([keep])
+        self.assertTrue(self.cache.has(keep))
+        self.assertFalse(self.cache.has(stale))
+
+    def test_prune_spares_another_builds_write_in_progress(self):
+        self.cache.dir.mkdir(parents=True)
+        key = self.cache.key("other build")
+        writing = self.cache.dir / f"{key}.tmp99999"
+        abandoned = self.cache.dir / f"{key}.tmp99998"
+        writing.write_text("half")
+        abandoned.write_text("half")
+        old = time.time() - self.rg.CACHE_TMP_MAX_AGE - 60
+        os.utime(abandoned, (old, old))
+        self.cache.prune([])
+        self.assertTrue(writing.exists())
+        self.assertFalse(abandoned.exists())
+
+    def test_missing_directory(self):
+        self.cache.prune([])
+        self.assertIsNone(self.cache.get(self.cache.key("x")))
+
+
+class EditedReportTest(unittest.TestCase):
+    """A report edited between loading and rendering."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rg = report_generator()
+
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp()) / "marketing-audit-example.com"
+        self.addCleanup(shutil.rmtree, self.dir.parent)
+        (self.dir / "agents").mkdir(parents=True)
+        self.report = self.dir / "agents" / "seo-audit.md"
+        self.report.write_text("# SEO Audit\n\nOld findings.\n")
+
+    def edited_builder(self):
+        builder = self.rg.ReportBuilder(str(self.dir), workers=1)
+        builder.load()
+        self.report.write_text("# SEO Audit\n\nNew findings.\n")
+        return builder
+
+    def test_chapter_is_not_cached_under_the_old_digest(self):
+        builder = self.edited_builder()
+        self.assertIn("New findings.", "".join(builder._iter_agent_chapters()))
+        self.assertEqual(list(builder.cache.dir.glob("*.html")), [])
+        # Unedited, the chapter is cached as usual
+        builder = self.rg.ReportBuilder(str(self.dir), workers=1)
+        builder.load()
+        "".join(builder._iter_agent_chapters())
+        self.assertEqual(len(list(builder.cache.dir.glob("*.html"))), 1)
+
+    def test_tree_is_cached_under_the_text_it_came_from(self):
+        builder = self.edited_builder()
+        self.assertIn("New findings.", "".join(builder.iter_export("text")))
+        new = builder.ast_cache.key(self.rg.content_digest(self.report.read_text()))
+        old = builder.ast_cache.key(builder.agents[0]["digest"])
+        self.assertIsNotNone(builder.ast_cache.get(new))
+        self.assertIsNone(builder.ast_cache.get(old))
+
+
+if __name__ == "__main__":
+    unittest.main()